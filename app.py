@@ -7,9 +7,13 @@ import warnings
 import os
 import math
 import csv
+import heapq
+import threading
+from collections import defaultdict
 from pathlib import Path
 from datetime import datetime, date
 from contextlib import asynccontextmanager
+from itertools import chain, islice, repeat
 from typing import Optional
 from concurrent.futures import ThreadPoolExecutor
 
@@ -18,14 +22,15 @@ import numpy as np
 from fastapi import FastAPI, HTTPException, Query, Depends, status, BackgroundTasks, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import func, and_, extract
+from sqlalchemy import func, and_, extract, text, select, lambda_stmt
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from sqlalchemy.pool import QueuePool
 import geopandas as gpd
 from shapely.geometry import mapping
+from us import states as us_states
 import gzip
 import json
 
@@ -34,7 +39,7 @@ from db.database import SessionLocal
 from db.models import (
     DailyPM25, County, Population,
     YearlyPM25Summary, MonthlyPM25Summary, SeasonalPM25Summary,
-    ExcessMortalitySummary, ExceedanceSummary, DecompositionSummary
+    ExcessMortalitySummary, ExceedanceSummary, DecompositionSummary, SEASON
 )
 
 # Suppress warnings from GeoPandas
@@ -58,6 +63,49 @@ executor = ThreadPoolExecutor(max_workers=4)
 # Load county geometries once at startup
 COUNTY_GEOMETRIES = None
 
+# State boundary GeoJSON, serialized once (GZipMiddleware compresses responses)
+STATE_BOUNDARIES_GEOJSON = None
+
+# County lookups loaded once at startup: FIPS -> county name and
+# state FIPS prefix -> county FIPS codes
+FIPS_TO_NAME = None
+STATE_PREFIX_TO_FIPS = None
+
+# Age groups 1-18, with display names and approximate life expectancy (US
+# averages) for the download CSVs, indexed by age group (index 0 unused)
+AGE_GROUPS = range(1, 19)
+AGE_GROUP_NAMES = (
+    None, "0-4", "5-9", "10-14", "15-19", "20-24", "25-29", "30-34", "35-39",
+    "40-44", "45-49", "50-54", "55-59", "60-64", "65-69", "70-74",
+    "75-79", "80-84", "85+"
+)
+LIFE_EXPECTANCY_BY_AGE = (
+    None, 80.0, 75.0, 70.0, 65.0, 60.0, 55.0, 50.0, 45.0,
+    40.0, 35.0, 30.0, 25.0, 20.0, 15.0, 10.0, 7.0,
+    5.0, 3.0
+)
+
+# Daily downloads spanning at least this many years are fetched one year
+# per worker thread
+DAILY_SHARD_MIN_YEARS = 2
+# Own pool for daily shards, so they neither queue behind nor starve the shared
+# executor, and a download holds at most this many extra DB connections
+DAILY_SHARD_WORKERS = 3
+daily_shard_executor = ThreadPoolExecutor(max_workers=DAILY_SHARD_WORKERS)
+# Rows formatted per vectorized batch when streaming a daily download
+DAILY_FORMAT_BATCH = 10000
+
+# Download request log: a single append handle shared by all requests
+DOWNLOAD_LOG_PATH = Path("logs/download_requests.csv")
+DOWNLOAD_LOG_FIELDS = [
+    'timestamp', 'name', 'institution', 'email', 'usage_description',
+    'data_type', 'time_scale', 'start_year', 'end_year',
+    'counties', 'states', 'age_groups'
+]
+DOWNLOAD_LOG_LOCK = threading.Lock()
+download_log_file = None
+download_log_writer = None
+
 # Simple in-memory cache for choropleth data
 CHOROPLETH_CACHE = {}
 CACHE_MAX_SIZE = 500  # Maximum number of cached responses (increased from 100)
@@ -72,7 +120,7 @@ def load_county_geometries():
             shapefile_path = "data/shapefiles/county/cb_2018_us_county_5m.shp"
 
             # Read the shapefile
-            gdf = gpd.read_file(shapefile_path)
+            gdf = gpd.read_file(shapefile_path, engine="pyogrio")
 
             # Create a FIPS code column by combining state and county codes
             gdf['FIPS'] = gdf['STATEFP'] + gdf['COUNTYFP']
@@ -102,6 +150,58 @@ def load_county_geometries():
     return COUNTY_GEOMETRIES
 
 
+def load_county_lookups():
+    """Load the county name and per-state county FIPS lookups and cache them."""
+    global FIPS_TO_NAME, STATE_PREFIX_TO_FIPS
+    if FIPS_TO_NAME is None:
+        db = SessionLocal()
+        try:
+            fips_to_name = {}
+            state_county_map = defaultdict(list)
+            for fips, name in db.execute(text("SELECT fips, name FROM counties ORDER BY fips")):
+                fips_to_name[fips] = name
+                state_county_map[fips[:2]].append(fips)
+            STATE_PREFIX_TO_FIPS = dict(state_county_map)
+            FIPS_TO_NAME = fips_to_name
+
+            logger.info("Cached names for %d counties in %d states",
+                        len(FIPS_TO_NAME), len(STATE_PREFIX_TO_FIPS))
+        finally:
+            db.close()
+
+    return FIPS_TO_NAME
+
+
+def load_state_boundaries():
+    """Load state boundaries from the shapefile and cache the serialized GeoJSON."""
+    global STATE_BOUNDARIES_GEOJSON
+    if STATE_BOUNDARIES_GEOJSON is None:
+        shapefile_path = Path("data/shapefiles/state/cb_2024_us_state_5m.shp")
+        # Pre-projected copy of the shapefile, written by DataLoader.prepare_state_boundaries;
+        # ignored once the shapefile is newer than it
+        parquet_path = Path(
+            "data/shapefiles/state/cb_2024_us_state_5m_4326.parquet")
+
+        if parquet_path.exists() and (
+                not shapefile_path.exists()
+                or parquet_path.stat().st_mtime >= shapefile_path.stat().st_mtime):
+            gdf = gpd.read_parquet(parquet_path)
+        else:
+            gdf = gpd.read_file(
+                shapefile_path, engine="pyogrio").to_crs('EPSG:4326')
+            try:
+                gdf.to_parquet(parquet_path)
+            except Exception as e:
+                logger.warning("Could not write %s: %s", parquet_path, str(e))
+
+        STATE_BOUNDARIES_GEOJSON = gdf.to_json().encode()
+
+        logger.info("Cached state boundaries (%d bytes)",
+                    len(STATE_BOUNDARIES_GEOJSON))
+
+    return STATE_BOUNDARIES_GEOJSON
+
+
 def get_cache_key(endpoint: str, **params) -> str:
     """Generate a cache key for the given endpoint and parameters."""
     # Sort parameters to ensure consistent cache keys
@@ -322,6 +422,20 @@ async def lifespan(app: FastAPI):
     # Load county geometries
     load_county_geometries()
 
+    # Cache the county name and state lookups used by the downloads
+    try:
+        load_county_lookups()
+    except Exception as e:
+        logger.error("Error loading county lookups: %s",
+                     str(e), exc_info=True)
+
+    # Serialize state boundaries (retried on first request if this fails)
+    try:
+        load_state_boundaries()
+    except Exception as e:
+        logger.error("Error loading state boundaries: %s",
+                     str(e), exc_info=True)
+
     # Preload common choropleth datasets
     await preload_common_datasets()
 
@@ -330,6 +444,8 @@ async def lifespan(app: FastAPI):
     # Shutdown: Clean up resources
     logger.info("Shutting down...")
     executor.shutdown(wait=True)
+    daily_shard_executor.shutdown(wait=True)
+    close_download_log()
 
 # Initialize FastAPI app with lifespan
 app = FastAPI(
@@ -348,8 +464,9 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
-# Add GZip compression middleware
-app.add_middleware(GZipMiddleware, minimum_size=1000)
+# Add GZip compression middleware. Level 5 keeps most of the ratio on large
+# streamed CSV downloads at a fraction of the CPU cost of the default level 9.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 # Database session dependency
@@ -369,6 +486,30 @@ def get_db():
         db.close()
 
 # Helper functions
+def get_county(db: Session, fips: str):
+    """Fetch a single county by FIPS through a cached lambda statement."""
+    stmt = lambda_stmt(lambda: select(County).where(County.fips == fips))
+    return db.execute(stmt).scalar_one_or_none()
+
+
+def get_latest_decomposition(db: Session, fips: str, age_group_code: int):
+    """Fetch the latest decomposition row for a county and PM2.5 type code."""
+    stmt = lambda_stmt(lambda: select(DecompositionSummary).where(
+        DecompositionSummary.fips == fips,
+        DecompositionSummary.age_group == age_group_code
+    ).order_by(DecompositionSummary.end_year.desc()).limit(1))
+    return db.execute(stmt).scalar_one_or_none()
+
+
+
+
+def validate_season(season: str) -> str:
+    """Lowercased season name, or a 400 for anything outside the `season` enum"""
+    season = season.lower()
+    if season not in SEASON.enums:
+        raise HTTPException(
+            status_code=400, detail="Season must be winter, spring, summer, or fall")
+    return season
 
 
 def get_season_date_range(year: int, season: str):
@@ -423,7 +564,11 @@ def get_season_from_date(date_obj: date) -> str:
 # --- Helper Functions for Choropleth Endpoints ---
 
 
-def build_choropleth_query(db, time_scale, year, month, season, summary_model):
+def build_choropleth_query(db, time_scale, year, month, season, summary_model,
+                           include_geometry=False):
+    # County.geometry is GeoJSON rendered by PostGIS per row: only select it when the
+    # response carries geometry (build_geojson_features(include_geometry=True))
+    geometry = [County.geometry] if include_geometry else []
     if time_scale == "yearly":
         if not year:
             raise HTTPException(
@@ -431,7 +576,7 @@ def build_choropleth_query(db, time_scale, year, month, season, summary_model):
         query = db.query(
             summary_model.fips,
             County.name.label("county_name"),
-            County.geometry,
+            *geometry,
             summary_model.avg_total,
             summary_model.avg_fire,
             summary_model.avg_nonfire,
@@ -461,7 +606,7 @@ def build_choropleth_query(db, time_scale, year, month, season, summary_model):
         query = db.query(
             summary_model.fips,
             County.name.label("county_name"),
-            County.geometry,
+            *geometry,
             summary_model.avg_total,
             summary_model.avg_fire,
             summary_model.avg_nonfire,
@@ -489,10 +634,11 @@ def build_choropleth_query(db, time_scale, year, month, season, summary_model):
         if not year or not season:
             raise HTTPException(
                 status_code=400, detail="Year and season required for seasonal data")
+        season = validate_season(season)
         query = db.query(
             summary_model.fips,
             County.name.label("county_name"),
-            County.geometry,
+            *geometry,
             summary_model.avg_total,
             summary_model.avg_fire,
             summary_model.avg_nonfire,
@@ -513,7 +659,7 @@ def build_choropleth_query(db, time_scale, year, month, season, summary_model):
             )
         ).filter(
             summary_model.year == year,
-            summary_model.season == season.lower(),
+            summary_model.season == season,
             ~County.fips.startswith('72')
         )
     else:
@@ -627,7 +773,6 @@ async def get_choropleth_mortality(
         base_query = db.query(
             County.fips,
             County.name.label("county_name"),
-            County.geometry,
             ExcessMortalitySummary.total_excess,
             ExcessMortalitySummary.fire_excess,
             ExcessMortalitySummary.nonfire_excess,
@@ -663,7 +808,6 @@ async def get_choropleth_mortality(
             results = db.query(
                 County.fips,
                 County.name.label("county_name"),
-                County.geometry,
                 subq.c.total_excess,
                 subq.c.fire_excess,
                 subq.c.nonfire_excess,
@@ -686,7 +830,6 @@ async def get_choropleth_mortality(
             results = db.query(
                 County.fips,
                 County.name.label("county_name"),
-                County.geometry,
                 subq.c.total_excess,
                 subq.c.fire_excess,
                 subq.c.nonfire_excess,
@@ -934,7 +1077,6 @@ async def get_choropleth_population(
         query = db.query(
             County.fips,
             County.name.label("county_name"),
-            County.geometry,
             Population.population
         ).outerjoin(  # Use LEFT JOIN to include counties even if they don't have population data
             Population, and_(
@@ -1030,7 +1172,6 @@ async def get_choropleth_yll(
         results = db.query(
             County.fips,
             County.name.label("county_name"),
-            County.geometry,
             subq.c.yll_total,
             subq.c.yll_fire,
             subq.c.yll_nonfire,
@@ -1115,7 +1256,7 @@ def get_county_decomposition_info(
             detail="pm25_type must be 'total' or 'fire'"
         )
 
-    county = db.query(County).filter(County.fips == fips).first()
+    county = get_county(db, fips)
     if not county:
         raise HTTPException(status_code=404, detail="County not found")
 
@@ -1123,13 +1264,7 @@ def get_county_decomposition_info(
     age_group_code = -1 if pm25_type == "total" else -2
 
     # Query using age_group code instead of None
-    decomp = db.query(DecompositionSummary)\
-        .filter(
-            DecompositionSummary.fips == fips,
-            DecompositionSummary.age_group == age_group_code
-    )\
-        .order_by(DecompositionSummary.end_year.desc())\
-        .first()
+    decomp = get_latest_decomposition(db, fips, age_group_code)
 
     if not decomp:
         pm25_desc = "total PM2.5" if pm25_type == "total" else "fire PM2.5"
@@ -1186,7 +1321,7 @@ async def get_bar_chart_data(
     """
     try:
         # Validate county exists
-        county = db.query(County).filter(County.fips == fips).first()
+        county = get_county(db, fips)
         if not county:
             raise HTTPException(
                 status_code=404, detail=f"County with FIPS {fips} not found")
@@ -1309,10 +1444,7 @@ async def get_bar_chart_data(
 
             elif season:
                 # Get daily data for specific season
-                season = season.lower()
-                if season not in ['winter', 'spring', 'summer', 'fall']:
-                    raise HTTPException(
-                        status_code=400, detail="Season must be winter, spring, summer, or fall")
+                season = validate_season(season)
 
                 if season == 'winter':
                     # Winter: Dec 21 - Mar 20
@@ -1356,6 +1488,8 @@ async def get_bar_chart_data(
 
         return data
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Error in bar chart data: %s", str(e), exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1414,6 +1548,7 @@ async def get_county_statistics(
             if not year or not season:
                 raise HTTPException(
                     status_code=400, detail="Year and season required for seasonal statistics")
+            season = validate_season(season)
 
             stats = db.query(
                 func.avg(SeasonalPM25Summary.avg_total).label("mean_total"),
@@ -1429,7 +1564,7 @@ async def get_county_statistics(
                 func.count().label("county_count")
             ).filter(
                 SeasonalPM25Summary.year == year,
-                SeasonalPM25Summary.season == season.lower()
+                SeasonalPM25Summary.season == season
             ).first()
 
         return {
@@ -1449,6 +1584,8 @@ async def get_county_statistics(
             }
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error("Error in statistics: %s", str(e), exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -1557,7 +1694,6 @@ def get_exceedance_summary(db: Session = Depends(get_db)):
         results = db.query(
             County.fips,
             County.name,
-            County.geometry,
             ExceedanceSummary.threshold_8,
             ExceedanceSummary.threshold_9
         ).join(
@@ -1598,6 +1734,91 @@ def get_exceedance_summary(db: Session = Depends(get_db)):
 # Health check endpoint
 
 
+def format_decimal_column(values, precision=2):
+    """Format a column of nullable floats as fixed-point strings in one pass
+    ('' for None, and 'nan' for NaN as f"{value:.2f}" writes it)."""
+    missing = np.array([value is None for value in values], dtype=bool)
+    arr = np.array([np.nan if value is None else value for value in values], dtype=float)
+    formatted = np.char.mod(f"%.{precision}f", arr)
+    formatted[missing] = ""
+    return formatted
+
+
+def quote_csv_field(value):
+    """Quote a CSV field unconditionally ('""' for None); county names may contain commas."""
+    return '"' + ("" if value is None else str(value).replace('"', '""')) + '"'
+
+
+def stream_csv(headers, rows, flush_every=1000):
+    """Yield CSV text for the header and rows, joining flush_every rows per chunk.
+    Fields are written as given, so they must be strings, with any that may
+    contain a comma already quoted by quote_csv_field."""
+    lines = [",".join(headers)]
+    rows = iter(rows)
+    while True:
+        lines.extend(",".join(row) for row in islice(rows, flush_every))
+        if not lines:
+            return
+        yield "\n".join(lines) + "\n"
+        lines = []
+
+
+def build_daily_download_query(db, start_year, end_year, county_fips_list=None):
+    """Build the daily PM2.5 download query for a year range, ordered by county and date."""
+    query = db.query(
+        DailyPM25.fips,
+        DailyPM25.date,
+        DailyPM25.total,
+        DailyPM25.fire,
+        DailyPM25.nonfire
+    ).filter(
+        DailyPM25.date >= date(start_year, 1, 1),
+        DailyPM25.date < date(end_year + 1, 1, 1)
+    )
+
+    # Apply county/state filters
+    if county_fips_list is not None:
+        query = query.filter(DailyPM25.fips.in_(county_fips_list))
+
+    return query.order_by(DailyPM25.fips, DailyPM25.date)
+
+
+def export_snapshot(db):
+    """Start a REPEATABLE READ transaction on db and export its snapshot, so other
+    sessions can read the same data. It stays importable while db's transaction is open."""
+    db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    return db.execute(text("SELECT pg_export_snapshot()")).scalar()
+
+
+def fetch_daily_download_shard(year, county_fips_list=None, snapshot=None):
+    """Fetch one year of daily PM2.5 download rows on its own session,
+    reading from the exported snapshot when one is given."""
+    db = SessionLocal()
+    try:
+        if snapshot is not None:
+            db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+            db.execute(text("SET TRANSACTION SNAPSHOT :snapshot"), {"snapshot": snapshot})
+        return build_daily_download_query(db, year, year, county_fips_list).all()
+    finally:
+        db.close()
+
+
+def format_daily_rows(rows, fips_to_name):
+    """Format (fips, date, total, fire, nonfire) rows as CSV fields, a batch at a time."""
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, DAILY_FORMAT_BATCH))
+        if not batch:
+            return
+        columns = list(zip(*batch))
+        yield from zip(
+            columns[0],
+            [quote_csv_field(fips_to_name.get(fips)) for fips in columns[0]],
+            [d.strftime('%Y-%m-%d') for d in columns[1]],
+            *(format_decimal_column(col) for col in columns[2:5])
+        )
+
+
 @app.get("/api/download/pm25")
 def download_pm25_data(
     time_scale: str = Query(...,
@@ -1621,49 +1842,52 @@ def download_pm25_data(
 
         # Parse county and state filters
         county_fips_list = None
-        state_fips_prefix_list = None
 
         if counties and counties.lower() != 'all':
             county_fips_list = [c.strip() for c in counties.split(',')]
-
-        if states and states.lower() != 'all':
-            # Convert state names to FIPS prefixes (first 2 digits)
-            # We'll need to filter by FIPS prefix
-            state_names = [s.strip().lower() for s in states.split(',')]
-            # Get all counties and filter by state
-            all_counties = db.query(County).all()
-            state_fips_prefix_list = []
-            for county in all_counties:
-                # Extract state name from county name or use state FIPS prefix
-                # For now, we'll use FIPS prefix (first 2 digits)
-                if len(county.fips) >= 2:
-                    state_fips = county.fips[:2]
-                    if state_fips not in state_fips_prefix_list:
-                        state_fips_prefix_list.append(state_fips)
+        elif states and states.lower() != 'all':
+            # Expand state names to their county FIPS codes using the cached map
+            load_county_lookups()
+            county_fips_list = []
+            for state_name in states.split(','):
+                state = us_states.lookup(state_name.strip())
+                if state is None:
+                    raise HTTPException(
+                        status_code=400, detail=f"Unknown state: {state_name.strip()}")
+                county_fips_list.extend(STATE_PREFIX_TO_FIPS.get(state.fips, []))
 
         # Handle daily data separately
         if time_scale == "daily":
-            query = db.query(
-                County.fips,
-                County.name,
-                DailyPM25.date,
-                DailyPM25.total,
-                DailyPM25.fire,
-                DailyPM25.nonfire
-            ).join(
-                DailyPM25, County.fips == DailyPM25.fips
-            ).filter(
-                func.extract('year', DailyPM25.date) >= start_year,
-                func.extract('year', DailyPM25.date) <= end_year
-            )
+            if end_year - start_year + 1 >= DAILY_SHARD_MIN_YEARS:
+                # Fetch one year per worker on separate connections, all reading the
+                # snapshot of this request's transaction so a concurrent reload
+                # cannot mix old and new years. Every shard must have imported the
+                # snapshot before db closes, so wait for them here; the merge of the
+                # per-year (fips, date)-sorted shards is left lazy for the streamer
+                snapshot = export_snapshot(db)
+                shards = list(daily_shard_executor.map(
+                    fetch_daily_download_shard,
+                    range(start_year, end_year + 1),
+                    repeat(county_fips_list),
+                    repeat(snapshot)))
+                rows = heapq.merge(*shards, key=lambda row: (row.fips, row.date))
+            else:
+                rows = iter(build_daily_download_query(
+                    db, start_year, end_year, county_fips_list).all())
 
-            # Apply county/state filters
-            if county_fips_list:
-                query = query.filter(County.fips.in_(county_fips_list))
-            elif state_fips_prefix_list:
-                query = query.filter(func.substring(County.fips, 1, 2).in_(state_fips_prefix_list))
+            first_row = next(rows, None)
+            if first_row is None:
+                raise HTTPException(
+                    status_code=404, detail="No data found for the specified parameters")
 
-            query = query.order_by(County.fips, DailyPM25.date)
+            headers = ["County_FIPS", "County_Name", "Date", "Total_PM25", "Fire_PM25", "Nonfire_PM25"]
+            filename = f"pm25_data_{time_scale}_{start_year}_{end_year}.csv"
+            return StreamingResponse(
+                stream_csv(headers, format_daily_rows(
+                    chain((first_row,), rows), load_county_lookups())),
+                media_type="text/csv",
+                headers={"Content-Disposition": f"attachment; filename={filename}"}
+            )
 
         else:
             # Determine which summary table to use based on time scale
@@ -1682,8 +1906,7 @@ def download_pm25_data(
 
             # Query data with county information (excluding pop_weighted)
             query = db.query(
-                County.fips,
-                County.name,
+                summary_table.fips,
                 summary_table.year,
                 time_column,
                 summary_table.avg_total,
@@ -1693,34 +1916,25 @@ def download_pm25_data(
                 summary_table.max_fire,
                 summary_table.max_nonfire,
                 summary_table.days_count
-            ).join(
-                summary_table, County.fips == summary_table.fips
             ).filter(
                 summary_table.year >= start_year,
                 summary_table.year <= end_year
             )
 
             # Apply county/state filters
-            if county_fips_list:
-                query = query.filter(County.fips.in_(county_fips_list))
-            elif state_fips_prefix_list:
-                query = query.filter(func.substring(County.fips, 1, 2).in_(state_fips_prefix_list))
+            if county_fips_list is not None:
+                query = query.filter(summary_table.fips.in_(county_fips_list))
 
-            query = query.order_by(County.fips, summary_table.year, time_column)
+            query = query.order_by(summary_table.fips, summary_table.year, time_column)
 
-        results = query.all()
+            results = query.all()
 
         if not results:
             raise HTTPException(
                 status_code=404, detail="No data found for the specified parameters")
 
-        # Generate CSV content
-        csv_lines = []
-
         # CSV headers (excluding pop_weighted)
-        if time_scale == "daily":
-            headers = ["County_FIPS", "County_Name", "Date", "Total_PM25", "Fire_PM25", "Nonfire_PM25"]
-        elif time_scale == "yearly":
+        if time_scale == "yearly":
             headers = ["County_FIPS", "County_Name", "Year", "Avg_Total_PM25", "Avg_Fire_PM25", "Avg_Nonfire_PM25",
                        "Max_Total_PM25", "Max_Fire_PM25", "Max_Nonfire_PM25", "Days_Count"]
         elif time_scale == "monthly":
@@ -1730,70 +1944,27 @@ def download_pm25_data(
             headers = ["County_FIPS", "County_Name", "Year", "Season", "Avg_Total_PM25", "Avg_Fire_PM25", "Avg_Nonfire_PM25",
                        "Max_Total_PM25", "Max_Fire_PM25", "Max_Nonfire_PM25", "Days_Count"]
 
-        csv_lines.append(",".join(headers))
-
-        # CSV data rows
-        for row in results:
-            if time_scale == "daily":
-                csv_line = [
-                    row.fips,
-                    f'"{row.name}"',  # Quote county names to handle commas
-                    row.date.strftime('%Y-%m-%d'),
-                    f"{row.total:.2f}" if row.total is not None else "",
-                    f"{row.fire:.2f}" if row.fire is not None else "",
-                    f"{row.nonfire:.2f}" if row.nonfire is not None else ""
-                ]
-            elif time_scale == "yearly":
-                csv_line = [
-                    row.fips,
-                    f'"{row.name}"',  # Quote county names to handle commas
-                    str(row.year),
-                    f"{row.avg_total:.2f}" if row.avg_total is not None else "",
-                    f"{row.avg_fire:.2f}" if row.avg_fire is not None else "",
-                    f"{row.avg_nonfire:.2f}" if row.avg_nonfire is not None else "",
-                    f"{row.max_total:.2f}" if row.max_total is not None else "",
-                    f"{row.max_fire:.2f}" if row.max_fire is not None else "",
-                    f"{row.max_nonfire:.2f}" if row.max_nonfire is not None else "",
-                    str(row.days_count) if row.days_count is not None else ""
-                ]
-            elif time_scale == "monthly":
-                csv_line = [
-                    row.fips,
-                    f'"{row.name}"',
-                    str(row.year),
-                    str(row.month),
-                    f"{row.avg_total:.2f}" if row.avg_total is not None else "",
-                    f"{row.avg_fire:.2f}" if row.avg_fire is not None else "",
-                    f"{row.avg_nonfire:.2f}" if row.avg_nonfire is not None else "",
-                    f"{row.max_total:.2f}" if row.max_total is not None else "",
-                    f"{row.max_fire:.2f}" if row.max_fire is not None else "",
-                    f"{row.max_nonfire:.2f}" if row.max_nonfire is not None else "",
-                    str(row.days_count) if row.days_count is not None else ""
-                ]
-            else:  # seasonal
-                csv_line = [
-                    row.fips,
-                    f'"{row.name}"',
-                    str(row.year),
-                    str(row.season),
-                    f"{row.avg_total:.2f}" if row.avg_total is not None else "",
-                    f"{row.avg_fire:.2f}" if row.avg_fire is not None else "",
-                    f"{row.avg_nonfire:.2f}" if row.avg_nonfire is not None else "",
-                    f"{row.max_total:.2f}" if row.max_total is not None else "",
-                    f"{row.max_fire:.2f}" if row.max_fire is not None else "",
-                    f"{row.max_nonfire:.2f}" if row.max_nonfire is not None else "",
-                    str(row.days_count) if row.days_count is not None else ""
-                ]
-
-            csv_lines.append(",".join(csv_line))
-
-        csv_content = "\n".join(csv_lines)
+        # CSV data rows: format each numeric column in bulk instead of per row
+        columns = list(zip(*results))
+        # County names come from the cached lookup rather than a JOIN
+        fips_to_name = load_county_lookups()
+        names = [quote_csv_field(fips_to_name.get(fips)) for fips in columns[0]]
+        # Yearly queries select the year twice, so index the value
+        # columns from the end
+        time_fields = columns[1:2] if time_scale == "yearly" else columns[1:3]
+        fields = [
+            columns[0],
+            names,
+            *(map(str, col) for col in time_fields),
+            *(format_decimal_column(col) for col in columns[-7:-1]),
+            ["" if c is None else str(c) for c in columns[-1]]
+        ]
 
         # Return CSV response
         filename = f"pm25_data_{time_scale}_{start_year}_{end_year}.csv"
 
-        return Response(
-            content=csv_content,
+        return StreamingResponse(
+            stream_csv(headers, zip(*fields)),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -1836,16 +2007,13 @@ def download_mortality_data(
 
         # Build query
         query = db.query(
-            County.fips,
-            County.name,
+            ExcessMortalitySummary.fips,
             ExcessMortalitySummary.year,
             ExcessMortalitySummary.age_group,
             ExcessMortalitySummary.population,
             ExcessMortalitySummary.total_excess,
             ExcessMortalitySummary.fire_excess,
             ExcessMortalitySummary.nonfire_excess
-        ).join(
-            ExcessMortalitySummary, County.fips == ExcessMortalitySummary.fips
         ).filter(
             ExcessMortalitySummary.year >= start_year,
             ExcessMortalitySummary.year <= end_year
@@ -1858,7 +2026,7 @@ def download_mortality_data(
 
         # Order results
         query = query.order_by(
-            County.fips, ExcessMortalitySummary.year, ExcessMortalitySummary.age_group)
+            ExcessMortalitySummary.fips, ExcessMortalitySummary.year, ExcessMortalitySummary.age_group)
 
         results = query.all()
 
@@ -1866,46 +2034,33 @@ def download_mortality_data(
             raise HTTPException(
                 status_code=404, detail="No data found for the specified parameters")
 
-        # Generate CSV content
-        csv_lines = []
-
         # CSV headers
         headers = ["County_FIPS", "County_Name", "Year", "Age_Group", "Population", "Total_Excess_Mortality",
                    "Fire_Excess_Mortality", "Nonfire_Excess_Mortality"]
-        csv_lines.append(",".join(headers))
 
-        # Age group mapping for readable output
-        age_group_names = {
-            1: "0-4", 2: "5-9", 3: "10-14", 4: "15-19", 5: "20-24", 6: "25-29", 7: "30-34", 8: "35-39",
-            9: "40-44", 10: "45-49", 11: "50-54", 12: "55-59", 13: "60-64", 14: "65-69", 15: "70-74",
-            16: "75-79", 17: "80-84", 18: "85+"
-        }
+        # County names come from the cached lookup rather than a JOIN
+        fips_to_name = load_county_lookups()
 
         # CSV data rows
-        for row in results:
-            age_group_name = age_group_names.get(
-                row.age_group, f"Group_{row.age_group}")
-
-            csv_line = [
+        rows = (
+            (
                 row.fips,
-                f'"{row.name}"',  # Quote county names to handle commas
+                quote_csv_field(fips_to_name.get(row.fips)),
                 str(row.year),
-                age_group_name,
+                AGE_GROUP_NAMES[row.age_group] if row.age_group in AGE_GROUPS else f"Group_{row.age_group}",
                 str(row.population) if row.population is not None else "",
                 f"{row.total_excess:.3f}" if row.total_excess is not None else "",
                 f"{row.fire_excess:.3f}" if row.fire_excess is not None else "",
                 f"{row.nonfire_excess:.3f}" if row.nonfire_excess is not None else ""
-            ]
-
-            csv_lines.append(",".join(csv_line))
-
-        csv_content = "\n".join(csv_lines)
+            )
+            for row in results
+        )
 
         # Return CSV response
         filename = f"mortality_data_{start_year}_{end_year}.csv"
 
-        return Response(
-            content=csv_content,
+        return StreamingResponse(
+            stream_csv(headers, rows),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -1948,16 +2103,13 @@ def download_yll_data(
 
         # Build query - we'll calculate YLL from excess mortality and life expectancy
         query = db.query(
-            County.fips,
-            County.name,
+            ExcessMortalitySummary.fips,
             ExcessMortalitySummary.year,
             ExcessMortalitySummary.age_group,
             ExcessMortalitySummary.population,
             ExcessMortalitySummary.total_excess,
             ExcessMortalitySummary.fire_excess,
             ExcessMortalitySummary.nonfire_excess
-        ).join(
-            ExcessMortalitySummary, County.fips == ExcessMortalitySummary.fips
         ).filter(
             ExcessMortalitySummary.year >= start_year,
             ExcessMortalitySummary.year <= end_year
@@ -1970,7 +2122,7 @@ def download_yll_data(
 
         # Order results
         query = query.order_by(
-            County.fips, ExcessMortalitySummary.year, ExcessMortalitySummary.age_group)
+            ExcessMortalitySummary.fips, ExcessMortalitySummary.year, ExcessMortalitySummary.age_group)
 
         results = query.all()
 
@@ -1978,33 +2130,15 @@ def download_yll_data(
             raise HTTPException(
                 status_code=404, detail="No data found for the specified parameters")
 
-        # Generate CSV content
-        csv_lines = []
-
         # CSV headers
         headers = ["County_FIPS", "County_Name", "Year", "Age_Group", "Population",
                    "Total_YLL", "Fire_YLL", "Nonfire_YLL", "Life_Expectancy"]
-        csv_lines.append(",".join(headers))
 
-        # Age group mapping and life expectancy estimates
-        age_group_names = {
-            1: "0-4", 2: "5-9", 3: "10-14", 4: "15-19", 5: "20-24", 6: "25-29", 7: "30-34", 8: "35-39",
-            9: "40-44", 10: "45-49", 11: "50-54", 12: "55-59", 13: "60-64", 14: "65-69", 15: "70-74",
-            16: "75-79", 17: "80-84", 18: "85+"
-        }
+        # County names come from the cached lookup rather than a JOIN
+        fips_to_name = load_county_lookups()
 
-        # Approximate life expectancy by age group (US averages)
-        life_expectancy_by_age = {
-            1: 80.0, 2: 75.0, 3: 70.0, 4: 65.0, 5: 60.0, 6: 55.0, 7: 50.0, 8: 45.0,
-            9: 40.0, 10: 35.0, 11: 30.0, 12: 25.0, 13: 20.0, 14: 15.0, 15: 10.0, 16: 7.0,
-            17: 5.0, 18: 3.0
-        }
-
-        # CSV data rows
-        for row in results:
-            age_group_name = age_group_names.get(
-                row.age_group, f"Group_{row.age_group}")
-            life_expectancy = life_expectancy_by_age.get(row.age_group, 10.0)
+        def yll_row(row):
+            life_expectancy = LIFE_EXPECTANCY_BY_AGE[row.age_group] if row.age_group in AGE_GROUPS else 10.0
 
             # Calculate YLL (Years of Life Lost)
             total_yll = (
@@ -2014,27 +2148,23 @@ def download_yll_data(
             nonfire_yll = (
                 row.nonfire_excess * life_expectancy) if row.nonfire_excess is not None else 0.0
 
-            csv_line = [
+            return (
                 row.fips,
-                f'"{row.name}"',  # Quote county names to handle commas
+                quote_csv_field(fips_to_name.get(row.fips)),
                 str(row.year),
-                age_group_name,
+                AGE_GROUP_NAMES[row.age_group] if row.age_group in AGE_GROUPS else f"Group_{row.age_group}",
                 str(row.population) if row.population is not None else "",
-                f"{total_yll:.1f}" if total_yll is not None else "",
-                f"{fire_yll:.1f}" if fire_yll is not None else "",
-                f"{nonfire_yll:.1f}" if nonfire_yll is not None else "",
+                f"{total_yll:.1f}",
+                f"{fire_yll:.1f}",
+                f"{nonfire_yll:.1f}",
                 f"{life_expectancy:.1f}"
-            ]
-
-            csv_lines.append(",".join(csv_line))
-
-        csv_content = "\n".join(csv_lines)
+            )
 
         # Return CSV response
         filename = f"yll_data_{start_year}_{end_year}.csv"
 
-        return Response(
-            content=csv_content,
+        return StreamingResponse(
+            stream_csv(headers, map(yll_row, results)),
             media_type="text/csv",
             headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
@@ -2051,16 +2181,11 @@ def download_yll_data(
 async def get_state_boundaries():
     """Get state boundaries as GeoJSON for map outlines."""
     try:
-        # Load state shapefile
-        shapefile_path = "data/shapefiles/state/cb_2024_us_state_5m.shp"
-        gdf = gpd.read_file(shapefile_path)
-
-        # Convert to GeoJSON
-        geojson = gdf.to_crs('EPSG:4326').to_json()
-
+        # Compression (and Accept-Encoding negotiation) is left to GZipMiddleware
         return Response(
-            content=geojson,
-            media_type="application/json"
+            content=load_state_boundaries(),
+            media_type="application/json",
+            headers={"Cache-Control": "public, max-age=86400"}
         )
     except Exception as e:
         logger.error("Error loading state boundaries: %s",
@@ -2069,44 +2194,73 @@ async def get_state_boundaries():
             status_code=500, detail="Error loading state boundaries")
 
 
+def open_download_log():
+    """Open the download request log for appending, writing the header if it is new.
+    Callers must hold DOWNLOAD_LOG_LOCK."""
+    global download_log_file, download_log_writer
+    if download_log_file is None:
+        # Create logs directory if it doesn't exist
+        DOWNLOAD_LOG_PATH.parent.mkdir(exist_ok=True)
+        is_new = not DOWNLOAD_LOG_PATH.exists() or DOWNLOAD_LOG_PATH.stat().st_size == 0
+
+        download_log_file = open(
+            DOWNLOAD_LOG_PATH, 'a', newline='', encoding='utf-8')
+        download_log_writer = csv.DictWriter(
+            download_log_file, fieldnames=DOWNLOAD_LOG_FIELDS)
+
+        # Write header if file is new
+        if is_new:
+            download_log_writer.writeheader()
+            download_log_file.flush()
+
+    return download_log_writer
+
+
+def iter_file_prefix(path: Path, size: int, chunk_size: int = 64 * 1024):
+    """Yield exactly the first `size` bytes of a file, in chunks."""
+    with open(path, 'rb') as f:
+        remaining = size
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def close_download_log():
+    """Close the shared download request log handle."""
+    global download_log_file, download_log_writer
+    with DOWNLOAD_LOG_LOCK:
+        if download_log_file is not None:
+            download_log_file.close()
+            download_log_file = None
+            download_log_writer = None
+
+
 def log_download_request_to_csv(request: DownloadRequest):
     """Log download request to a CSV file."""
     try:
-        # Create logs directory if it doesn't exist
-        log_dir = Path("logs")
-        log_dir.mkdir(exist_ok=True)
-
-        csv_file = log_dir / "download_requests.csv"
-        file_exists = csv_file.exists()
-
-        # Append to CSV file
-        with open(csv_file, 'a', newline='', encoding='utf-8') as f:
-            fieldnames = [
-                'timestamp', 'name', 'institution', 'email', 'usage_description',
-                'data_type', 'time_scale', 'start_year', 'end_year',
-                'counties', 'states', 'age_groups'
-            ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-
-            # Write header if file is new
-            if not file_exists:
-                writer.writeheader()
-
-            # Write the request
-            writer.writerow({
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'name': request.name,
-                'institution': request.institution,
-                'email': request.email,
-                'usage_description': request.usage_description,
-                'data_type': request.data_type,
-                'time_scale': request.time_scale,
-                'start_year': request.start_year,
-                'end_year': request.end_year,
-                'counties': request.counties or 'All',
-                'states': request.states or 'All',
-                'age_groups': request.age_groups or 'All'
-            })
+        row = {
+            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'name': request.name,
+            'institution': request.institution,
+            'email': request.email,
+            'usage_description': request.usage_description,
+            'data_type': request.data_type,
+            'time_scale': request.time_scale,
+            'start_year': request.start_year,
+            'end_year': request.end_year,
+            'counties': request.counties or 'All',
+            'states': request.states or 'All',
+            'age_groups': request.age_groups or 'All'
+        }
+
+        # Background tasks run in the thread pool, so serialize writes
+        with DOWNLOAD_LOG_LOCK:
+            writer = open_download_log()
+            writer.writerow(row)
+            download_log_file.flush()
 
         logger.info(f"Download request logged to CSV: {request.email}")
 
@@ -2114,8 +2268,6 @@ def log_download_request_to_csv(request: DownloadRequest):
         logger.error(f"Failed to log download request to CSV: {str(e)}")
 
 
-
-
 @app.post("/api/download/request")
 async def submit_download_request(request: DownloadRequest, background_tasks: BackgroundTasks):
     """
@@ -2169,26 +2321,26 @@ async def export_download_requests(api_key: str = Query(..., description="Admin
                 detail="Invalid API key"
             )
 
-        csv_file = Path("logs/download_requests.csv")
-
-        if not csv_file.exists():
-            raise HTTPException(
-                status_code=404,
-                detail="No download requests logged yet"
-            )
-
-        # Read the CSV file
-        with open(csv_file, 'r', encoding='utf-8') as f:
-            csv_content = f.read()
+        # Take the size under the writers' lock, where every written row has been
+        # flushed; the log is append-only, so those bytes stay fixed while they stream
+        with DOWNLOAD_LOG_LOCK:
+            if not DOWNLOAD_LOG_PATH.exists():
+                raise HTTPException(
+                    status_code=404,
+                    detail="No download requests logged yet"
+                )
+            size = DOWNLOAD_LOG_PATH.stat().st_size
 
         logger.info("Download requests exported successfully")
 
-        # Return as downloadable CSV
-        return Response(
-            content=csv_content,
+        filename = f"download_requests_{datetime.now().strftime('%Y%m%d')}.csv"
+        # A sync iterator, so Starlette reads the file in its thread pool, not on the event loop
+        return StreamingResponse(
+            iter_file_prefix(DOWNLOAD_LOG_PATH, size),
             media_type="text/csv",
             headers={
-                "Content-Disposition": f"attachment; filename=download_requests_{datetime.now().strftime('%Y%m%d')}.csv"
+                "Content-Disposition": f'attachment; filename="{filename}"',
+                "Content-Length": str(size),
             }
         )
 
@@ -1,4 +1,5 @@
 import os
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.pool import QueuePool
@@ -18,6 +19,11 @@ engine = create_engine(
     max_overflow=20,  # Additional connections that can be created on demand
     pool_pre_ping=True,  # Verify connections before use
     pool_recycle=3600,  # Recycle connections after 1 hour
+    executemany_mode='values_plus_batch',  # psycopg2 fast executemany path
+    insertmanyvalues_page_size=10000,  # Rows per multi-row INSERT page
+    query_cache_size=1200,  # Keep every hot per-county statement shape compiled
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),  # JSONB (county geometry) encode
+    json_deserializer=orjson.loads,  # JSONB decode, registered on the psycopg2 connection
     echo=False  # Set to True for SQL query logging
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -1,7 +1,9 @@
 import sys
 import csv
 from sqlalchemy.orm import Session
-from sqlalchemy import asc
+from sqlalchemy import asc, inspect
+from sqlalchemy.orm import ColumnProperty, SynonymProperty
+from geoalchemy2 import Geometry
 from db.models import (
     County, DailyPM25, Population,
     YearlyPM25Summary, MonthlyPM25Summary, SeasonalPM25Summary,
@@ -30,15 +32,31 @@ MODEL_MAP = {
 
 SORT_COLUMNS = ["fips", "year", "age_group"]
 
+def export_columns(model_class):
+    """Exported attribute names: every mapped column, including derived column_property
+    values and synonyms (e.g. the legacy excess mortality and YLL attributes, and county
+    geometry as GeoJSON)"""
+    mapper = inspect(model_class)
+    # Table columns first, in table order, then the derived attributes. PostGIS columns
+    # are skipped: their GeoJSON form is exported instead (County.geometry)
+    columns = [mapper.get_property_by_column(col).key for col in model_class.__table__.columns]
+    spatial = [mapper.get_property_by_column(col).key for col in model_class.__table__.columns
+               if isinstance(col.type, Geometry)]
+    return [col for col in columns if col not in spatial] + [
+        attr.key for attr in mapper.attrs
+        if isinstance(attr, (ColumnProperty, SynonymProperty))
+        and attr.key not in columns]
+
 def export_model_to_csv(model_class, output_csv):
     session: Session = SessionLocal()
     try:
-        columns = model_class.__table__.columns.keys()
+        columns = export_columns(model_class)
 
         # Determine which of fips, year, age_group exist in the model
         sort_fields = [getattr(model_class, col) for col in SORT_COLUMNS if col in columns]
 
-        query = session.query(model_class)
+        # Select the attributes themselves, so deferred ones load in the same query
+        query = session.query(*[getattr(model_class, col) for col in columns])
         if sort_fields:
             query = query.order_by(*[asc(f) for f in sort_fields])
 
@@ -50,8 +68,7 @@ def export_model_to_csv(model_class, output_csv):
         with open(output_csv, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(columns)
-            for obj in rows:
-                writer.writerow([getattr(obj, col) for col in columns])
+            writer.writerows(rows)
 
         print(f"Exported {len(rows)} rows from '{model_class.__tablename__}' to '{output_csv}'")
 
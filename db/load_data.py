@@ -1,28 +1,36 @@
-import json
+import io
 import logging
-import math
 import os
 import sys
 import time
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
-import geopandas as gpd
 import numpy as np
+import geopandas as gpd
 import pandas as pd
+import pyarrow as pa
+import pyogrio
+import shapely
 from census import Census
-from sqlalchemy import func, text
-from sqlalchemy.orm import Session, load_only
+from psycopg2.extras import execute_values
+from pyarrow import csv as pa_csv
+from pyogrio.raw import read_arrow
+from pyproj import CRS, Transformer
+from sqlalchemy import Float, case, cast, func, insert, literal_column, or_, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
 from us import states
 
 # Import models and database
 from .models import (
-    Base, County, DailyPM25, Population,
+    Base, County, DailyPM25, StageDailyPM25, Population,
     YearlyPM25Summary, MonthlyPM25Summary, SeasonalPM25Summary,
-    BaselineMortalityRate, ExcessMortalitySummary, ExceedanceSummary,
-    DecompositionSummary, FireAttributionBin
+    BaselineMortalityRate, CDCBaselineMortalityRate, ExcessMortalitySummary, ExcessMortalitySettings, ExceedanceSummary,
+    DecompositionSummary, FireAttributionBin, SEASON
 )
 from .database import engine, SessionLocal
 
@@ -36,6 +44,325 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Concurrent Census API requests in load_population_data_api (IO-bound)
+CENSUS_API_WORKERS = 16
+
+# Threads for the excess mortality GEMM math (NumPy releases the GIL in ufuncs)
+EXCESS_MORTALITY_WORKERS = os.cpu_count() or 4
+
+# Age group mapping: group index -> [male_var, female_var, ...]
+ACS_AGE_VARIABLES = {
+    # 0–4 years
+    1:  ['B01001_003E', 'B01001_027E'],
+    # 5–9 years
+    2:  ['B01001_004E', 'B01001_028E'],
+    # 10–14 years
+    3:  ['B01001_005E', 'B01001_029E'],
+    # 15–19 years
+    4:  ['B01001_006E', 'B01001_007E', 'B01001_030E', 'B01001_031E'],
+    5:  ['B01001_008E', 'B01001_009E', 'B01001_010E',
+         'B01001_032E', 'B01001_033E', 'B01001_034E'],                 # 20–24 years
+    # 25–29 years
+    6:  ['B01001_011E', 'B01001_035E'],
+    # 30–34 years
+    7:  ['B01001_012E', 'B01001_036E'],
+    # 35–39 years
+    8:  ['B01001_013E', 'B01001_037E'],
+    # 40–44 years
+    9:  ['B01001_014E', 'B01001_038E'],
+    # 45–49 years
+    10: ['B01001_015E', 'B01001_039E'],
+    # 50–54 years
+    11: ['B01001_016E', 'B01001_040E'],
+    # 55–59 years
+    12: ['B01001_017E', 'B01001_041E'],
+    # 60–64 years
+    13: ['B01001_018E', 'B01001_019E', 'B01001_042E', 'B01001_043E'],
+    # 65–69 years
+    14: ['B01001_020E', 'B01001_021E', 'B01001_044E', 'B01001_045E'],
+    # 70–74 years
+    15: ['B01001_022E', 'B01001_046E'],
+    # 75–79 years
+    16: ['B01001_023E', 'B01001_047E'],
+    # 80–84 years
+    17: ['B01001_024E', 'B01001_048E'],
+    # 85+ years
+    18: ['B01001_025E', 'B01001_049E'],
+}
+
+# Every ACS variable requested per state (age groups + total population)
+ACS_TOTAL_VARIABLE = 'B01001_001E'
+FLAT_VARS = [v for var_list in ACS_AGE_VARIABLES.values()
+             for v in var_list] + [ACS_TOTAL_VARIABLE]
+
+# daily_county_data_combined CSV column -> daily_pm25 column
+PM25_CSV_COLUMNS = {
+    'FIPS': 'fips',
+    'county_index': 'county_index',
+    'date': 'date',
+    'total_value': 'total',
+    'fire_pm25': 'fire',
+    'nonfire_pm25': 'nonfire',
+}
+
+# County geometry precision grid and simplification tolerance (degrees, WGS84)
+COUNTY_GRID_SIZE = 1e-4
+COUNTY_SIMPLIFY_TOLERANCE = 0.005
+
+# SQL turning a hex WKB parameter/column into the counties.geom MultiPolygon (WGS84)
+COUNTY_GEOM_FROM_WKB = "ST_Multi(ST_SetSRID({}::geometry, 4326))"
+
+# State boundary shapefile and its WGS84 GeoParquet copy, which app.py serves from
+STATE_SHAPEFILE = "data/shapefiles/state/cb_2024_us_state_5m.shp"
+STATE_BOUNDARIES_PARQUET = "data/shapefiles/state/cb_2024_us_state_5m_4326.parquet"
+
+# Narrow Arrow types for the daily PM2.5 CSV: halves chunk memory versus float64/int64
+PM25_CSV_TYPES = {
+    'FIPS': pa.string(),
+    'county_index': pa.int32(),
+    'Year': pa.int16(),
+    'Month': pa.int8(),
+    'Day': pa.int8(),
+    'total_value': pa.float32(),
+    'fire_pm25': pa.float32(),
+}
+# Approximate CSV bytes per daily PM2.5 row, used to size Arrow read blocks
+PM25_CSV_ROW_BYTES = 64
+
+# Insert column order for baseline_mortality_rate row tuples
+BASELINE_MORTALITY_COLUMNS = (
+    'fips', 'county_index', 'year', 'age_group',
+    'stat_type', 'value', 'source', 'allage_flag',
+)
+
+# Insert column order for excess_mortality_summary row tuples
+EXCESS_MORTALITY_COLUMNS = (
+    'fips', 'year', 'age_group', 'population',
+    'total_gemm', 'fire_gemm', 'nonfire_gemm',
+    'total_boot', 'fire_boot',
+    'total_prec', 'fire_prec',
+)
+
+# Stored legacy excess_mortality_summary columns now derived from the per-method
+# columns and excess_mortality_settings (dropped by migrate_excess_mortality)
+EXCESS_MORTALITY_DROPPED_COLUMNS = (
+    'total_excess', 'fire_excess', 'nonfire_excess',
+    'yll_total', 'yll_fire', 'yll_nonfire',
+    # Per-method YLL, derived from the excess deaths and LIFE_EXPECTANCY
+    'yll_total_gemm', 'yll_fire_gemm', 'yll_nonfire_gemm',
+    'yll_total_boot', 'yll_fire_boot',
+    'yll_total_prec', 'yll_fire_prec',
+)
+
+# Insert column order for decomposition_summary row tuples
+DECOMPOSITION_COLUMNS = (
+    'fips', 'start_year', 'end_year', 'age_group',
+    'population_growth', 'population_ageing', 'baseline_mortality_change',
+    'exposure_change', 'total_change',
+)
+
+# daily_pm25 indexes built by create_indexes (dropped before a bulk PM2.5 load)
+PM25_QUERY_INDEXES = [
+    'idx_daily_pm25_date_fips',
+    'idx_daily_pm25_fips_date_covering',
+    'idx_daily_pm25_year_fips',
+    'idx_daily_pm25_year_month_fips',
+    'idx_daily_pm25_total_missing',
+    'idx_daily_pm25_fire_missing',
+    'idx_daily_pm25_nonfire_missing',
+]
+
+# Season of each month, joined into the seasonal summary rather than a CASE per row
+SEASON_JOIN = """
+    JOIN (VALUES
+        (12, 'winter'), (1, 'winter'), (2, 'winter'),
+        (3, 'spring'), (4, 'spring'), (5, 'spring'),
+        (6, 'summer'), (7, 'summer'), (8, 'summer'),
+        (9, 'fall'), (10, 'fall'), (11, 'fall')
+    ) AS s(month, season) ON s.month = daily_pm25.month"""
+
+
+def summary_view_sql(period_column=None, period_expr=None, period_join=""):
+    """SELECT behind a PM2.5 summary materialized view: daily_pm25 aggregated per
+    county-year (and period), weighted by the county-year total population (age_group=0)"""
+    period_select = f", d.{period_column}" if period_column else ""
+    period_inner = f", {period_expr} AS {period_column}" if period_column else ""
+    period_group = f", {period_expr}" if period_column else ""
+    return f"""
+        SELECT
+            d.fips, d.year{period_select},
+            d.avg_total, d.avg_fire, d.avg_nonfire,
+            d.max_total, d.max_fire, d.max_nonfire,
+            d.days_count,
+            (COALESCE(d.avg_total, 0) * COALESCE(p.population, 0))::real AS pop_weighted_total,
+            (COALESCE(d.avg_fire, 0) * COALESCE(p.population, 0))::real AS pop_weighted_fire,
+            (COALESCE(d.avg_nonfire, 0) * COALESCE(p.population, 0))::real AS pop_weighted_nonfire
+        FROM (
+            SELECT
+                fips,
+                year::int AS year{period_inner},
+                AVG(total) AS avg_total,
+                AVG(fire) AS avg_fire,
+                AVG(nonfire) AS avg_nonfire,
+                MAX(total) AS max_total,
+                MAX(fire) AS max_fire,
+                MAX(nonfire) AS max_nonfire,
+                COUNT(*)::int AS days_count
+            FROM daily_pm25 {period_join}
+            GROUP BY fips, daily_pm25.year{period_group}
+        ) d
+        LEFT JOIN population p
+            ON p.fips = d.fips AND p.year = d.year AND p.age_group = 0
+    """
+
+
+# Summary model -> defining query of its materialized view
+SUMMARY_VIEWS = {
+    YearlyPM25Summary: summary_view_sql(),
+    MonthlyPM25Summary: summary_view_sql('month', "month::int"),
+    SeasonalPM25Summary: summary_view_sql('season', f"s.season::{SEASON.name}", SEASON_JOIN),
+}
+
+# Parallel workers PostgreSQL may use for each summary refresh's aggregate scan
+REFRESH_PARALLEL_WORKERS = 8
+
+# GEMM shape parameters (Burnett et al. 2018, NCD+LRI)
+GEMM_ALPHA = 1.6
+GEMM_MU = 15.5
+GEMM_NU = 36.8
+
+# omega tabulated at integer z over the PM2.5 range; interpolated between nodes
+GEMM_OMEGA_GRID = np.arange(0, 201, dtype=np.float64)
+GEMM_OMEGA_TABLE = 1 / (1 + np.exp(-(GEMM_OMEGA_GRID - GEMM_MU) / GEMM_NU))
+
+
+def gemm_omega(z):
+    """GEMM omega(z); closed form only above the tabulated range"""
+    out = np.interp(z, GEMM_OMEGA_GRID, GEMM_OMEGA_TABLE)
+    high = z > GEMM_OMEGA_GRID[-1]
+    out[high] = 1 / (1 + np.exp(-(z[high] - GEMM_MU) / GEMM_NU))
+    return out
+
+
+def gemm_log_shape(z):
+    """log(HR) / theta = log(1 + z/alpha) * omega(z); depends on z only"""
+    shape = gemm_omega(z)
+    shape *= np.log1p(z / GEMM_ALPHA)
+    return shape
+
+
+def gemm_excess(base, shape, theta, applies):
+    """Array GEMM kernel: base * (1 - 1/HR) with HR = exp(theta * shape), shape from gemm_log_shape(z),
+    HR = 1 where `applies` is False or log(HR) is not finite.
+    1 - 1/HR is evaluated as -expm1(-log HR), exact for small HR - 1, in one in-place buffer."""
+    af = shape * theta
+    af[~applies | ~np.isfinite(af)] = 0.0
+    np.negative(af, out=af)
+    np.expm1(af, out=af)
+    np.negative(af, out=af)
+    af *= base
+    return af
+
+
+def decompose(pop_start, pop_end, y0_start, y0_end, AF_start, AF_end):
+    """Decompose the change in attributable deaths between two years into population
+    growth, ageing, baseline mortality and exposure contributions (percent of the change),
+    plus the total change (percent of the start burden).
+    Inputs are (n_counties, n_age) arrays with absent age groups zeroed; returns
+    (n_counties,) arrays."""
+    total_pop_start = pop_start.sum(axis=-1, keepdims=True)
+    total_pop_end = pop_end.sum(axis=-1, keepdims=True)
+    age_shares_start = pop_start / total_pop_start
+    pop_A = age_shares_start * total_pop_end
+
+    # One stacked multiply-and-reduce for the burden at each step:
+    # row 0: start burden (2006 pop, 2006 mortality, 2006 exposure)
+    # Step A: Population growth (2023 total pop, 2006 age structure, 2006 mortality, 2006 exposure)
+    # Step B: Population aging (2023 pop structure, 2006 mortality, 2006 exposure)
+    # Step C: Mortality change (2023 pop structure, 2023 mortality, 2006 exposure)
+    # Step D: Exposure change (2023 pop structure, 2023 mortality, 2023 exposure)
+    W = np.stack([pop_start, pop_A, pop_end, pop_end, pop_end])
+    Y = np.stack([y0_start, y0_start, y0_start, y0_end, y0_end])
+    F = np.stack([AF_start, AF_start, AF_start, AF_start, AF_end])
+    total_burden_start, A, B, C, D = (W * Y * F).sum(axis=-1)
+
+    # calculate changes and contributions (0 where the denominator is 0)
+    total_change = D - total_burden_start
+    changed = total_change != 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pop_growth = np.where(changed, (A - total_burden_start) / total_change * 100, 0.0)
+        ageing = np.where(changed, (B - A) / total_change * 100, 0.0)
+        mortality = np.where(changed, (C - B) / total_change * 100, 0.0)
+        exposure = np.where(changed, (D - C) / total_change * 100, 0.0)
+        total_change = np.where(total_burden_start != 0,
+                                total_change / total_burden_start * 100, 0.0)
+    return pop_growth, ageing, mortality, exposure, total_change
+
+def load_fire_bins(session):
+    """Read fire_attribution_bin once into dense arrays for vectorized lookups.
+
+    Returns (boot_ages, boot_lowers, boot_uppers, coef, prec_bins):
+    - coef[age_idx, bin_idx, bootid - 1] (float32, NaN where missing) holds the bootstrap
+      HR coefficients, with boot_ages (sorted labels) indexing the first axis and the
+      sorted bin edges boot_lowers/boot_uppers the second
+    - prec_bins maps each precomputed-AF age group to its (lowers, uppers, af) arrays,
+      sorted by bin so find_bins can binary-search a PM2.5 value into them
+    """
+    boot_df = pd.DataFrame(session.execute(select(
+        FireAttributionBin.age_group, FireAttributionBin.bin_lower,
+        FireAttributionBin.bin_upper, FireAttributionBin.bootid,
+        FireAttributionBin.coef
+    ).where(
+        FireAttributionBin.method == "bootstrapped_bin_hr",
+        FireAttributionBin.coef.isnot(None),
+        FireAttributionBin.bootid.between(1, 500)
+    )).all(), columns=['age_group', 'bin_lower', 'bin_upper', 'bootid', 'coef'])
+
+    boot_ages = pd.Index(boot_df['age_group'].unique()).sort_values()
+    boot_edges = pd.MultiIndex.from_frame(
+        boot_df[['bin_lower', 'bin_upper']]).unique().sort_values()
+    coef = np.full((len(boot_ages), len(boot_edges), 500), np.nan, dtype=np.float32)
+    coef[boot_ages.get_indexer(boot_df['age_group']),
+         boot_edges.get_indexer(pd.MultiIndex.from_frame(
+             boot_df[['bin_lower', 'bin_upper']])),
+         boot_df['bootid'].to_numpy(dtype=np.int64) - 1] = boot_df['coef'].to_numpy()
+    boot_lowers = boot_edges.get_level_values(0).to_numpy(dtype=float)
+    boot_uppers = boot_edges.get_level_values(1).to_numpy(dtype=float)
+
+    prec_df = pd.DataFrame(session.execute(select(
+        FireAttributionBin.age_group, FireAttributionBin.bin_lower,
+        FireAttributionBin.bin_upper, FireAttributionBin.af
+    ).where(
+        FireAttributionBin.method == "precomputed_bin_af",
+        FireAttributionBin.cause == "Nonaccidental",
+        FireAttributionBin.af.isnot(None)
+    )).all(), columns=['age_group', 'bin_lower', 'bin_upper', 'af'])
+    prec_df = prec_df.drop_duplicates(
+        ['age_group', 'bin_lower', 'bin_upper'], keep='last'
+    ).sort_values(['age_group', 'bin_lower', 'bin_upper'])
+    prec_bins = {
+        age_group: (bins['bin_lower'].to_numpy(dtype=float),
+                    bins['bin_upper'].to_numpy(dtype=float),
+                    bins['af'].to_numpy(dtype=float))
+        for age_group, bins in prec_df.groupby('age_group')
+    }
+    return boot_ages, boot_lowers, boot_uppers, coef, prec_bins
+
+
+def find_bins(values, lowers, uppers):
+    """Index of the bin (lower <= value < upper) holding each value, -1 where none does.
+    lowers must be sorted; bins are binary-searched rather than scanned."""
+    idx = np.searchsorted(lowers, values, side='right') - 1
+    idx_safe = np.clip(idx, 0, len(lowers) - 1)
+    return np.where((idx >= 0) & (values < uppers[idx_safe]), idx, -1)
+
+
+def bootstrap_af(coef):
+    """Mean AF over the 500 bootstrap replicates of coef[..., bootid - 1], a missing
+    (NaN) replicate counting as 0; also returns where any replicate is present."""
+    rr = np.exp(coef.astype(np.float64))
+    return np.nansum((rr - 1) / rr, axis=-1) / 500, ~np.isnan(coef).all(axis=-1)
+
 
 class DataLoader:
     def __init__(self, data_dir: str = "data"):
@@ -51,19 +378,283 @@ class DataLoader:
     def create_tables(self):
         """Drop tables if they exist"""
         logger.info("Dropping tables if they exist...")
-        Base.metadata.drop_all(bind=engine)
+        self._drop_summary_views()
+        Base.metadata.drop_all(bind=engine, tables=self._physical_tables())
         logger.info("Tables dropped successfully")
         """Create all database tables"""
         logger.info("Creating database tables...")
-        Base.metadata.create_all(bind=engine)
+        # counties.geom is a PostGIS geometry
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+        Base.metadata.create_all(bind=engine, tables=self._physical_tables())
+        with engine.begin() as conn:
+            for table in self._physical_tables():
+                if 'fillfactor' in table.info:
+                    conn.execute(text(
+                        f"ALTER TABLE {table.name} SET (fillfactor = {table.info['fillfactor']})"))
+        self._create_summary_views()
         logger.info("Tables created successfully")
 
+    @staticmethod
+    def _physical_tables():
+        """Tables managed by create_all (materialized views are created separately)"""
+        return [table for table in Base.metadata.sorted_tables
+                if not table.info.get('is_mv')]
+
+    def _drop_summary_views(self):
+        """Drop the PM2.5 summary materialized views"""
+        for model in SUMMARY_VIEWS:
+            self.db.execute(text(
+                f"DROP MATERIALIZED VIEW IF EXISTS {model.__tablename__} CASCADE"))
+        self.db.commit()
+
+    def _create_summary_views(self):
+        """Create the PM2.5 summary materialized views (and their indexes) if missing.
+        A summary still stored as a plain table from an older schema is replaced."""
+        # Enum types of the views are not created by create_all
+        SEASON.create(bind=self.db.connection(), checkfirst=True)
+        for model, view_sql in SUMMARY_VIEWS.items():
+            table_name = model.__tablename__
+            relkind = self.db.execute(text(
+                "SELECT relkind FROM pg_class WHERE relname = :name "
+                "AND relnamespace = 'public'::regnamespace"), {"name": table_name}).scalar()
+            if relkind == 'r':
+                logger.info(f"Replacing table {table_name} with a materialized view")
+                self.db.execute(text(f"DROP TABLE {table_name} CASCADE"))
+            self.db.execute(text(
+                f"CREATE MATERIALIZED VIEW IF NOT EXISTS {table_name} AS {view_sql}"))
+            # A unique index on the key is what REFRESH ... CONCURRENTLY needs
+            key = ", ".join(col.name for col in model.__table__.primary_key.columns)
+            self.db.execute(text(
+                f"CREATE UNIQUE INDEX IF NOT EXISTS uq_{table_name}_key ON {table_name} ({key})"))
+            for index in model.__table__.indexes:
+                index.create(bind=self.db.connection(), checkfirst=True)
+        self.db.commit()
+
+    def migrate_county_geometry(self):
+        """Convert an existing counties.geometry JSONB (GeoJSON) column to the PostGIS geom column"""
+        logger.info("Migrating county geometries from GeoJSON to PostGIS...")
+        try:
+            self.db.execute(text("CREATE EXTENSION IF NOT EXISTS postgis"))
+            self.db.execute(text(
+                f"ALTER TABLE {County.__tablename__} "
+                "ADD COLUMN IF NOT EXISTS geom geometry(MULTIPOLYGON, 4326)"))
+            result = self.db.execute(text(
+                f"UPDATE {County.__tablename__} "
+                "SET geom = ST_Multi(ST_SetSRID(ST_GeomFromGeoJSON(geometry::text), 4326)) "
+                "WHERE geometry IS NOT NULL"))
+            self.db.execute(text(
+                f"ALTER TABLE {County.__tablename__} DROP COLUMN geometry"))
+            self.db.execute(text(
+                f"CREATE INDEX IF NOT EXISTS idx_counties_geom ON {County.__tablename__} USING gist (geom)"))
+            self.db.commit()
+            logger.info(f"Converted {result.rowcount} county geometries")
+        except Exception as e:
+            logger.error(f"Error migrating county geometries: {e}")
+            self.db.rollback()
+            raise
+
+    def migrate_natural_keys(self):
+        """Replace the synthetic id primary key of population, the baseline mortality tables and
+        exceedance_summary with their natural key (the former unique constraint), then CLUSTER on it"""
+        migrations = [
+            (Population, '_fips_year_age_uc', ['idx_population_fips_year_age']),
+            (BaselineMortalityRate, '_unique_mortality_entry', []),
+            (CDCBaselineMortalityRate, 'cdc_unique_mortality_entry', []),
+            (ExceedanceSummary, 'uq_exceedance_fips', ['ix_exceedance_summary_fips']),
+        ]
+        try:
+            for model, unique_name, redundant_indexes in migrations:
+                table_name = model.__tablename__
+                key = ", ".join(col.name for col in model.__table__.primary_key.columns)
+                logger.info(f"Moving {table_name} to PRIMARY KEY ({key})...")
+                self.db.execute(text(
+                    f"ALTER TABLE {table_name} DROP CONSTRAINT IF EXISTS {table_name}_pkey, "
+                    f"DROP CONSTRAINT IF EXISTS {unique_name}, DROP COLUMN IF EXISTS id, "
+                    f"ADD PRIMARY KEY ({key})"))
+                for name in redundant_indexes:
+                    self.db.execute(text(f"DROP INDEX IF EXISTS {name}"))
+                self.db.execute(text(f"CLUSTER {table_name} USING {table_name}_pkey"))
+                self.db.commit()
+            logger.info("Natural primary keys in place")
+        except Exception as e:
+            logger.error(f"Error migrating primary keys: {e}")
+            self.db.rollback()
+            raise
+
+    def migrate_excess_mortality(self, default_method="gemm"):
+        """Move an existing excess_mortality_summary to the derived legacy and YLL columns: create
+        the excess_mortality_settings row (default_method: the method the stored legacy columns
+        were written with) and drop the stored legacy and yll_* columns"""
+        table_name = ExcessMortalitySummary.__tablename__
+        try:
+            ExcessMortalitySettings.__table__.create(bind=self.db.connection(), checkfirst=True)
+            stmt = pg_insert(ExcessMortalitySettings).values(id=1, default_method=default_method)
+            self.db.execute(stmt.on_conflict_do_nothing(index_elements=['id']))
+            for column in EXCESS_MORTALITY_DROPPED_COLUMNS:
+                self.db.execute(text(
+                    f"ALTER TABLE {table_name} DROP COLUMN IF EXISTS {column}"))
+            self.db.commit()
+            logger.info(f"Dropped stored legacy and YLL columns from {table_name}")
+        except Exception as e:
+            logger.error(f"Error migrating excess mortality summary: {e}")
+            self.db.rollback()
+            raise
+
+    def migrate_fips_type(self):
+        """Convert every fips column from varchar to CHAR(5) COLLATE "C" in place.
+        The county foreign keys are dropped around the change (both sides of a key must
+        share a type) and the summary views, which depend on daily_pm25.fips, are rebuilt."""
+        # Tables referencing counties.fips; stage_daily_pm25 postdates the varchar schema
+        fips_tables = [table.name for table in self._physical_tables()
+                       if 'fips' in table.c and table.c.fips.foreign_keys]
+        try:
+            self._drop_summary_views()
+            for table_name in fips_tables:
+                self.db.execute(text(
+                    f"ALTER TABLE {table_name} DROP CONSTRAINT IF EXISTS {table_name}_fips_fkey"))
+            for table_name in [County.__tablename__] + fips_tables:
+                logger.info(f"Converting {table_name}.fips to CHAR(5)...")
+                self.db.execute(text(
+                    f'ALTER TABLE {table_name} ALTER COLUMN fips TYPE CHAR(5) COLLATE "C"'))
+            for table_name in fips_tables:
+                self.db.execute(text(
+                    f"ALTER TABLE {table_name} ADD CONSTRAINT {table_name}_fips_fkey "
+                    f"FOREIGN KEY (fips) REFERENCES {County.__tablename__} (fips)"))
+            self.db.commit()
+            self._create_summary_views()
+            logger.info("fips columns converted")
+        except Exception as e:
+            logger.error(f"Error migrating fips columns: {e}")
+            self.db.rollback()
+            raise
+
     def clear_table(self, table_name):
         """Drop the given table"""
         logger.info(f"Dropping table: {table_name}")
         self.db.execute(f"DROP TABLE IF EXISTS {table_name}")
         self.db.commit()
 
+    def _read_county_geometries(self, shapefile_path):
+        """Read (FIPS, WGS84 geometry) arrays from a county shapefile via pyogrio's Arrow reader.
+
+        Returns (None, None) when the shapefile has no GEOID/FIPS column.
+        """
+        fields = pyogrio.read_info(shapefile_path)['fields']
+        fips_col = next((col for col in ('GEOID', 'FIPS') if col in fields), None)
+        if fips_col is None:
+            return None, None
+
+        # Arrow table of the FIPS column + WKB geometry; no GeoDataFrame is built
+        meta, table = read_arrow(shapefile_path, columns=[fips_col])
+        fips = table[fips_col].to_pandas().astype(str).str.zfill(5).to_numpy()
+        geometry_name = meta['geometry_name'] or 'wkb_geometry'
+        geoms = shapely.from_wkb(
+            table[geometry_name].to_numpy(zero_copy_only=False))
+
+        # Convert to WGS84 if not already
+        if meta['crs'] and CRS.from_user_input(meta['crs']) != CRS.from_epsg(4326):
+            transformer = Transformer.from_crs(
+                meta['crs'], 'EPSG:4326', always_xy=True)
+            geoms = shapely.transform(geoms, lambda coords: np.column_stack(
+                transformer.transform(coords[:, 0], coords[:, 1])))
+
+        # Snap to a ~10 m grid and simplify for smaller GeoJSON/JSONB payloads
+        vertices_before = shapely.get_num_coordinates(geoms).sum()
+        geoms = shapely.set_precision(geoms, grid_size=COUNTY_GRID_SIZE)
+        geoms = shapely.simplify(
+            geoms, tolerance=COUNTY_SIMPLIFY_TOLERANCE, preserve_topology=True)
+        logger.info(
+            f"Simplified county geometries: {vertices_before} -> {shapely.get_num_coordinates(geoms).sum()} vertices")
+        return fips, geoms
+
+    def _truncate_table(self, model, commit: bool = True, cascade: bool = False):
+        """Empty a table with TRUNCATE ... RESTART IDENTITY (no per-row WAL like DELETE).
+        cascade=True also empties every table with a foreign key to it; by default
+        PostgreSQL refuses to truncate a referenced table instead."""
+        self.db.execute(text(
+            f"TRUNCATE TABLE {model.__tablename__} RESTART IDENTITY"
+            f"{' CASCADE' if cascade else ''}"))
+        if commit:
+            self.db.commit()
+
+    def _valid_county_fips(self):
+        """FIPS codes present in the County table"""
+        return frozenset(self.db.scalars(select(County.fips)).all())
+
+    @cached_property
+    def _county_index_to_fips(self):
+        """County index -> FIPS, read once per loader (reset by load_counties)"""
+        return dict(self.db.execute(select(County.index, County.fips)).tuples())
+
+    @cached_property
+    def _county_fips_to_index(self):
+        """FIPS -> county index, read once per loader (reset by load_counties)"""
+        return {fips: index for index, fips in self._county_index_to_fips.items()}
+
+    @cached_property
+    def _fire_bins(self):
+        """load_fire_bins arrays, read once per loader (reset by load_fire_attribution_bins)"""
+        return load_fire_bins(self.db)
+
+    def _reset_county_mappings(self):
+        """Drop the cached county mappings after the counties table changes"""
+        self.__dict__.pop('_county_index_to_fips', None)
+        self.__dict__.pop('_county_fips_to_index', None)
+
+    def _copy_frame(self, table_name, frame):
+        """Stream a DataFrame into a table with PostgreSQL COPY FROM STDIN (columns taken from the frame)"""
+        buf = io.StringIO()
+        frame.to_csv(buf, header=False, index=False)
+        buf.seek(0)
+        columns = ", ".join(f'"{col}"' for col in frame.columns)
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT csv)", buf)
+        finally:
+            cursor.close()
+
+    def _bulk_copy(self, model, frame):
+        """Bulk-load a DataFrame into a model's table: COPY on PostgreSQL with the columns
+        in __table__ order (autoincrement id left to the sequence), Core executemany elsewhere"""
+        if frame.empty:
+            return
+        columns = [col.name for col in model.__table__.columns if col.name in frame.columns]
+        if self.db.get_bind().dialect.name == "postgresql":
+            self._copy_frame(model.__tablename__, frame[columns])
+        else:
+            self.db.execute(insert(model), frame[columns].to_dict(orient='records'))
+
+    def _bulk_upsert(self, model, frame, conflict_cols, update_cols, chunk_size: int = 5000):
+        """INSERT ... ON CONFLICT (conflict_cols) DO UPDATE SET update_cols, one multi-row
+        statement per chunk_size rows (keeps each statement well under the bind-parameter limit)"""
+        stmt = pg_insert(model)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=conflict_cols,
+            set_={col: getattr(stmt.excluded, col) for col in update_cols})
+        records = frame.to_dict(orient='records')
+        for start in range(0, len(records), chunk_size):
+            self.db.execute(stmt.values(records[start:start + chunk_size]))
+
+    def _vacuum_analyze(self, table_name):
+        """VACUUM ANALYZE a freshly loaded table: sets the visibility map that index-only scans
+        on the covering indexes rely on, and refreshes planner statistics"""
+        # VACUUM cannot run inside a transaction block
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.execute(text(f"VACUUM ANALYZE {table_name}"))
+
+    def _query_frame(self, stmt, chunk_size: int = 10000):
+        """Run a Core select through a server-side cursor and return its rows as a DataFrame"""
+        result = self.db.execute(
+            stmt.execution_options(stream_results=True, yield_per=chunk_size))
+        columns = list(result.keys())
+        frames = [pd.DataFrame(chunk, columns=columns)
+                  for chunk in result.partitions()]
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(frames, ignore_index=True)
+
     def load_shapefiles(self, shapefile_path: Optional[str] = None):
         """Load county geometries from shapefile"""
         if shapefile_path is None:
@@ -72,57 +663,36 @@ class DataLoader:
         logger.info(f"Loading county geometries from {shapefile_path}")
 
         try:
-            # Read shapefile
-            gdf = gpd.read_file(shapefile_path)
-
-            # The Census shapefile uses GEOID for FIPS codes
-            if 'GEOID' in gdf.columns:
-                gdf['FIPS'] = gdf['GEOID']
-            elif 'FIPS' not in gdf.columns:
+            # Read shapefile (the Census shapefile uses GEOID for FIPS codes)
+            fips_codes, geoms = self._read_county_geometries(shapefile_path)
+            if fips_codes is None:
                 logger.error("Could not find FIPS/GEOID column in shapefile")
                 return
 
-            # Ensure FIPS is string and properly formatted
-            gdf['FIPS'] = gdf['FIPS'].astype(str).str.zfill(5)
-
-            # Simplify geometries for better performance (optional)
-            # gdf['geometry'] = gdf['geometry'].simplify(tolerance=0.01)
-
-            # Convert to WGS84 if not already
-            if gdf.crs != 'EPSG:4326':
-                gdf = gdf.to_crs('EPSG:4326')
+            logger.info(f"Found {len(fips_codes)} counties in shapefile")
 
-            logger.info(f"Found {len(gdf)} counties in shapefile")
+            # Convert all geometries to hex WKB in one vectorized GEOS call
+            wkb_strs = shapely.to_wkb(geoms, hex=True)
 
-            # Convert geometries to GeoJSON and update database
-            updated_count = 0
-            for _, row in gdf.iterrows():
-                try:
-                    # Convert geometry to GeoJSON
-                    geojson = json.loads(
-                        gpd.GeoSeries([row.geometry]).to_json())
-                    geometry_dict = geojson['features'][0]['geometry']
-
-                    # Update county with geometry
-                    county = self.db.query(County).filter(
-                        County.fips == row['FIPS']).first()
-                    if county:
-                        county.geometry = geometry_dict
-                        updated_count += 1
-                    else:
-                        logger.warning(
-                            f"County with FIPS {row['FIPS']} not found in database")
-
-                except Exception as e:
-                    logger.warning(
-                        f"Error processing geometry for FIPS {row['FIPS']}: {e}")
-                    continue
-
-                # Commit every 100 updates
-                if updated_count % 100 == 0:
-                    self.db.commit()
-                    logger.info(
-                        f"Updated {updated_count} county geometries...")
+            # Update every county in one UPDATE ... FROM (VALUES ...); the
+            # WKB is parsed into a PostGIS MultiPolygon server-side
+            rows = list(zip(fips_codes.tolist(), wkb_strs.tolist()))
+            cursor = self.db.connection().connection.cursor()
+            try:
+                updated = execute_values(
+                    cursor,
+                    f"UPDATE {County.__tablename__} AS c SET geom = {COUNTY_GEOM_FROM_WKB.format('data.geom')} "
+                    "FROM (VALUES %s) AS data(fips, geom) "
+                    "WHERE c.fips = data.fips RETURNING c.fips",
+                    rows, page_size=1000, fetch=True)
+            finally:
+                cursor.close()
+            updated_count = len(updated)
+
+            missing = set(fips_codes) - {fips for (fips,) in updated}
+            if missing:
+                logger.warning(
+                    f"{len(missing)} shapefile counties not found in database: {sorted(missing)}")
 
             # Final commit
             self.db.commit()
@@ -134,6 +704,21 @@ class DataLoader:
             self.db.rollback()
             raise
 
+    def prepare_state_boundaries(self, shapefile_path: Optional[str] = None,
+                                 parquet_path: Optional[str] = None):
+        """Write the state boundary shapefile as WGS84 GeoParquet for the API.
+        The file is written alongside and renamed into place, so the web process
+        never reads a partial copy."""
+        shapefile_path = Path(shapefile_path or STATE_SHAPEFILE)
+        parquet_path = Path(parquet_path or STATE_BOUNDARIES_PARQUET)
+        logger.info(f"Writing state boundaries from {shapefile_path} to {parquet_path}")
+
+        gdf = gpd.read_file(shapefile_path, engine="pyogrio").to_crs('EPSG:4326')
+        tmp_path = parquet_path.with_name(parquet_path.name + '.tmp')
+        gdf.to_parquet(tmp_path)
+        tmp_path.replace(parquet_path)
+        logger.info(f"Wrote {len(gdf)} state boundaries")
+
     def load_counties(self, fips_filepath: Optional[str] = None, shapefile_path: Optional[str] = None):
         """Load county data from FIPScode.csv and geometries from shapefile"""
         if fips_filepath is None:
@@ -146,8 +731,10 @@ class DataLoader:
         try:
             # Clear existing table
             logger.info("Clearing existing counties table...")
+            # Delete and reload in one transaction (one WAL flush at the end). Every
+            # county-level table references counties, so TRUNCATE would need CASCADE and
+            # silently empty them; DELETE fails on the foreign keys instead.
             self.db.query(County).delete()
-            self.db.commit()
 
             # Read FIPS codes CSV
             df = pd.read_csv(fips_filepath, dtype={'FIPS': str})
@@ -160,67 +747,42 @@ class DataLoader:
 
             # Read shapefile for geometries
             logger.info(f"Reading shapefile from {shapefile_path}")
-            gdf = gpd.read_file(shapefile_path)
+            fips_codes, geoms = self._read_county_geometries(shapefile_path)
 
-            # Handle FIPS column name in shapefile
-            if 'GEOID' in gdf.columns:
-                gdf['FIPS'] = gdf['GEOID']
-            elif 'FIPS' not in gdf.columns:
+            if fips_codes is None:
                 logger.warning("No FIPS/GEOID column found in shapefile")
-                gdf['FIPS'] = None
-
-            if gdf['FIPS'] is not None:
-                gdf['FIPS'] = gdf['FIPS'].astype(str).str.zfill(5)
-
-                # Convert to WGS84 if needed
-                if gdf.crs != 'EPSG:4326':
-                    gdf = gdf.to_crs('EPSG:4326')
-
-                # Create geometry lookup
-                geometry_lookup = {}
-                for _, row in gdf.iterrows():
-                    try:
-                        geojson = json.loads(
-                            gpd.GeoSeries([row.geometry]).to_json())
-                        geometry_lookup[row['FIPS']
-                                        ] = geojson['features'][0]['geometry']
-                    except:
-                        continue
+                geometry = pd.Series(None, index=df.index, dtype=object)
+            else:
+                # Hex WKB from one vectorized GEOS call, aligned to the CSV rows;
+                # it is parsed into a PostGIS geometry server-side
+                wkb_strs = pd.Series(shapely.to_wkb(geoms, hex=True), index=fips_codes)
+                wkb_strs = wkb_strs[~wkb_strs.index.duplicated()]
+                geometry = df['FIPS'].map(wkb_strs).astype(object)
+                geometry = geometry.where(geometry.notna(), None)
 
                 logger.info(
-                    f"Loaded {len(geometry_lookup)} geometries from shapefile")
+                    f"Loaded {wkb_strs.notna().sum()} geometries from shapefile")
 
             logger.info(f"Found {len(df)} counties to load")
 
-            # Batch insert counties with geometries
-            counties_to_insert = []
-            for idx, row in df.iterrows():
-                geometry = geometry_lookup.get(
-                    row['FIPS']) if 'geometry_lookup' in locals() else None
-
-                county = County(
-                    fips=row['FIPS'],
-                    name=row['name'],
-                    index=idx + 1,
-                    geometry=geometry
-                )
-                counties_to_insert.append(county)
-
-                # Batch insert every 1000 records
-                if len(counties_to_insert) >= 1000:
-                    self.db.bulk_save_objects(counties_to_insert)
-                    self.db.commit()
-                    counties_to_insert = []
-                    logger.info(f"Inserted {idx + 1} counties...")
-
-            # Insert remaining counties
-            if counties_to_insert:
-                self.db.bulk_save_objects(counties_to_insert)
-                self.db.commit()
+            # Insert counties with geometries in one multi-row INSERT per page
+            rows = list(zip(df['FIPS'], df['name'],
+                            (df.index + 1).tolist(), geometry))
+            if rows:
+                cursor = self.db.connection().connection.cursor()
+                try:
+                    execute_values(
+                        cursor,
+                        f'INSERT INTO {County.__tablename__} (fips, name, "index", geom) VALUES %s',
+                        rows, template=f"(%s, %s, %s, {COUNTY_GEOM_FROM_WKB.format('%s')})",
+                        page_size=1000)
+                finally:
+                    cursor.close()
+            self.db.commit()
+            self._reset_county_mappings()
 
             # Count how many have geometries
-            counties_with_geom = sum(
-                1 for c in counties_to_insert if c.geometry is not None)
+            counties_with_geom = int(geometry.notna().sum())
             logger.info(
                 f"Successfully loaded {len(df)} counties ({counties_with_geom} with geometries)")
 
@@ -240,11 +802,10 @@ class DataLoader:
         try:
             # Clear existing table
             logger.info("Clearing existing population table...")
-            self.db.query(Population).delete()
-            self.db.commit()
+            self._truncate_table(Population)
 
-            df = pd.read_csv(filepath, dtype={
-                             "fips": str, "year": int, "age_group": int, "population": int})
+            df = pd.read_csv(filepath, engine='pyarrow', dtype_backend='pyarrow', dtype={
+                             "fips": "string", "year": int, "age_group": int})
             df.columns = df.columns.str.strip().str.replace('"', '')
 
             # Filter for years 2006-2008 only
@@ -253,76 +814,37 @@ class DataLoader:
             logger.info(
                 f"Years in filtered data: {sorted(df['year'].unique())}")
 
-            # Get set of valid FIPS codes from County table
-            counties = {c.fips for c in self.db.query(County.fips).all()}
-
-            population_data = []
-            processed_count = 0
-            matched_count = 0
-            # For total pop by (fips, year)
-            total_pop_by_county_year = defaultdict(int)
-
-            for _, row in df.iterrows():
-                processed_count += 1
-                try:
-                    fips = str(row['fips']).zfill(5)
-                    year = int(row['year'])
-                    age_group = int(row['age_group'])
-                    population = int(row['population']) if pd.notna(
-                        row['population']) else 0
-                    if fips not in counties:
-                        logger.warning(
-                            f"Skipped county FIPS {fips} (not found in DB) for year {year}")
-                        continue
-                    pop_record = Population(
-                        fips=fips,
-                        year=year,
-                        age_group=age_group,
-                        population=population
-                    )
-                    population_data.append(pop_record)
-                    total_pop_by_county_year[(fips, year)] += population
-                    matched_count += 1
-                    if len(population_data) >= 1000:
-                        self.db.bulk_save_objects(population_data)
-                        self.db.commit()
-                        logger.info(
-                            f"Inserted batch of {len(population_data)} population records...")
-                        population_data = []
-                except Exception as e:
-                    logger.warning(
-                        f"Error processing row {processed_count}: {e}")
-                    logger.warning(f"Row data: {dict(row)}")
-                    continue
-
-            # Insert any remaining age-grouped records
-            if population_data:
-                self.db.bulk_save_objects(population_data)
-                self.db.commit()
-                logger.info(
-                    f"Inserted final batch of {len(population_data)} population records")
-
-            # Now insert total population (age_group=0) for each (fips, year)
-            total_records = []
-            for (fips, year), total_pop in total_pop_by_county_year.items():
-                total_record = Population(
-                    fips=fips,
-                    year=year,
-                    age_group=0,
-                    population=total_pop
-                )
-                total_records.append(total_record)
-                if len(total_records) >= 1000:
-                    self.db.bulk_save_objects(total_records)
-                    self.db.commit()
-                    logger.info(
-                        f"Inserted batch of {len(total_records)} total population records...")
-                    total_records = []
-            if total_records:
-                self.db.bulk_save_objects(total_records)
-                self.db.commit()
+            # Prefilter to FIPS codes present in the County table in one hashed isin
+            processed_count = len(df)
+            df['fips'] = df['fips'].astype(str).str.zfill(5)
+            known = df['fips'].isin(self._valid_county_fips())
+            if not known.all():
+                skipped = sorted(df.loc[~known, 'fips'].unique())
+                logger.warning(
+                    f"Skipped {len(skipped)} county FIPS not found in DB: {skipped}")
+            df = df[known]
+            df['population'] = df['population'].fillna(0).astype(int)
+            population_cols = ['fips', 'year', 'age_group', 'population']
+            matched_count = len(df)
+
+            # Insert age-grouped records
+            if matched_count:
+                self._bulk_copy(Population, df[population_cols])
                 logger.info(
-                    f"Inserted final batch of {len(total_records)} total population records (age_group=0)")
+                    f"Inserted {matched_count} population records")
+
+            # Now insert total population (age_group=0) for each (fips, year),
+            # aggregated in the database from the rows just loaded
+            totals = self.db.execute(text("""
+                INSERT INTO population (fips, year, age_group, population)
+                SELECT fips, year, 0, SUM(population)
+                FROM population
+                WHERE year IN (2006, 2007, 2008) AND age_group > 0
+                GROUP BY fips, year
+            """))
+            self.db.commit()
+            logger.info(
+                f"Inserted {totals.rowcount} total population records (age_group=0)")
 
             logger.info(f"Population loading summary (years 2006-2008):")
             logger.info(f"  Total rows processed: {processed_count}")
@@ -346,57 +868,11 @@ class DataLoader:
         c = Census(api_key)
         years = range(2009, 2024)
 
-        # Age group mapping: group index -> [male_var, female_var, ...]
-        ACS_AGE_VARIABLES = {
-            # 0–4 years
-            1:  ['B01001_003E', 'B01001_027E'],
-            # 5–9 years
-            2:  ['B01001_004E', 'B01001_028E'],
-            # 10–14 years
-            3:  ['B01001_005E', 'B01001_029E'],
-            # 15–19 years
-            4:  ['B01001_006E', 'B01001_007E', 'B01001_030E', 'B01001_031E'],
-            5:  ['B01001_008E', 'B01001_009E', 'B01001_010E',
-                 'B01001_032E', 'B01001_033E', 'B01001_034E'],                 # 20–24 years
-            # 25–29 years
-            6:  ['B01001_011E', 'B01001_035E'],
-            # 30–34 years
-            7:  ['B01001_012E', 'B01001_036E'],
-            # 35–39 years
-            8:  ['B01001_013E', 'B01001_037E'],
-            # 40–44 years
-            9:  ['B01001_014E', 'B01001_038E'],
-            # 45–49 years
-            10: ['B01001_015E', 'B01001_039E'],
-            # 50–54 years
-            11: ['B01001_016E', 'B01001_040E'],
-            # 55–59 years
-            12: ['B01001_017E', 'B01001_041E'],
-            # 60–64 years
-            13: ['B01001_018E', 'B01001_019E', 'B01001_042E', 'B01001_043E'],
-            # 65–69 years
-            14: ['B01001_020E', 'B01001_021E', 'B01001_044E', 'B01001_045E'],
-            # 70–74 years
-            15: ['B01001_022E', 'B01001_046E'],
-            # 75–79 years
-            16: ['B01001_023E', 'B01001_047E'],
-            # 80–84 years
-            17: ['B01001_024E', 'B01001_048E'],
-            # 85+ years
-            18: ['B01001_025E', 'B01001_049E'],
-        }
-
-        def sum_age_group(row, var_list):
-            total = 0
-            for var in var_list:
-                val = row.get(var)
-                try:
-                    total += int(val) if val is not None else 0
-                except (ValueError, TypeError):
-                    logger.warning(f"Non-integer value for {var}: {val}")
-            return total
+        def fetch(year, state):
+            return c.acs5.get(
+                FLAT_VARS + ['NAME'], geo={'for': 'county:*', 'in': f'state:{state.fips}'}, year=year)
 
-        counties = {c.fips for c in self.db.query(County.fips).all()}
+        counties = self._valid_county_fips()
         population_data = []
         processed_count = 0
         matched_count = 0
@@ -405,108 +881,91 @@ class DataLoader:
         logger.info(
             "Loading population data from Census API (ACS 5-year, B01001)...")
         try:
-            for year in years:
-                logger.info(f"Loading population data for year {year}")
-                for state in states.STATES:
+            year_state_pairs = [(year, state)
+                                for year in years for state in states.STATES]
+            logger.info(
+                f"Fetching {len(year_state_pairs)} year/state responses with {CENSUS_API_WORKERS} workers")
+            with ThreadPoolExecutor(max_workers=CENSUS_API_WORKERS) as pool:
+                futures = {pool.submit(fetch, year, state): (year, state)
+                           for year, state in year_state_pairs}
+                # Responses are processed here so DB writes stay on this thread
+                for future in as_completed(futures):
+                    year, state = futures[future]
                     try:
-                        all_vars = [v for sublist in ACS_AGE_VARIABLES.values()
-                                    for v in sublist] + ['B01001_001E']
-                        result = c.acs5.get(
-                            all_vars + ['NAME'], geo={'for': 'county:*', 'in': f'state:{state.fips}'}, year=year)
-                        for row in result:
-                            fips = row['state'] + row['county']
-                            processed_count += 1
-                            if fips not in counties:
-                                logger.debug(
-                                    f"Skipped county FIPS {fips} (not found in DB) for year {year}")
-                                continue
-
-                            # Skip Connecticut counties for 2022-2023 (will be handled manually)
-                            if fips.startswith('09') and year in [2022, 2023]:
-                                logger.debug(
-                                    f"Skipping Connecticut county {fips} for year {year} (will be handled manually)")
-                                continue
-
-                            # Normal processing for all counties/years
-                            county_counter += 1
-
-                            # Add age group populations
-                            for group_index, var_list in ACS_AGE_VARIABLES.items():
-                                total = sum_age_group(row, var_list)
-                                try:
-                                    population_data.append(Population(
-                                        fips=fips,
-                                        year=year,
-                                        age_group=group_index,
-                                        population=total
-                                    ))
-                                    matched_count += 1
-                                except Exception as e:
-                                    logger.warning(
-                                        f"Error creating Population record for {fips}, {year}, group {group_index}: {e}")
-
-                            # Add total population as age_group=0 (only once per county-year)
-                            try:
-                                total_pop = int(row.get('B01001_001E', 0))
-                                population_data.append(Population(
-                                    fips=fips,
-                                    year=year,
-                                    age_group=0,  # Special index for total population
-                                    population=total_pop
-                                ))
-                                matched_count += 1
-                            except Exception as e:
-                                logger.warning(
-                                    f"Error creating total Population record for {fips}, {year}: {e}")
-                            # Commit after every 100 counties
-                            if county_counter % 100 == 0:
-                                self.db.bulk_save_objects(population_data)
-                                self.db.commit()
-                                logger.info(
-                                    f"Inserted batch of {len(population_data)} population records after {county_counter} counties...")
-                                population_data = []
+                        result = future.result()
                     except Exception as e:
                         logger.warning(
                             f"Error fetching data for {state.name}, {year}: {e}")
                         continue
+
+                    processed_count += len(result)
+                    rdf = pd.DataFrame(result)
+                    if rdf.empty:
+                        continue
+                    rdf['fips'] = rdf['state'] + rdf['county']
+                    keep = rdf['fips'].isin(counties)
+                    # Skip Connecticut counties for 2022-2023 (will be handled manually)
+                    if year in (2022, 2023):
+                        keep &= ~rdf['fips'].str.startswith('09')
+                    rdf = rdf[keep]
+                    if rdf.empty:
+                        continue
+
+                    # Sum each age group's ACS columns across all counties at once
+                    values = rdf[FLAT_VARS].apply(
+                        pd.to_numeric, errors='coerce').fillna(0).astype(np.int64)
+                    group_df = pd.DataFrame({
+                        group_index: values[var_list].sum(axis=1)
+                        for group_index, var_list in ACS_AGE_VARIABLES.items()
+                    })
+                    # Total population as age_group=0 (only once per county-year)
+                    group_df[0] = values[ACS_TOTAL_VARIABLE]
+                    group_df['fips'] = rdf['fips']
+                    long_df = group_df.melt(
+                        id_vars='fips', var_name='age_group', value_name='population')
+                    long_df['age_group'] = long_df['age_group'].astype(int)
+                    long_df['year'] = year
+                    population_data.append(long_df)
+                    matched_count += len(long_df)
+
+                    # Flush to the database after roughly every 100 counties
+                    # (committed once, after the Connecticut rows)
+                    counties_before = county_counter
+                    county_counter += len(rdf)
+                    if county_counter // 100 > counties_before // 100:
+                        batch = pd.concat(population_data, ignore_index=True)
+                        self._upsert_population(batch)
+                        logger.info(
+                            f"Inserted batch of {len(batch)} population records after {county_counter} counties...")
+                        population_data = []
             # Insert any remaining records
             if population_data:
-                self.db.bulk_save_objects(population_data)
-                self.db.commit()
+                batch = pd.concat(population_data, ignore_index=True)
+                self._upsert_population(batch)
                 logger.info(
-                    f"Inserted final batch of {len(population_data)} population records")
+                    f"Inserted final batch of {len(batch)} population records")
 
             # Manually insert Connecticut population data for 2022-2023
             logger.info(
                 "Inserting Connecticut population data for 2022-2023...")
 
             # First, get the actual 2021 Connecticut age group distribution from the database
-            ct_2021_distribution = {}
             ct_counties = ['09001', '09003', '09005',
                            '09007', '09009', '09011', '09013', '09015']
 
-            # Get 2021 data for Connecticut counties to calculate distribution
-            for fips in ct_counties:
-                ct_2021_data = self.db.query(Population).filter(
-                    Population.fips == fips,
-                    Population.year == 2021,
-                    # Exclude total population (age_group=0)
-                    Population.age_group > 0
-                ).all()
-
-                if ct_2021_data:
-                    # Calculate distribution from actual 2021 data
-                    total_2021_pop = sum(
-                        record.population for record in ct_2021_data)
-                    if total_2021_pop > 0:
-                        for record in ct_2021_data:
-                            if record.age_group not in ct_2021_distribution:
-                                ct_2021_distribution[record.age_group] = 0
-                            ct_2021_distribution[record.age_group] += record.population
+            # Sum 2021 Connecticut populations per age group in one grouped query
+            ct_2021_distribution = dict(self.db.query(
+                Population.age_group, func.sum(Population.population)
+            ).filter(
+                Population.fips.in_(ct_counties),
+                Population.year == 2021,
+                # Exclude total population (age_group=0)
+                Population.age_group > 0
+            ).group_by(Population.age_group).all())
 
             # Normalize the distribution to percentages
-            if ct_2021_distribution:
-                total_ct_2021 = sum(ct_2021_distribution.values())
+            total_ct_2021 = sum(ct_2021_distribution.values())
+            if total_ct_2021 > 0:
                 ct_2021_distribution = {age_group: count / total_ct_2021
                                         for age_group, count in ct_2021_distribution.items()}
                 logger.info(
@@ -547,38 +1006,27 @@ class DataLoader:
                 '09015': {'name': 'Windham County', '2022': 113412, '2023': 113246}
             }
 
-            ct_population_records = []
-            for fips, data in ct_population_2022_2023.items():
-                for year in [2022, 2023]:
-                    population_value = int(data[str(year)])
-                    # Insert total population (age_group=0)
-                    ct_population_records.append(Population(
-                        fips=fips,
-                        year=year,
-                        age_group=0,
-                        population=population_value
-                    ))
-                    # Insert age group populations (using proportional distribution from 2021)
-                    # Realistic 2021 age group distribution based on US demographics
-                    # Age group percentages based on typical US population pyramid
-                    age_group_distribution = ct_2021_distribution
-
-                    for age_group in range(1, 19):
-                        # Calculate population for this age group using realistic distribution
-                        age_group_population = int(
-                            population_value * age_group_distribution[age_group])
-                        ct_population_records.append(Population(
-                            fips=fips,
-                            year=year,
-                            age_group=age_group,
-                            population=age_group_population
-                        ))
-
-            if ct_population_records:
-                self.db.bulk_save_objects(ct_population_records)
-                self.db.commit()
+            # Expand (county, year) totals into all age groups with one outer product:
+            # column 0 is the total (age_group=0), columns 1-18 the age groups
+            ct_fips = list(ct_population_2022_2023)
+            ct_years = [2022, 2023]
+            ct_totals = np.array([[data[str(year)] for year in ct_years]
+                                  for data in ct_population_2022_2023.values()]).ravel()
+            age_group_distribution = np.array(
+                [ct_2021_distribution.get(age_group, 0.0) for age_group in range(1, 19)])
+            ct_matrix = np.column_stack(
+                [ct_totals, np.outer(ct_totals, age_group_distribution).astype(int)])
+            ct_frame = pd.DataFrame({
+                'fips': np.repeat(ct_fips, len(ct_years) * 19),
+                'year': np.tile(np.repeat(ct_years, 19), len(ct_fips)),
+                'age_group': np.tile(np.arange(19), len(ct_fips) * len(ct_years)),
+                'population': ct_matrix.ravel(),
+            })
+            if not ct_frame.empty:
+                self._upsert_population(ct_frame)
                 logger.info(
-                    f"Inserted {len(ct_population_records)} Connecticut population records for 2022-2023")
+                    f"Inserted {len(ct_frame)} Connecticut population records for 2022-2023")
+            self.db.commit()
 
             logger.info("Population data loaded from Census API.")
             logger.info(
@@ -593,7 +1041,13 @@ class DataLoader:
             self.db.rollback()
             raise
 
-    def load_pm25_data(self, filepath: Optional[str] = None, chunk_size: int = 10000):
+    def _upsert_population(self, frame):
+        """Upsert population rows on (fips, year, age_group), so re-running the Census API
+        load refreshes existing county-years instead of failing on the primary key"""
+        self._bulk_upsert(Population, frame[['fips', 'year', 'age_group', 'population']],
+                          ['fips', 'year', 'age_group'], ['population'])
+
+    def load_pm25_data(self, filepath: Optional[str] = None, chunk_size: int = 20000):
         """Load PM2.5 data from daily_county_data_combined.csv"""
         if filepath is None:
             filepath = self.data_dir / "daily_county_data_combined_2006.csv"
@@ -601,14 +1055,24 @@ class DataLoader:
         logger.info(f"Loading PM2.5 data from {filepath}")
 
         try:
-            logger.info("Clearing existing PM2.5 table...")
-            self.db.query(DailyPM25).delete()
-            self.db.commit()
+            # The CSV lands in the UNLOGGED stage table first; daily_pm25 is untouched
+            # while the chunks are parsed and staged
+            StageDailyPM25.__table__.create(bind=self.db.connection(), checkfirst=True)
+            self._truncate_table(StageDailyPM25)
             # Read CSV in chunks to handle large file
             total_records = 0
             chunk_count = 0
-
-            for chunk in pd.read_csv(filepath, chunksize=chunk_size, dtype={'FIPS': str}):
+            years = set()
+
+            # Multi-threaded Arrow CSV reader, streamed as ~chunk_size-row record batches
+            reader = pa_csv.open_csv(
+                str(filepath),
+                read_options=pa_csv.ReadOptions(
+                    block_size=chunk_size * PM25_CSV_ROW_BYTES),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types=PM25_CSV_TYPES))
+            for batch in reader:
+                chunk = batch.to_pandas()
                 chunk_count += 1
                 logger.info(
                     f"Processing chunk {chunk_count} ({len(chunk)} records)")
@@ -627,62 +1091,129 @@ class DataLoader:
 
                 # Remove rows with invalid dates
                 chunk = chunk.dropna(subset=['date'])
+                years.update(chunk['date'].dt.year.unique())
 
-                # Calculate non-fire PM2.5
-                chunk['nonfire_pm25'] = chunk['total_value'] - \
-                    chunk['fire_pm25']
-                chunk['nonfire_pm25'] = chunk['nonfire_pm25'].clip(
-                    lower=0)  # Ensure non-negative
+                # Calculate non-fire PM2.5 from the raw values, so a missing total
+                # or fire value leaves it missing rather than total - 0
+                chunk['nonfire_pm25'] = (chunk['total_value'] -
+                                         chunk['fire_pm25']).clip(lower=0)  # Ensure non-negative
 
-                # Prepare PM2.5 records
-                pm25_records = []
-                for _, row in chunk.iterrows():
-                    try:
-                        pm25_record = DailyPM25(
-                            fips=row['FIPS'],
-                            county_index=int(row['county_index']),
-                            date=row['date'].date(),
-                            total=float(row['total_value']) if pd.notna(
-                                row['total_value']) else 0.0,
-                            fire=float(row['fire_pm25']) if pd.notna(
-                                row['fire_pm25']) else 0.0,
-                            nonfire=float(row['nonfire_pm25']) if pd.notna(
-                                row['nonfire_pm25']) else 0.0
-                        )
-                        pm25_records.append(pm25_record)
-                    except Exception as e:
-                        logger.warning(f"Skipping invalid record: {e}")
-                        continue
+                # Missing values are stored as 0.0
+                for column in ('total_value', 'fire_pm25', 'nonfire_pm25'):
+                    chunk[column] = chunk[column].fillna(0.0)
+                chunk['date'] = chunk['date'].dt.date
 
-                # Bulk insert
-                if pm25_records:
-                    self.db.bulk_save_objects(pm25_records)
-                    self.db.commit()
-                    total_records += len(pm25_records)
-                    logger.info(
-                        f"Inserted {len(pm25_records)} PM2.5 records (Total: {total_records})")
+                # Select PM2.5 columns under their table names
+                pm25_frame = chunk.rename(columns=PM25_CSV_COLUMNS)[
+                    list(PM25_CSV_COLUMNS.values())]
+
+                if pm25_frame.empty:
+                    continue
 
+                # COPY streams the chunk as CSV in one round trip (no WAL: unlogged)
+                self._bulk_copy(StageDailyPM25, pm25_frame)
+                self.db.commit()
+                total_records += len(pm25_frame)
+                logger.info(
+                    f"Staged {len(pm25_frame)} PM2.5 records (Total: {total_records})")
+
+            # Replace daily_pm25 in one transaction. Secondary indexes are rebuilt in
+            # bulk afterwards rather than per row, and since the table is truncated in
+            # the same transaction, wal_level=minimal servers skip WAL for the INSERT.
+            # TRUNCATE and DROP INDEX take ACCESS EXCLUSIVE locks: daily_pm25 reads
+            # block until this transaction commits, so run loads outside serving hours.
+            logger.info("Moving staged PM2.5 records into daily_pm25...")
+            self._truncate_table(DailyPM25, commit=False)
+            self._drop_pm25_secondary_indexes(commit=False)
+            self._ensure_pm25_partitions(years)
+            columns = ", ".join(PM25_CSV_COLUMNS.values())
+            self.db.execute(text(
+                f"INSERT INTO {DailyPM25.__tablename__} ({columns}) "
+                f"SELECT {columns} FROM {StageDailyPM25.__tablename__}"))
+            self._truncate_table(StageDailyPM25, commit=False)
+            self.db.commit()
             logger.info(f"Successfully loaded {total_records} PM2.5 records")
 
+            logger.info("Rebuilding daily_pm25 model indexes...")
+            for index in DailyPM25.__table__.indexes:
+                index.create(bind=self.db.connection(), checkfirst=True)
+            self.db.commit()
+            logger.info(
+                "Run create_indexes() to rebuild the daily_pm25 query indexes")
+
         except Exception as e:
             logger.error(f"Error loading PM2.5 data: {e}")
             self.db.rollback()
             raise
 
+    def _ensure_pm25_partitions(self, years):
+        """Create the yearly RANGE partitions of daily_pm25 (daily_pm25_yYYYY) that are missing"""
+        for year in sorted(set(int(year) for year in years)):
+            self.db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {DailyPM25.__tablename__}_y{year} "
+                f"PARTITION OF {DailyPM25.__tablename__} "
+                f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"))
+
+    def _drop_pm25_secondary_indexes(self, commit: bool = True):
+        """Drop the daily_pm25 secondary indexes (model and create_indexes ones) ahead of a bulk load"""
+        names = [index.name for index in DailyPM25.__table__.indexes]
+        names += PM25_QUERY_INDEXES
+        for name in names:
+            self.db.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        if commit:
+            self.db.commit()
+        logger.info(f"Dropped {len(names)} daily_pm25 secondary indexes")
+
+    def _drop_secondary_indexes(self, table_name):
+        """Drop a table's plain secondary indexes (not PK/unique constraints) and return their DDL.
+        Does not commit: the caller's transaction owns the drop and the rebuild."""
+        rows = self.db.execute(text("""
+            SELECT i.indexname, i.indexdef
+            FROM pg_indexes i
+            WHERE i.schemaname = current_schema()
+              AND i.tablename = :table_name
+              AND NOT EXISTS (
+                  SELECT 1 FROM pg_constraint c
+                  WHERE c.conindid = (quote_ident(i.schemaname) || '.' || quote_ident(i.indexname))::regclass
+              )
+        """), {"table_name": table_name}).all()
+        for name, _ in rows:
+            self.db.execute(text(f'DROP INDEX IF EXISTS "{name}"'))
+        logger.info(f"Dropped {len(rows)} {table_name} secondary indexes")
+        return [ddl for _, ddl in rows]
+
+    def _recreate_indexes(self, index_ddl):
+        """Rebuild indexes from the DDL returned by _drop_secondary_indexes"""
+        for ddl in index_ddl:
+            self.db.execute(text(ddl))
+        logger.info(f"Recreated {len(index_ddl)} indexes")
+
     def create_indexes(self):
         """Create additional indexes for performance"""
         logger.info("Creating additional indexes...")
 
         indexes = [
             "CREATE INDEX IF NOT EXISTS idx_daily_pm25_date_fips ON daily_pm25(date, fips);",
-            "CREATE INDEX IF NOT EXISTS idx_daily_pm25_fips_date ON daily_pm25(fips, date);",
-            "CREATE INDEX IF NOT EXISTS idx_daily_pm25_year_fips ON daily_pm25(EXTRACT(year FROM date), fips);",
-            "CREATE INDEX IF NOT EXISTS idx_daily_pm25_year_month_fips ON daily_pm25(EXTRACT(year FROM date), EXTRACT(month FROM date), fips);",
+            # Matches the (fips, date) ORDER BY of the daily download; INCLUDE lets it run index-only
+            "CREATE INDEX IF NOT EXISTS idx_daily_pm25_fips_date_covering ON daily_pm25(fips, date) INCLUDE (total, fire, nonfire);",
+            # year/month are stored generated columns, so these are plain column indexes
+            "CREATE INDEX IF NOT EXISTS idx_daily_pm25_year_fips ON daily_pm25(year, fips);",
+            "CREATE INDEX IF NOT EXISTS idx_daily_pm25_year_month_fips ON daily_pm25(year, month, fips);",
+            # Partial indexes holding only NULL/NaN rows, so validate_data's NaN counts are index lookups.
+            # PostgreSQL treats NaN as equal to itself, so the predicate is `= 'NaN'`, not `col <> col`.
+            "CREATE INDEX IF NOT EXISTS idx_daily_pm25_total_missing ON daily_pm25(total) WHERE total IS NULL OR total = 'NaN'::real;",
+            "CREATE INDEX IF NOT EXISTS idx_daily_pm25_fire_missing ON daily_pm25(fire) WHERE fire IS NULL OR fire = 'NaN'::real;",
+            "CREATE INDEX IF NOT EXISTS idx_daily_pm25_nonfire_missing ON daily_pm25(nonfire) WHERE nonfire IS NULL OR nonfire = 'NaN'::real;",
             "CREATE INDEX IF NOT EXISTS idx_yearly_summary_year ON yearly_pm25_summary(year);",
             "CREATE INDEX IF NOT EXISTS idx_monthly_summary_year_month ON monthly_pm25_summary(year, month);",
             "CREATE INDEX IF NOT EXISTS idx_seasonal_summary_year_season ON seasonal_pm25_summary(year, season);",
         ]
 
+        # Earlier builds indexed `col <> col`, which never matches in PostgreSQL
+        for name in ('idx_daily_pm25_total_nan', 'idx_daily_pm25_fire_nan', 'idx_daily_pm25_nonfire_nan'):
+            self.db.execute(text(f"DROP INDEX IF EXISTS {name}"))
+        self.db.commit()
+
         for index_sql in indexes:
             try:
                 self.db.execute(text(index_sql))
@@ -702,47 +1233,40 @@ class DataLoader:
         try:
             # Clear existing table
             logger.info("Clearing existing table...")
+            # Delete and reload in one transaction (a single commit at the end)
             self.db.query(BaselineMortalityRate).delete()
-            self.db.commit()
 
             df = pd.read_csv(filepath)
             # Clean column names
             df.columns = df.columns.str.strip().str.replace('"', '')
 
-            # Build county index -> FIPS mapping
-            county_mapping = {c.index: c.fips for c in self.db.query(
-                County.index, County.fips).all()}
-
-            records = []
-            for _, row in df.iterrows():
-                county_index = int(row['county'])
-                fips = county_mapping.get(county_index)
-                if not fips:
-                    logger.warning(
-                        f"County index {county_index} not found in counties table, skipping.")
-                    continue
-                record = BaselineMortalityRate(
-                    fips=fips,
-                    county_index=county_index,
-                    year=(int(row['year']) + 1999),
-                    age_group=int(row['age_group']),
-                    stat_type=str(row['stat']),
-                    value=float(row['value']),
-                    source=str(row['source']),
-                    allage_flag="allage" in str(row['source']).lower()
-                )
-                records.append(record)
-                if len(records) >= 1000:
-                    self.db.bulk_save_objects(records)
-                    self.db.commit()
-                    logger.info(
-                        f"Inserted {len(records)} baseline mortality records...")
-                    records = []
-            if records:
-                self.db.bulk_save_objects(records)
-                self.db.commit()
-                logger.info(
-                    f"Inserted final {len(records)} baseline mortality records.")
+            # Map county index -> FIPS for the whole column and drop unknown counties
+            df['county_index'] = df['county'].astype(int)
+            df['fips'] = df['county_index'].map(self._county_index_to_fips)
+            missing = df['fips'].isna()
+            if missing.any():
+                logger.warning(
+                    f"County indexes not found in counties table, skipping: {sorted(df.loc[missing, 'county_index'].unique())}")
+            df = df[~missing]
+
+            source = df['source'].astype(str)
+            records = pd.DataFrame({
+                'fips': df['fips'],
+                'county_index': df['county_index'],
+                'year': df['year'].astype(int) + 1999,
+                'age_group': df['age_group'].astype(int),
+                'stat_type': df['stat'].astype(int),
+                'value': df['value'].astype(float),
+                'source': source,
+                'allage_flag': source.str.lower().str.contains('allage', regex=False),
+            }, columns=BASELINE_MORTALITY_COLUMNS)
+
+            if not records.empty:
+                self._copy_frame(BaselineMortalityRate.__tablename__, records)
+            self.db.commit()
+            logger.info(
+                f"Inserted {len(records)} baseline mortality records.")
+            self._vacuum_analyze(BaselineMortalityRate.__tablename__)
             logger.info("Baseline mortality loading complete.")
         except Exception as e:
             logger.error(f"Error loading baseline mortality rates: {e}")
@@ -750,170 +1274,28 @@ class DataLoader:
             raise
 
     def preprocess_aggregations(self):
-        """Generate pre-aggregated tables for fast queries, including population-weighted metrics"""
+        """Refresh the pre-aggregated summary views for fast queries, including population-weighted metrics"""
         logger.info("Starting aggregation preprocessing...")
         try:
-            # Clear existing aggregations
-            logger.info("Clearing existing aggregations...")
-            self.db.query(YearlyPM25Summary).delete()
-            self.db.query(MonthlyPM25Summary).delete()
-            self.db.query(SeasonalPM25Summary).delete()
-            self.db.commit()
-
-            # Preload population data for all counties/years
-            logger.info("Preloading population data for all counties/years...")
-            pop_lookup = {}
-            for pop in self.db.query(Population).all():
-                pop_lookup[(pop.fips, pop.year)] = pop.population
-
-            # YEARLY AGGREGATIONS
-            logger.info("Processing yearly aggregations...")
-            yearly_results = self.db.execute(text("""
-                SELECT 
-                    fips,
-                    EXTRACT(year FROM date) as year,
-                    AVG(total) as avg_total,
-                    AVG(fire) as avg_fire,
-                    AVG(nonfire) as avg_nonfire,
-                    MAX(total) as max_total,
-                    MAX(fire) as max_fire,
-                    MAX(nonfire) as max_nonfire,
-                    COUNT(*) as days_count
-                FROM daily_pm25
-                GROUP BY fips, EXTRACT(year FROM date)
-            """)).fetchall()
-            yearly_summaries = []
-            for row in yearly_results:
-                fips = row.fips
-                year = int(row.year)
-                population = pop_lookup.get((fips, year), 0)
-                pop_weighted_total = (row.avg_total or 0) * \
-                    population if population else 0
-                pop_weighted_fire = (row.avg_fire or 0) * \
-                    population if population else 0
-                pop_weighted_nonfire = (
-                    row.avg_nonfire or 0) * population if population else 0
-                yearly_summaries.append(YearlyPM25Summary(
-                    fips=fips,
-                    year=year,
-                    avg_total=row.avg_total,
-                    avg_fire=row.avg_fire,
-                    avg_nonfire=row.avg_nonfire,
-                    max_total=row.max_total,
-                    max_fire=row.max_fire,
-                    max_nonfire=row.max_nonfire,
-                    days_count=row.days_count,
-                    pop_weighted_total=pop_weighted_total,
-                    pop_weighted_fire=pop_weighted_fire,
-                    pop_weighted_nonfire=pop_weighted_nonfire
-                ))
-            self.db.bulk_save_objects(yearly_summaries)
-            self.db.commit()
-
-            # MONTHLY AGGREGATIONS
-            logger.info("Processing monthly aggregations...")
-            monthly_results = self.db.execute(text("""
-                SELECT 
-                    fips,
-                    EXTRACT(year FROM date) as year,
-                    EXTRACT(month FROM date) as month,
-                    AVG(total) as avg_total,
-                    AVG(fire) as avg_fire,
-                    AVG(nonfire) as avg_nonfire,
-                    MAX(total) as max_total,
-                    MAX(fire) as max_fire,
-                    MAX(nonfire) as max_nonfire,
-                    COUNT(*) as days_count
-                FROM daily_pm25
-                GROUP BY fips, EXTRACT(year FROM date), EXTRACT(month FROM date)
-            """)).fetchall()
-            monthly_summaries = []
-            for row in monthly_results:
-                fips = row.fips
-                year = int(row.year)
-                month = int(row.month)
-                population = pop_lookup.get((fips, year), 0)
-                pop_weighted_total = (row.avg_total or 0) * \
-                    population if population else 0
-                pop_weighted_fire = (row.avg_fire or 0) * \
-                    population if population else 0
-                pop_weighted_nonfire = (
-                    row.avg_nonfire or 0) * population if population else 0
-                monthly_summaries.append(MonthlyPM25Summary(
-                    fips=fips,
-                    year=year,
-                    month=month,
-                    avg_total=row.avg_total,
-                    avg_fire=row.avg_fire,
-                    avg_nonfire=row.avg_nonfire,
-                    max_total=row.max_total,
-                    max_fire=row.max_fire,
-                    max_nonfire=row.max_nonfire,
-                    days_count=row.days_count,
-                    pop_weighted_total=pop_weighted_total,
-                    pop_weighted_fire=pop_weighted_fire,
-                    pop_weighted_nonfire=pop_weighted_nonfire
-                ))
-            self.db.bulk_save_objects(monthly_summaries)
-            self.db.commit()
-
-            # SEASONAL AGGREGATIONS
-            logger.info("Processing seasonal aggregations...")
-            seasonal_results = self.db.execute(text("""
-                SELECT 
-                    fips,
-                    EXTRACT(year FROM date) as year,
-                    CASE 
-                        WHEN EXTRACT(month FROM date) IN (12, 1, 2) THEN 'winter'
-                        WHEN EXTRACT(month FROM date) IN (3, 4, 5) THEN 'spring'
-                        WHEN EXTRACT(month FROM date) IN (6, 7, 8) THEN 'summer'
-                        ELSE 'fall'
-                    END as season,
-                    AVG(total) as avg_total,
-                    AVG(fire) as avg_fire,
-                    AVG(nonfire) as avg_nonfire,
-                    MAX(total) as max_total,
-                    MAX(fire) as max_fire,
-                    MAX(nonfire) as max_nonfire,
-                    COUNT(*) as days_count
-                FROM daily_pm25
-                GROUP BY fips, EXTRACT(year FROM date), 
-                    CASE 
-                        WHEN EXTRACT(month FROM date) IN (12, 1, 2) THEN 'winter'
-                        WHEN EXTRACT(month FROM date) IN (3, 4, 5) THEN 'spring'
-                        WHEN EXTRACT(month FROM date) IN (6, 7, 8) THEN 'summer'
-                        ELSE 'fall'
-                    END
-            """)).fetchall()
-            seasonal_summaries = []
-            for row in seasonal_results:
-                fips = row.fips
-                year = int(row.year)
-                season = row.season
-                population = pop_lookup.get((fips, year), 0)
-                pop_weighted_total = (row.avg_total or 0) * \
-                    population if population else 0
-                pop_weighted_fire = (row.avg_fire or 0) * \
-                    population if population else 0
-                pop_weighted_nonfire = (
-                    row.avg_nonfire or 0) * population if population else 0
-                seasonal_summaries.append(SeasonalPM25Summary(
-                    fips=fips,
-                    year=year,
-                    season=season,
-                    avg_total=row.avg_total,
-                    avg_fire=row.avg_fire,
-                    avg_nonfire=row.avg_nonfire,
-                    max_total=row.max_total,
-                    max_fire=row.max_fire,
-                    max_nonfire=row.max_nonfire,
-                    days_count=row.days_count,
-                    pop_weighted_total=pop_weighted_total,
-                    pop_weighted_fire=pop_weighted_fire,
-                    pop_weighted_nonfire=pop_weighted_nonfire
-                ))
-            self.db.bulk_save_objects(seasonal_summaries)
-            self.db.commit()
+            # The summaries are materialized views over daily_pm25 and population:
+            # each refresh is one aggregate scan in PostgreSQL. CONCURRENTLY keeps
+            # the previous contents readable by the API while it runs.
+            self._create_summary_views()
+            for model in SUMMARY_VIEWS:
+                table_name = model.__tablename__
+                logger.info(f"Refreshing {table_name}...")
+                # Serialize refreshes across workers; the lock and the parallel
+                # worker setting both end with the transaction
+                self.db.execute(text("SELECT pg_advisory_xact_lock(hashtext(:key))"),
+                                {'key': f"{table_name}_refresh"})
+                self.db.execute(text(
+                    f"SET LOCAL max_parallel_workers_per_gather = {REFRESH_PARALLEL_WORKERS}"))
+                self.db.execute(text(
+                    f"REFRESH MATERIALIZED VIEW CONCURRENTLY {table_name}"))
+                self.db.commit()
+                self._vacuum_analyze(table_name)
+                logger.info(
+                    f"{table_name} holds {self.db.query(model).count():,} rows")
 
             logger.info("All aggregations processed successfully!")
         except Exception as e:
@@ -929,7 +1311,7 @@ class DataLoader:
         logger.info(
             f"Computing excess mortality summary for all counties/years/age_groups using all methods...")
 
-        BATCH_SIZE = 1000
+        BATCH_SIZE = 50000
 
         # GEMM parameters (Burnett et al. 2018, NCD+LRI)
         theta_age = {
@@ -952,31 +1334,6 @@ class DataLoader:
             17: 0.1141,  # 80-84 years (est)
             18: 0.1141,  # 85+ years
         }
-        alpha = 1.6
-        mu = 15.5
-        nu = 36.8
-
-        # Pre-calculate omega cache for common z values
-        omega_cache = {}
-        for z_int in range(201):  # 0-200 μg/m³
-            z = float(z_int)
-            omega_cache[z] = 1 / (1 + np.exp(-(z - mu) / nu))
-
-        def omega(z):
-            z_rounded = round(z)
-            if z_rounded in omega_cache:
-                return omega_cache[z_rounded]
-            return 1 / (1 + np.exp(-(z - mu) / nu))
-
-        def HR(z, age_group):
-            return np.exp(theta_age[age_group] * np.log(1 + z / alpha) * omega(z))
-
-        # Life Expectancy Lookup Table for YLL calculation
-        LE_LOOKUP = {
-            1: 75.8, 2: 71.0, 3: 66.0, 4: 61.1, 5: 56.4, 6: 51.7,
-            7: 47.1, 8: 42.5, 9: 38.0, 10: 33.6, 11: 29.2, 12: 25.1,
-            13: 21.2, 14: 17.5, 15: 14.0, 16: 10.7, 17: 7.9, 18: 3.9
-        }
 
         def map_age_group_for_af(age_group):
             if 1 <= age_group <= 13:
@@ -994,275 +1351,167 @@ class DataLoader:
             else:
                 return None
 
-        # Efficient preloading with load_only
-        logger.info("Preloading yearly PM2.5 summaries...")
-        yearly_map = {}
-        for y in self.db.query(YearlyPM25Summary).options(
-            load_only(YearlyPM25Summary.fips, YearlyPM25Summary.year,
-                      YearlyPM25Summary.avg_total, YearlyPM25Summary.avg_fire,
-                      YearlyPM25Summary.avg_nonfire)
-        ).all():
-            yearly_map[(y.fips, y.year)] = y
+        # Per-age factors indexed by age_group (slot 0 stands for any age outside 1..18)
+        AGE_GROUPS = range(1, 19)
+        THETA_ARR = np.array([np.nan] + [theta_age[i] for i in AGE_GROUPS])
+        AF_GROUP = np.array([None] + [map_age_group_for_af(i) for i in AGE_GROUPS], dtype=object)
+        HR_GROUP = np.array([None] + [map_age_group_for_hr(i) for i in AGE_GROUPS], dtype=object)
 
-        logger.info(f"Loaded {len(yearly_map):,} PM2.5 summary records")
+        # Preload the three inputs as DataFrames for one vectorized join
+        logger.info("Preloading yearly PM2.5 summaries...")
+        yearly_df = self._query_frame(select(
+            YearlyPM25Summary.fips, YearlyPM25Summary.year,
+            YearlyPM25Summary.avg_total, YearlyPM25Summary.avg_fire,
+            YearlyPM25Summary.avg_nonfire))
+        logger.info(f"Loaded {len(yearly_df):,} PM2.5 summary records")
+
+        # The z-only part of the GEMM (omega and log terms) is shared by every age
+        # group of a county-year, so evaluate it once per PM2.5 summary row
+        yearly_df['shape_total'] = gemm_log_shape(
+            np.maximum(0, yearly_df['avg_total'].to_numpy(dtype=float) - 2.4))
+        yearly_df['shape_nonfire'] = gemm_log_shape(
+            np.maximum(0, yearly_df['avg_nonfire'].to_numpy(dtype=float) - 2.4))
 
-        # More efficient population preloading
         logger.info("Preloading population data...")
-        pop_map = defaultdict(dict)
-        for row in self.db.query(Population).filter(
-            Population.age_group != 0
-        ).options(load_only(Population.fips, Population.year,
-                            Population.age_group, Population.population)):
-            pop_map[(row.fips, row.year)][row.age_group] = row.population
-
-        # Convert to regular dict to save memory
-        pop_map = dict(pop_map)
-        logger.info(
-            f"Loaded population data for {len(pop_map):,} county-year combinations")
+        pop_df = self._query_frame(select(
+            Population.fips, Population.year,
+            Population.age_group, Population.population
+        ).where(Population.age_group != 0))
+        pop_df = pop_df.drop_duplicates(
+            ['fips', 'year', 'age_group'], keep='last')
+        logger.info(f"Loaded {len(pop_df):,} population records")
 
-        # Efficient baseline mortality preloading
         logger.info("Preloading baseline mortality rates...")
-        basemor_map = {}
-        baseline_query = self.db.query(BaselineMortalityRate).filter(
+        basemor_df = self._query_frame(select(
+            BaselineMortalityRate.fips, BaselineMortalityRate.year,
+            BaselineMortalityRate.age_group, BaselineMortalityRate.value.label('y0')
+        ).where(
             BaselineMortalityRate.source == 'basemor_ALL',
-            BaselineMortalityRate.stat_type == '1',
+            BaselineMortalityRate.stat_type == 1,
             BaselineMortalityRate.allage_flag == False
-        ).options(load_only(BaselineMortalityRate.fips, BaselineMortalityRate.year,
-                            BaselineMortalityRate.age_group, BaselineMortalityRate.value))
-
-        for row in baseline_query:
-            basemor_map[(row.fips, row.year, row.age_group)] = row.value
-
-        logger.info(f"Loaded {len(basemor_map):,} baseline mortality records")
-
-        # Efficient bootstrap data structure
-        logger.info("Building optimized bootstrap lookup...")
-        bootstrap_lookup = defaultdict(lambda: defaultdict(dict))
-
-        bootstrap_query = self.db.query(FireAttributionBin).filter(
-            FireAttributionBin.method == "bootstrapped_bin_hr"
-        ).options(load_only(FireAttributionBin.age_group, FireAttributionBin.bin_lower,
-                            FireAttributionBin.bin_upper, FireAttributionBin.bootid,
-                            FireAttributionBin.coef))
-
-        bootstrap_count = 0
-        for row in bootstrap_query:
-            if row.coef is not None:
-                bin_key = (row.bin_lower, row.bin_upper)
-                bootstrap_lookup[row.age_group][bin_key][row.bootid] = row.coef
-                bootstrap_count += 1
-
-        # Convert to regular dicts to save memory
-        bootstrap_lookup = {
-            age_group: {
-                bin_key: dict(bootid_dict)
-                for bin_key, bootid_dict in bins.items()
-            }
-            for age_group, bins in bootstrap_lookup.items()
-        }
+        ))
+        basemor_df = basemor_df.drop_duplicates(
+            ['fips', 'year', 'age_group'], keep='last')
+        logger.info(f"Loaded {len(basemor_df):,} baseline mortality records")
 
-        logger.info(f"Loaded {bootstrap_count:,} bootstrap coefficients")
-
-        # Efficient precomputed lookup
-        logger.info("Building optimized precomputed AF lookup...")
-        precomputed_lookup = defaultdict(dict)
-        precomputed_query = self.db.query(FireAttributionBin).filter(
-            FireAttributionBin.method == "precomputed_bin_af",
-            FireAttributionBin.cause == "Nonaccidental"
-        ).options(load_only(FireAttributionBin.age_group, FireAttributionBin.bin_lower,
-                            FireAttributionBin.bin_upper, FireAttributionBin.af))
-
-        precomputed_count = 0
-        for row in precomputed_query:
-            if row.af is not None:
-                bin_key = (row.bin_lower, row.bin_upper)
-                precomputed_lookup[row.age_group][bin_key] = row.af
-                precomputed_count += 1
-
-        precomputed_lookup = dict(precomputed_lookup)
-        logger.info(f"Loaded {precomputed_count:,} precomputed AF values")
-
-        # Clear existing data
-        self.db.query(ExcessMortalitySummary).delete()
-        logger.info("Cleared excess mortality summary table...")
-        to_insert = []
+        # Fire attribution bins as dense arrays (coef_arr[age_idx, bin_idx, bootid - 1])
+        boot_ages, boot_lowers, boot_uppers, coef_arr, prec_bins = self._fire_bins
+        logger.info(f"Loaded {int(np.count_nonzero(~np.isnan(coef_arr))):,} bootstrap coefficients")
+        logger.info(f"Loaded {sum(len(af) for _, _, af in prec_bins.values()):,} precomputed AF values")
 
         logger.info("Starting excess mortality computation...")
-        processed_records = 0
-        batch_count = 0
-
-        for (fips, year), age_dict in pop_map.items():
-            yearly = yearly_map.get((fips, year))
-            if not yearly:
-                continue
-
-            pm25 = yearly.avg_total
-            pm25_fire = yearly.avg_fire
-            pm25_nonfire = yearly.avg_nonfire
-
-            z = max(0, pm25 - 2.4)
-            z_nonfire = max(0, pm25_nonfire - 2.4)
-
-            for age_group, pop in age_dict.items():
-                y0 = basemor_map.get((fips, year, age_group), 0)
-                if pop is None or y0 is None or pop == 0 or y0 == 0:
-                    continue
 
-                # Initialize all method results
-                results = {}
-
-                # === GEMM METHOD ===
-                if age_group < 6:
-                    hr_total = 1
-                    hr_nonfire = 1
-                else:
-                    hr_total = HR(z, age_group)
-                    hr_nonfire = HR(z_nonfire, age_group)
-
-                total_gemm = pop * y0 * \
-                    (1 - 1/hr_total) if np.isfinite(hr_total) and hr_total != 0 else 0.0
-                nonfire_gemm = pop * y0 * \
-                    (1 - 1/hr_nonfire) if np.isfinite(hr_nonfire) and hr_nonfire != 0 else 0.0
-                fire_gemm = total_gemm - nonfire_gemm
-
-                results['gemm'] = {
-                    'total': total_gemm,
-                    'fire': fire_gemm,
-                    'nonfire': nonfire_gemm
-                }
-
-                # === BOOTSTRAPPED METHOD, QIU ===
-                hr_age_group = map_age_group_for_hr(age_group)
-                fire_boot_values = []
-
-                if hr_age_group is None or hr_age_group not in bootstrap_lookup:
-                    fire_boot = 0.0
-                else:
-                    # Find matching bin
-                    matching_bin = None
-                    for bin_key in bootstrap_lookup[hr_age_group]:
-                        bl, bu = bin_key
-                        if bl <= pm25_fire < bu:
-                            matching_bin = bin_key
-                            break
-
-                    if matching_bin is None:
-                        fire_boot = 0.0
-                    else:
-                        bootid_dict = bootstrap_lookup[hr_age_group][matching_bin]
-
-                        # Use ALL 500 bootstrap replicates
-                        for bootid in range(1, 501):
-                            coef = bootid_dict.get(bootid)
-                            if coef is None:
-                                fire_boot_values.append(0.0)
-                            else:
-                                rr = math.exp(coef)
-                                af = (rr - 1) / rr
-                                fire_boot_values.append(pop * y0 * af)
-
-                        fire_boot = sum(
-                            fire_boot_values) / len(fire_boot_values) if fire_boot_values else 0.0
-
-                total_boot = fire_boot + nonfire_gemm
-
-                results['boot'] = {
-                    'total': total_boot,
-                    'fire': fire_boot,
-                    'nonfire': nonfire_gemm
-                }
-
-                # === PRECOMPUTED METHOD, MA ===
-                af_age_group = map_age_group_for_af(age_group)
-                if af_age_group is None or af_age_group not in precomputed_lookup:
-                    fire_prec = 0.0
-                else:
-                    # Find matching AF bin
-                    af_value = None
-                    for bin_key, af in precomputed_lookup[af_age_group].items():
-                        bl, bu = bin_key
-                        if bl <= pm25_fire < bu:
-                            af_value = af
-                            break
-
-                    if af_value is None:
-                        fire_prec = 0.0
-                    else:
-                        fire_prec = pop * y0 * af_value
-
-                total_prec = fire_prec + nonfire_gemm
-
-                results['prec'] = {
-                    'total': total_prec,
-                    'fire': fire_prec,
-                    'nonfire': nonfire_gemm
-                }
-
-                # Get life expectancy
-                le = LE_LOOKUP.get(age_group, 0)
-
-                # Set legacy columns based on default method
-                default_results = results[default_method]
-
-                to_insert.append(ExcessMortalitySummary(
-                    fips=fips,
-                    year=year,
-                    age_group=age_group,
-                    population=pop,
-
-                    # Legacy columns (for backward compatibility)
-                    total_excess=default_results['total'],
-                    fire_excess=default_results['fire'],
-                    nonfire_excess=default_results['nonfire'],
-                    yll_total=default_results['total'] * le,
-                    yll_fire=default_results['fire'] * le,
-                    yll_nonfire=default_results['nonfire'] * le,
-
-                    # Method-specific columns
-                    total_gemm=results['gemm']['total'],
-                    fire_gemm=results['gemm']['fire'],
-                    nonfire_gemm=results['gemm']['nonfire'],
-                    yll_total_gemm=results['gemm']['total'] * le,
-                    yll_fire_gemm=results['gemm']['fire'] * le,
-                    yll_nonfire_gemm=results['gemm']['nonfire'] * le,
-
-                    total_boot=results['boot']['total'],
-                    fire_boot=results['boot']['fire'],
-                    yll_total_boot=results['boot']['total'] * le,
-                    yll_fire_boot=results['boot']['fire'] * le,
-
-                    total_prec=results['prec']['total'],
-                    fire_prec=results['prec']['fire'],
-                    yll_total_prec=results['prec']['total'] * le,
-                    yll_fire_prec=results['prec']['fire'] * le,
-                ))
-
-                processed_records += 1
-
-                # Commit in smaller batches
-                if len(to_insert) >= BATCH_SIZE:
-                    batch_count += 1
-                    batch_start_time = time.time()
-
-                    self.db.bulk_save_objects(to_insert)
-                    self.db.commit()
-
-                    batch_time = time.time() - batch_start_time
-                    logger.info(f"Batch {batch_count}: Inserted {len(to_insert):,} records in {batch_time:.1f}s "
-                                f"(Total processed: {processed_records:,})")
-                    to_insert = []
-
-        # Insert remaining records
-        if to_insert:
-            batch_count += 1
-            batch_start_time = time.time()
-
-            self.db.bulk_save_objects(to_insert)
+        # One row per (fips, year, age_group) with population, PM2.5 and y0
+        frame = pop_df.merge(yearly_df, on=['fips', 'year'], how='inner')
+        frame = frame.merge(
+            basemor_df, on=['fips', 'year', 'age_group'], how='left')
+        frame = frame[frame['population'].notna() & (frame['population'] != 0) &
+                      frame['y0'].notna() & (frame['y0'] != 0)].reset_index(drop=True)
+
+        age_group = frame['age_group'].to_numpy()
+        age_idx = np.where((age_group >= 1) & (age_group <= 18), age_group, 0)
+        base = frame['population'].to_numpy(dtype=float) * \
+            frame['y0'].to_numpy(dtype=float)
+        pm25_fire = frame['avg_fire'].to_numpy(dtype=float)
+        shape_total = frame['shape_total'].to_numpy(dtype=float)
+        shape_nonfire = frame['shape_nonfire'].to_numpy(dtype=float)
+
+        # === GEMM METHOD === (HR = 1 below age group 6)
+        theta = THETA_ARR[age_idx]
+        gemm_ages = age_group >= 6
+        total_gemm = np.empty_like(base)
+        nonfire_gemm = np.empty_like(base)
+
+        def gemm_shard(rows):
+            # Rows are independent, so each thread fills its own slice of the outputs
+            total_gemm[rows] = gemm_excess(
+                base[rows], shape_total[rows], theta[rows], gemm_ages[rows])
+            nonfire_gemm[rows] = gemm_excess(
+                base[rows], shape_nonfire[rows], theta[rows], gemm_ages[rows])
+
+        shard_size = max(1, -(-len(base) // EXCESS_MORTALITY_WORKERS))
+        with ThreadPoolExecutor(max_workers=EXCESS_MORTALITY_WORKERS) as pool:
+            for future in as_completed([
+                    pool.submit(gemm_shard, slice(start, start + shard_size))
+                    for start in range(0, len(base), shard_size)]):
+                future.result()
+        fire_gemm = total_gemm - nonfire_gemm
+
+        def apply_bins(out, rows, lowers, uppers, af):
+            # Binary-search each row's fire PM2.5 into the sorted bins
+            # (bl <= pm25_fire < bu) and set out = pop * y0 * AF of that bin
+            rows = np.flatnonzero(rows)
+            idx = find_bins(pm25_fire[rows], lowers, uppers)
+            hit = idx >= 0
+            out[rows[hit]] = base[rows[hit]] * af[idx[hit]]
+
+        # === BOOTSTRAPPED METHOD, QIU ===
+        # Mean AF over all 500 replicates; a missing replicate counts as 0
+        boot_af, boot_present = bootstrap_af(coef_arr)
+
+        fire_boot = np.zeros_like(base)
+        hr_groups = HR_GROUP[age_idx]
+        for boot_idx, hr_age_group in enumerate(boot_ages):
+            present = boot_present[boot_idx]
+            apply_bins(fire_boot, hr_groups == hr_age_group, boot_lowers[present],
+                       boot_uppers[present], boot_af[boot_idx, present])
+        total_boot = fire_boot + nonfire_gemm
+
+        # === PRECOMPUTED METHOD, MA ===
+        fire_prec = np.zeros_like(base)
+        af_groups = AF_GROUP[age_idx]
+        for af_age_group, (lowers, uppers, af) in prec_bins.items():
+            apply_bins(fire_prec, af_groups == af_age_group, lowers, uppers, af)
+        total_prec = fire_prec + nonfire_gemm
+
+        summary = pd.DataFrame({
+            'fips': frame['fips'],
+            'year': frame['year'],
+            'age_group': frame['age_group'],
+            'population': frame['population'].astype(int),
+
+            # Method-specific columns (legacy columns are resolved via excess_mortality_settings;
+            # YLL is derived from these at query time, see ExcessMortalitySummary)
+            'total_gemm': total_gemm,
+            'fire_gemm': fire_gemm,
+            'nonfire_gemm': nonfire_gemm,
+
+            'total_boot': total_boot,
+            'fire_boot': fire_boot,
+
+            'total_prec': total_prec,
+            'fire_prec': fire_prec,
+        }, columns=EXCESS_MORTALITY_COLUMNS)
+
+        processed_records = len(summary)
+        batch_count = 0
+        try:
+            # Derived table rebuilt from scratch in one transaction (clear, index drop,
+            # inserts, index rebuild), committed without waiting on the WAL flush; a
+            # failure rolls back to the previous contents and indexes
+            self.db.execute(text("SET LOCAL synchronous_commit = off"))
+            self.db.query(ExcessMortalitySummary).delete()
+            logger.info("Cleared excess mortality summary table...")
+            # Build the secondary indexes once after the load instead of row by row
+            index_ddl = self._drop_secondary_indexes(ExcessMortalitySummary.__tablename__)
+            for start in range(0, processed_records, BATCH_SIZE):
+                batch = summary.iloc[start:start + BATCH_SIZE]
+                batch_count += 1
+                batch_start_time = time.time()
+
+                self._bulk_copy(ExcessMortalitySummary, batch)
+
+                batch_time = time.time() - batch_start_time
+                logger.info(f"Batch {batch_count}: Inserted {len(batch):,} records in {batch_time:.1f}s "
+                            f"(Total processed: {start + len(batch):,})")
+            self._recreate_indexes(index_ddl)
             self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
 
-            batch_time = time.time() - batch_start_time
-            logger.info(
-                f"Final batch {batch_count}: Inserted {len(to_insert):,} records in {batch_time:.1f}s")
+        # Legacy columns follow the configured default method
+        self.switch_default_method(default_method)
 
         logger.info(f"Excess mortality summary computation complete. "
                     f"Total records processed: {processed_records:,} in {batch_count} batches")
@@ -1270,40 +1519,16 @@ class DataLoader:
     def switch_default_method(self, new_method="gemm"):
         """Switch which method is used for the legacy total_excess/fire_excess columns.
         new_method: 'gemm', 'boot', or 'prec'"""
+        if new_method not in ("gemm", "boot", "prec"):
+            raise ValueError(f"Unknown method: {new_method}")
+
         logger.info(f"Switching default method to {new_method}...")
 
-        if new_method == "gemm":
-            self.db.execute(text("""
-                UPDATE excess_mortality_summary SET
-                total_excess = total_gemm,
-                fire_excess = fire_gemm,
-                nonfire_excess = nonfire_gemm,
-                yll_total = yll_total_gemm,
-                yll_fire = yll_fire_gemm,
-                yll_nonfire = yll_nonfire_gemm
-            """))
-        elif new_method == "boot":
-            self.db.execute(text("""
-                UPDATE excess_mortality_summary SET
-                total_excess = total_boot,
-                fire_excess = fire_boot,
-                nonfire_excess = nonfire_gemm,
-                yll_total = yll_total_boot,
-                yll_fire = yll_fire_boot,
-                yll_nonfire = yll_nonfire_gemm
-            """))
-        elif new_method == "prec":
-            self.db.execute(text("""
-                UPDATE excess_mortality_summary SET
-                total_excess = total_prec,
-                fire_excess = fire_prec,
-                nonfire_excess = nonfire_gemm,
-                yll_total = yll_total_prec,
-                yll_fire = yll_fire_prec,
-                yll_nonfire = yll_nonfire_gemm
-            """))
-        else:
-            raise ValueError(f"Unknown method: {new_method}")
+        # The legacy columns read the method from excess_mortality_settings, so this is
+        # a single-row upsert (row id 1) instead of rewriting every summary row
+        stmt = pg_insert(ExcessMortalitySettings).values(id=1, default_method=new_method)
+        self.db.execute(stmt.on_conflict_do_update(
+            index_elements=['id'], set_={'default_method': stmt.excluded.default_method}))
 
         self.db.commit()
         logger.info(f"Default method switched to {new_method}")
@@ -1317,58 +1542,42 @@ class DataLoader:
         try:
             # Clear existing table
             logger.info("Clearing existing exceedance summary table...")
+            # Delete and reload in one transaction (a single commit at the end)
             self.db.query(ExceedanceSummary).delete()
-            self.db.commit()
-
-            # Build FIPS -> county_index mapping
-            county_mapping = {c.fips: c.index for c in self.db.query(
-                County.fips, County.index).all()}
 
             df = pd.read_csv(filepath, dtype={"FIPS": str})
             df.columns = df.columns.str.strip().str.replace('"', '')
             logger.info(f"CSV columns: {list(df.columns)}")
 
-            records = []
-            processed_count = 0
-            matched_count = 0
-            for _, row in df.iterrows():
-                processed_count += 1
-                fips = str(row["FIPS"]).zfill(5)
-                county_index = county_mapping.get(fips)
-                if not county_index:
-                    logger.warning(
-                        f"FIPS {fips} not found in counties table, skipping.")
-                    continue
-                # Handle NA values as None
-
-                def parse_int(val):
-                    if pd.isna(val) or val == "NA":
-                        return None
-                    try:
-                        return int(val)
-                    except Exception:
-                        return None
-                threshold_9 = parse_int(row.get("Threshold_9ugm3"))
-                threshold_8 = parse_int(row.get("Threshold_8ugm3"))
-                record = ExceedanceSummary(
-                    fips=fips,
-                    county_index=county_index,
-                    threshold_9=threshold_9,
-                    threshold_8=threshold_8
-                )
-                records.append(record)
-                matched_count += 1
-                if len(records) >= 1000:
-                    self.db.bulk_save_objects(records)
-                    self.db.commit()
-                    logger.info(
-                        f"Inserted batch of {len(records)} exceedance summary records...")
-                    records = []
-            if records:
-                self.db.bulk_save_objects(records)
-                self.db.commit()
+            processed_count = len(df)
+            df['fips'] = df['FIPS'].astype(str).str.zfill(5)
+            df['county_index'] = df['fips'].map(self._county_fips_to_index)
+            missing = df['county_index'].isna()
+            if missing.any():
+                logger.warning(
+                    f"FIPS not found in counties table, skipping: {sorted(df.loc[missing, 'fips'])}")
+            df = df[~missing]
+
+            def parse_int(column):
+                # Integer counts; "NA", blanks and unparsable values become None
+                if column not in df:
+                    return [None] * len(df)
+                values = np.trunc(pd.to_numeric(df[column], errors='coerce'))
+                return [None if pd.isna(v) else int(v) for v in values]
+
+            records = pd.DataFrame({
+                'fips': df['fips'],
+                'county_index': df['county_index'].astype(int),
+                'threshold_9': pd.Series(parse_int("Threshold_9ugm3"), index=df.index, dtype=object),
+                'threshold_8': pd.Series(parse_int("Threshold_8ugm3"), index=df.index, dtype=object),
+            })
+            matched_count = len(records)
+            if matched_count:
+                # None thresholds are written as empty CSV fields, which COPY reads as NULL
+                self._copy_frame(ExceedanceSummary.__tablename__, records)
                 logger.info(
-                    f"Inserted final batch of {len(records)} exceedance summary records.")
+                    f"Inserted {matched_count} exceedance summary records.")
+            self.db.commit()
             logger.info(
                 f"Exceedance summary loading complete. Processed: {processed_count}, Inserted: {matched_count}")
         except Exception as e:
@@ -1386,188 +1595,173 @@ class DataLoader:
             f"Calculating decomposition summary for all counties ({start_year}-{end_year})...")
 
         self.db.query(DecompositionSummary).delete()
-        self.db.commit()
 
         all_fips = [c.fips for c in self.db.query(County.fips).all()]
         to_insert = []
 
-        # Define GEMM functions to match your corrected method
-        def omega(z):
-            mu, nu = 15.5, 36.8
-            return 1 / (1 + np.exp(-(z - mu) / nu))
-
+        # GEMM theta per age group (shape parameters are the module-level GEMM_* ones)
         theta_age = {
             1:  0.1430, 2:  0.1430, 3:  0.1430, 4:  0.1430, 5:  0.1430,
             6:  0.1585, 7:  0.1577, 8:  0.1570, 9:  0.1558, 10: 0.1532,
             11: 0.1499, 12: 0.1462, 13: 0.1421, 14: 0.1374, 15: 0.1319,
             16: 0.1253, 17: 0.1141, 18: 0.1141,
         }
-        alpha = 1.6
 
-        def HR(z, age_group):
-            # Apply age restriction like your corrected method
-            if age_group < 6:
-                return 1.0
-            return np.exp(theta_age[age_group] * np.log(1 + z / alpha) * omega(z))
+        CANONICAL_AGE_GROUPS = tuple(sorted(theta_age))
 
-        def AF(pm25_value, age_group):
-            # Subtract 2.4 from PM2.5 like your corrected method
-            z = max(0, pm25_value - 2.4)
-            hr = HR(z, age_group)
-            if not np.isfinite(hr) or hr == 0:
-                return 0.0
-            return 1 - 1/hr
-
-        for idx, fips in enumerate(all_fips):
-            # Load data for both years for this county
-            pop_start = {row.age_group: row.population for row in self.db.query(
-                Population).filter_by(fips=fips, year=start_year)}
-            pop_end = {row.age_group: row.population for row in self.db.query(
-                Population).filter_by(fips=fips, year=end_year)}
-
-            # Use proper filter for mortality data
-            mort_start = {row.age_group: row.value for row in self.db.query(BaselineMortalityRate).filter(
-                BaselineMortalityRate.fips == fips,
-                BaselineMortalityRate.year == start_year,
-                BaselineMortalityRate.source == 'basemor_ALL',
-                BaselineMortalityRate.stat_type == '1',  # Use '1' not 'mean'
-                BaselineMortalityRate.allage_flag == False
-            )}
-            mort_end = {row.age_group: row.value for row in self.db.query(BaselineMortalityRate).filter(
-                BaselineMortalityRate.fips == fips,
-                BaselineMortalityRate.year == end_year,
-                BaselineMortalityRate.source == 'basemor_ALL',
-                BaselineMortalityRate.stat_type == '1',  # Use '1' not 'mean'
-                BaselineMortalityRate.allage_flag == False
-            )}
-
-            pm25_start = self.db.query(YearlyPM25Summary).filter_by(
-                fips=fips, year=start_year).first()
-            pm25_end = self.db.query(YearlyPM25Summary).filter_by(
-                fips=fips, year=end_year).first()
-
-            # Validation checks
-            if not pop_start:
-                logger.warning(
-                    f"Skipping county {fips}: missing population for {start_year}")
-                continue
-            if not pop_end:
-                logger.warning(
-                    f"Skipping county {fips}: missing population for {end_year}")
-                continue
-            if not mort_start:
-                logger.warning(
-                    f"Skipping county {fips}: missing baseline mortality for {start_year}")
-                continue
-            if not mort_end:
-                logger.warning(
-                    f"Skipping county {fips}: missing baseline mortality for {end_year}")
-                continue
-            if not pm25_start:
-                logger.warning(
-                    f"Skipping county {fips}: missing PM2.5 for {start_year}")
-                continue
-            if not pm25_end:
-                logger.warning(
-                    f"Skipping county {fips}: missing PM2.5 for {end_year}")
-                continue
+        # theta indexed by age group (groups below 6 have HR = 1)
+        theta_arr = np.array([theta_age.get(a, 0.0) for a in range(19)])
 
-            age_groups = sorted(set(pop_start) & set(
-                pop_end) & set(mort_start) & set(mort_end))
-            if not age_groups:
-                logger.warning(
-                    f"Skipping county {fips}: no overlapping age groups in all datasets")
-                continue
-
-            # Convert to vectors for efficient computation
-            pop_start_vec = np.array([pop_start[a] for a in age_groups])
-            pop_end_vec = np.array([pop_end[a] for a in age_groups])
-            y0_start_vec = np.array([mort_start[a] for a in age_groups])
-            y0_end_vec = np.array([mort_end[a] for a in age_groups])
-
-            # Process both total and fire PM2.5 decompositions
-            pm25_types = {
-                'total': (pm25_start.avg_total, pm25_end.avg_total),
-                'fire': None  # Will be calculated as total - nonfire
-            }
+        all_ages = np.arange(19)
 
-            # Calculate fire PM2.5 as total - nonfire (matching your corrected method)
-            if hasattr(pm25_start, 'avg_nonfire') and hasattr(pm25_end, 'avg_nonfire'):
-                fire_start = pm25_start.avg_total - pm25_start.avg_nonfire
-                fire_end = pm25_end.avg_total - pm25_end.avg_nonfire
-                pm25_types['fire'] = (fire_start, fire_end)
-            else:
+        def AF_table(pm25_values):
+            # AF over all age groups (columns) for each PM2.5 value (rows)
+            # Subtract 2.4 from PM2.5 like your corrected method
+            z = np.maximum(np.asarray(pm25_values, dtype=float) - 2.4, 0.0)
+            # omega and the log term depend on z only: evaluate them once per
+            # value, then scale by theta for every age group
+            shape = gemm_log_shape(z)
+            log_hr = np.where(all_ages >= 6, np.multiply.outer(shape, theta_arr), 0.0)
+            # A non-finite log(HR) is treated as HR = 1, i.e. AF = 0
+            log_hr = np.where(np.isfinite(log_hr), log_hr, 0.0)
+            # AF = 1 - 1/HR = -expm1(-log HR), without cancellation for HR close to 1
+            return -np.expm1(-log_hr)
+
+        # Load both years for every county up front (one query per table) into
+        # dense [year (0 = start, 1 = end), county row, age_group] arrays; NaN = missing
+        years = (start_year, end_year)
+        fips_index = pd.Index(all_fips)
+        canonical_ages = np.array(CANONICAL_AGE_GROUPS)
+
+        def dense(frame, value_column):
+            arr = np.full((2, len(all_fips), len(all_ages)), np.nan)
+            rows = fips_index.get_indexer(frame['fips'])
+            ages = frame['age_group'].to_numpy(dtype=np.int64)
+            keep = (rows >= 0) & (ages >= 0) & (ages < len(all_ages))
+            arr[(frame['year'].to_numpy() == end_year)[keep].astype(int), rows[keep],
+                ages[keep]] = frame[value_column].to_numpy(dtype=float)[keep]
+            return arr
+
+        pop_arr = dense(self._query_frame(select(
+            Population.fips, Population.year, Population.age_group, Population.population
+        ).where(Population.year.in_(years))), 'population')
+
+        # Use proper filter for mortality data
+        mort_arr = dense(self._query_frame(select(
+            BaselineMortalityRate.fips, BaselineMortalityRate.year,
+            BaselineMortalityRate.age_group, BaselineMortalityRate.value
+        ).where(
+            BaselineMortalityRate.year.in_(years),
+            BaselineMortalityRate.source == 'basemor_ALL',
+            BaselineMortalityRate.stat_type == 1,  # 1 = mean
+            BaselineMortalityRate.allage_flag == False
+        )), 'value')
+        has_pop = ~np.isnan(pop_arr).all(axis=2)
+        has_mort = ~np.isnan(mort_arr).all(axis=2)
+        # Canonical age groups present in all four inputs, per county
+        age_present = ~(np.isnan(pop_arr[:, :, canonical_ages]).any(axis=0) |
+                        np.isnan(mort_arr[:, :, canonical_ages]).any(axis=0))
+
+        # The fire decomposition needs avg_nonfire; resolve the schema once
+        has_nonfire = hasattr(YearlyPM25Summary, 'avg_nonfire')
+        if not has_nonfire:
+            logger.warning(
+                "YearlyPM25Summary has no avg_nonfire column, skipping fire decomposition")
+        pm25_columns = [YearlyPM25Summary.fips, YearlyPM25Summary.year, YearlyPM25Summary.avg_total]
+        if has_nonfire:
+            pm25_columns.append(YearlyPM25Summary.avg_nonfire)
+
+        # Yearly PM2.5 for both years as [year, county row] arrays (one query,
+        # no per-county lookups); NaN = missing
+        pm25_df = self._query_frame(select(*pm25_columns).where(
+            YearlyPM25Summary.year.in_(years))).drop_duplicates(['fips', 'year'])
+        pm25_rows = fips_index.get_indexer(pm25_df['fips'])
+        pm25_keep = pm25_rows >= 0
+        pm25_years = (pm25_df['year'].to_numpy() == end_year)[pm25_keep].astype(int)
+
+        def by_year(column):
+            arr = np.full((2, len(all_fips)), np.nan)
+            arr[pm25_years, pm25_rows[pm25_keep]] = \
+                pm25_df[column].to_numpy(dtype=float)[pm25_keep]
+            return arr
+
+        total_arr = by_year('avg_total')
+        nonfire_arr = by_year('avg_nonfire') if has_nonfire else None
+
+        # One combined validity mask; each stage logs how many counties it drops
+        has_pm25 = ~np.isnan(total_arr)
+        checks = [
+            (has_pop[0], f"missing population for {start_year}"),
+            (has_pop[1], f"missing population for {end_year}"),
+            (has_mort[0], f"missing baseline mortality for {start_year}"),
+            (has_mort[1], f"missing baseline mortality for {end_year}"),
+            (has_pm25[0], f"missing PM2.5 for {start_year}"),
+            (has_pm25[1], f"missing PM2.5 for {end_year}"),
+            (age_present.any(axis=1), "no overlapping age groups in all datasets"),
+        ]
+        valid = np.ones(len(all_fips), dtype=bool)
+        for ok, reason in checks:
+            dropped = valid & ~ok
+            if dropped.any():
+                logger.warning(f"Skipping {int(dropped.sum())} counties: {reason}")
+            valid &= ok
+
+        # Decompose every valid county at once over the canonical age groups;
+        # age groups missing from any input are zeroed out
+        rows = np.flatnonzero(valid)
+        present = age_present[rows]
+
+        def by_county(arr, year):
+            return np.where(present, arr[year][np.ix_(rows, canonical_ages)], 0.0)
+
+        pop_start_mat = by_county(pop_arr, 0)
+        pop_end_mat = by_county(pop_arr, 1)
+        y0_start_mat = by_county(mort_arr, 0)
+        y0_end_mat = by_county(mort_arr, 1)
+
+        valid_fips = [all_fips[i] for i in rows]
+        total_start = total_arr[0, rows]
+        total_end = total_arr[1, rows]
+
+        # Use the age_group field to store PM2.5 type without changing the model
+        # age_group = -1 for total PM2.5, age_group = -2 for fire PM2.5
+        pm25_types = {-1: (total_start, total_end, np.ones(len(rows), dtype=bool))}
+        if has_nonfire:
+            # Fire PM2.5 as total - nonfire (matching your corrected method)
+            fire_start = total_start - nonfire_arr[0, rows]
+            fire_end = total_end - nonfire_arr[1, rows]
+            fire_ok = np.isfinite(fire_start) & np.isfinite(fire_end)
+            if not fire_ok.all():
                 logger.warning(
-                    f"County {fips}: missing nonfire PM2.5 data, skipping fire decomposition")
-
-            for pm25_type, pm25_values in pm25_types.items():
-                if pm25_values is None:
-                    continue
-
-                z_start, z_end = pm25_values
-
-                # Calculate AF vectors for this PM2.5 type
-                AF_start_vec = np.array([AF(z_start, a) for a in age_groups])
-                AF_end_vec = np.array([AF(z_end, a) for a in age_groups])
-
-                # Decomposition calculation (matching your corrected method)
-                total_pop_start = pop_start_vec.sum()
-                total_pop_end = pop_end_vec.sum()
-                age_shares_start = pop_start_vec / total_pop_start
-                pop_A = age_shares_start * total_pop_end
-
-                # Step A: Population growth (2023 total pop, 2006 age structure, 2006 mortality, 2006 exposure)
-                A = (pop_A * y0_start_vec * AF_start_vec).sum()
-                # Step B: Population aging (2023 pop structure, 2006 mortality, 2006 exposure)
-                B = (pop_end_vec * y0_start_vec * AF_start_vec).sum()
-                # Step C: Mortality change (2023 pop structure, 2023 mortality, 2006 exposure)
-                C = (pop_end_vec * y0_end_vec * AF_start_vec).sum()
-                # Step D: Exposure change (2023 pop structure, 2023 mortality, 2023 exposure)
-                D = (pop_end_vec * y0_end_vec * AF_end_vec).sum()
-
-                total_burden_start = (
-                    pop_start_vec * y0_start_vec * AF_start_vec).sum()
-
-                # calculate changes and contributions
-                total_change = D - total_burden_start
-                pop_growth = (A - total_burden_start) / \
-                    total_change * 100 if total_change != 0 else 0
-                ageing = (B - A) / total_change * \
-                    100 if total_change != 0 else 0
-                mortality = (C - B) / total_change * \
-                    100 if total_change != 0 else 0
-                exposure = (D - C) / total_change * \
-                    100 if total_change != 0 else 0
-                total_change = total_change / total_burden_start * \
-                    100 if total_burden_start != 0 else 0
-
-                # Use the age_group field to store PM2.5 type without changing the model
-                # age_group = -1 for total PM2.5, age_group = -2 for fire PM2.5
-                age_group_code = -1 if pm25_type == 'total' else -2
-
-                decomp = DecompositionSummary(
-                    fips=fips,
-                    start_year=start_year,
-                    end_year=end_year,
-                    age_group=age_group_code,  # Use negative values to distinguish PM2.5 types
-                    population_growth=pop_growth,
-                    population_ageing=ageing,
-                    baseline_mortality_change=mortality,
-                    exposure_change=exposure,
-                    total_change=total_change
-                )
-                to_insert.append(decomp)
-
-            if len(to_insert) >= 1000:
-                self.db.bulk_save_objects(to_insert)
-                self.db.commit()
-                to_insert = []
-            if idx % 100 == 0:
-                logger.info(f"Processed {idx} counties...")
-
-        if to_insert:
-            self.db.bulk_save_objects(to_insert)
+                    f"{int((~fire_ok).sum())} counties missing nonfire PM2.5 data, skipping their fire decomposition")
+            pm25_types[-2] = (fire_start, fire_end, fire_ok)
+
+        for age_group_code, (z_start, z_end, ok) in pm25_types.items():
+            # AF matrices for this PM2.5 type, (n_counties, n_age)
+            AF_start_mat = AF_table(z_start)[:, canonical_ages]
+            AF_end_mat = AF_table(z_end)[:, canonical_ages]
+
+            # Decomposition calculation (matching your corrected method)
+            results = decompose(pop_start_mat, pop_end_mat, y0_start_mat, y0_end_mat,
+                                AF_start_mat, AF_end_mat)
+            to_insert.extend(
+                (fips, start_year, end_year, age_group_code, *values)
+                for fips, keep, *values in zip(valid_fips, ok, *(r.tolist() for r in results))
+                if keep)
+
+        logger.info(f"Decomposed {len(rows)} of {len(all_fips)} counties")
+
+        # COPY all rows at once, in the same transaction as the DELETE; a failed
+        # COPY rolls back the DELETE too, leaving the previous summary in place
+        try:
+            if to_insert:
+                self._copy_frame(DecompositionSummary.__tablename__,
+                                 pd.DataFrame(to_insert, columns=DECOMPOSITION_COLUMNS))
             self.db.commit()
+        except Exception as e:
+            logger.error(f"Error loading decomposition summary: {e}")
+            self.db.rollback()
+            raise
         logger.info(
             "Decomposition summary loaded for all counties (total and fire PM2.5).")
 
@@ -1580,79 +1774,101 @@ class DataLoader:
             hr_csv_path = self.data_dir / "coef_poisson_bins_new.csv"
         if af_csv_path is None:
             af_csv_path = self.data_dir / "AF_smoke_causes_by age_formatted.csv"
-        # Clear table first
+        # Clear table first (same transaction as the reload, committed once at the end)
         self.db.query(FireAttributionBin).delete()
-        self.db.commit()
+        def nullable(series):
+            # NaN -> None so missing values are stored as NULL, not 'NaN'
+            return series.astype(object).where(series.notna(), None)
+
+        def parse_bins(bins, sep):
+            # Split "lower<sep>upper" bin labels into two float columns (NaN if unparsable)
+            parts = bins.str.split(sep, expand=True)
+            lower = pd.to_numeric(parts[0], errors='coerce')
+            upper = pd.to_numeric(parts[1], errors='coerce') if parts.shape[1] > 1 \
+                else pd.Series(np.nan, index=bins.index)
+            if parts.shape[1] > 2:
+                upper[parts.iloc[:, 2:].notna().any(axis=1)] = np.nan
+            return lower, upper
+
         # --- Load Bootstrapped Bin HRs ---
         logger.info(f"Loading Bootstrapped Bin HRs from {hr_csv_path}")
         hr_df = pd.read_csv(hr_csv_path)
-        hr_records = []
-        for _, row in hr_df.iterrows():
-            # Parse bin string like (0.1,0.25]
-            bin_str = row['bins'] if 'bins' in row else row['smokePM_bin']
-            bin_str = bin_str.strip('()[]')
-            try:
-                bin_lower, bin_upper = [float(x) for x in bin_str.split(',')]
-            except Exception as e:
-                logger.warning(f"Could not parse bin: {bin_str} ({e})")
-                continue
-            hr_records.append(FireAttributionBin(
-                method="bootstrapped_bin_hr",
-                bin_lower=bin_lower,
-                bin_upper=bin_upper,
-                age_group=str(row['age_group']),
-                cause=None,
-                coef=float(row['coef']),
-                af=None,
-                ci_low=None,
-                ci_up=None,
-                bootid=int(row['bootid']) if 'bootid' in row and not pd.isna(
-                    row['bootid']) else None
-            ))
-        self.db.bulk_save_objects(hr_records)
-        self.db.commit()
-        logger.info(f"Inserted {len(hr_records)} Bootstrapped Bin HR records.")
+        # Parse bin strings like (0.1,0.25] for the whole column
+        bin_str = hr_df['bins' if 'bins' in hr_df else 'smokePM_bin'].astype(str).str.strip('()[]')
+        bin_lower, bin_upper = parse_bins(bin_str, ',')
+        parsed = bin_lower.notna() & bin_upper.notna()
+        for bad in bin_str[~parsed].unique():
+            logger.warning(f"Could not parse bin: {bad}")
+        if 'bootid' in hr_df:
+            bootid = pd.to_numeric(hr_df['bootid']).astype('Int64')
+            bootid = nullable(bootid)
+        else:
+            bootid = None
+        hr_frame = pd.DataFrame({
+            'method': "bootstrapped_bin_hr",
+            'bin_lower': bin_lower,
+            'bin_upper': bin_upper,
+            'age_group': hr_df['age_group'].astype(str),
+            'coef': hr_df['coef'].astype(float),
+            'bootid': bootid,
+        })[parsed]
+        self._bulk_copy(FireAttributionBin, hr_frame)
+        logger.info(f"Inserted {len(hr_frame)} Bootstrapped Bin HR records.")
         # --- Load Precomputed Bin AFs ---
         logger.info(f"Loading Precomputed Bin AFs from {af_csv_path}")
         af_df = pd.read_csv(af_csv_path)
-        af_records = []
-        for _, row in af_df.iterrows():
-            # Parse bin string like 0.1-0.2 or 5+
-            bin_str = row['smokePM_bin']
-            if bin_str.endswith('+'):
-                try:
-                    bin_lower = float(bin_str[:-1])
-                    bin_upper = float('inf')
-                except Exception as e:
-                    logger.warning(
-                        f"Could not parse open-ended bin: {bin_str} ({e})")
-                    continue
-            else:
-                try:
-                    bin_lower, bin_upper = [float(x)
-                                            for x in bin_str.split('-')]
-                except Exception as e:
-                    logger.warning(f"Could not parse bin: {bin_str} ({e})")
-                    continue
-            af_records.append(FireAttributionBin(
-                method="precomputed_bin_af",
-                bin_lower=bin_lower,
-                bin_upper=bin_upper,
-                age_group=str(row['Age_group']),
-                cause=str(row['cause']),
-                coef=None,
-                af=float(row['AF']) / 100 if not pd.isna(row['AF']) else None,
-                ci_low=float(row['CI_LOW']) if not pd.isna(
-                    row['CI_LOW']) else None,
-                ci_up=float(row['CI_UP']) if not pd.isna(
-                    row['CI_UP']) else None,
-                bootid=None
-            ))
-        self.db.bulk_save_objects(af_records)
+        # Parse bin strings like 0.1-0.2 or 5+ (open-ended) for the whole column
+        bin_str = af_df['smokePM_bin'].astype(str)
+        open_ended = bin_str.str.endswith('+')
+        bin_lower, bin_upper = parse_bins(bin_str, '-')
+        bin_lower[open_ended] = pd.to_numeric(
+            bin_str[open_ended].str.slice(0, -1), errors='coerce')
+        bin_upper[open_ended] = np.inf
+        parsed = bin_lower.notna() & bin_upper.notna()
+        for bad in bin_str[~parsed & open_ended].unique():
+            logger.warning(f"Could not parse open-ended bin: {bad}")
+        for bad in bin_str[~parsed & ~open_ended].unique():
+            logger.warning(f"Could not parse bin: {bad}")
+        af_frame = pd.DataFrame({
+            'method': "precomputed_bin_af",
+            'bin_lower': bin_lower,
+            'bin_upper': bin_upper,
+            'age_group': af_df['Age_group'].astype(str),
+            'cause': af_df['cause'].astype(str),
+            'af': nullable(af_df['AF'].astype(float) / 100),
+            'ci_low': nullable(af_df['CI_LOW'].astype(float)),
+            'ci_up': nullable(af_df['CI_UP'].astype(float)),
+        })[parsed]
+        self._bulk_copy(FireAttributionBin, af_frame)
         self.db.commit()
-        logger.info(f"Inserted {len(af_records)} Precomputed Bin AF records.")
+        logger.info(f"Inserted {len(af_frame)} Precomputed Bin AF records.")
+        self.__dict__.pop('_fire_bins', None)
+        self._vacuum_analyze(FireAttributionBin.__tablename__)
         logger.info("Fire attribution bin loading complete.")
 
+    def _count_nan(self, model, fields, indexed: bool = False):
+        """NULL/NaN count per field of a model, from one scan of its table.
+        PostgreSQL sorts NaN as equal to itself, so NaN is matched with `= 'NaN'` rather than
+        `col <> col`; integer columns cannot hold NaN and are only checked for NULL.
+        indexed: the fields have matching partial indexes (see create_indexes),
+        so count each field separately and let PostgreSQL read only the NULL/NaN rows"""
+        def missing(field):
+            column = getattr(model, field)
+            if not isinstance(column.type, Float):
+                return column.is_(None)
+            return or_(column.is_(None), column == cast(literal_column("'NaN'"), column.type))
+
+        if indexed:
+            return {
+                field: self.db.query(func.count()).select_from(model).filter(missing(field)).scalar()
+                for field in fields
+            }
+        row = self.db.query(*[
+            func.coalesce(func.sum(case((missing(field), 1), else_=0)), 0).label(field)
+            for field in fields
+        ]).select_from(model).one()
+        return {field: getattr(row, field) for field in fields}
+
     def validate_data(self):
         """Validate loaded data"""
         logger.info("Validating loaded data...")
@@ -1692,11 +1908,7 @@ class DataLoader:
             logger.info("Checking for NaN/NA values...")
 
             # Population NaN/NA checks
-            pop_nan_checks = {
-                'population': self.db.query(Population).filter(
-                    Population.population != Population.population  # NaN != NaN is True
-                ).count()
-            }
+            pop_nan_checks = self._count_nan(Population, ['population'])
 
             for field, count in pop_nan_checks.items():
                 if count > 0:
@@ -1706,56 +1918,12 @@ class DataLoader:
                     logger.info(f"Population.{field}: No NaN values found")
 
             # Mortality NaN/NA checks (check all the key columns)
-            mortality_nan_checks = {
-                'total_excess': self.db.query(ExcessMortalitySummary).filter(
-                    ExcessMortalitySummary.total_excess != ExcessMortalitySummary.total_excess
-                ).count(),
-                'fire_excess': self.db.query(ExcessMortalitySummary).filter(
-                    ExcessMortalitySummary.fire_excess != ExcessMortalitySummary.fire_excess
-                ).count(),
-                'nonfire_excess': self.db.query(ExcessMortalitySummary).filter(
-                    ExcessMortalitySummary.nonfire_excess != ExcessMortalitySummary.nonfire_excess
-                ).count(),
-                'yll_total': self.db.query(ExcessMortalitySummary).filter(
-                    ExcessMortalitySummary.yll_total != ExcessMortalitySummary.yll_total
-                ).count(),
-                'yll_fire': self.db.query(ExcessMortalitySummary).filter(
-                    ExcessMortalitySummary.yll_fire != ExcessMortalitySummary.yll_fire
-                ).count(),
-                'yll_nonfire': self.db.query(ExcessMortalitySummary).filter(
-                    ExcessMortalitySummary.yll_nonfire != ExcessMortalitySummary.yll_nonfire
-                ).count()
-            }
-
-            # Check method-specific columns if they exist
-            try:
-                if hasattr(ExcessMortalitySummary, 'total_gemm'):
-                    mortality_nan_checks.update({
-                        'total_gemm': self.db.query(ExcessMortalitySummary).filter(
-                            ExcessMortalitySummary.total_gemm != ExcessMortalitySummary.total_gemm
-                        ).count(),
-                        'fire_gemm': self.db.query(ExcessMortalitySummary).filter(
-                            ExcessMortalitySummary.fire_gemm != ExcessMortalitySummary.fire_gemm
-                        ).count(),
-                        'nonfire_gemm': self.db.query(ExcessMortalitySummary).filter(
-                            ExcessMortalitySummary.nonfire_gemm != ExcessMortalitySummary.nonfire_gemm
-                        ).count(),
-                        'total_boot': self.db.query(ExcessMortalitySummary).filter(
-                            ExcessMortalitySummary.total_boot != ExcessMortalitySummary.total_boot
-                        ).count(),
-                        'fire_boot': self.db.query(ExcessMortalitySummary).filter(
-                            ExcessMortalitySummary.fire_boot != ExcessMortalitySummary.fire_boot
-                        ).count(),
-                        'total_prec': self.db.query(ExcessMortalitySummary).filter(
-                            ExcessMortalitySummary.total_prec != ExcessMortalitySummary.total_prec
-                        ).count(),
-                        'fire_prec': self.db.query(ExcessMortalitySummary).filter(
-                            ExcessMortalitySummary.fire_prec != ExcessMortalitySummary.fire_prec
-                        ).count()
-                    })
-            except Exception as e:
-                logger.info(
-                    f"Method-specific columns not found (expected if using old schema): {e}")
+            mortality_nan_checks = self._count_nan(ExcessMortalitySummary, [
+                'total_excess', 'fire_excess', 'nonfire_excess',
+                'yll_total', 'yll_fire', 'yll_nonfire',
+                'total_gemm', 'fire_gemm', 'nonfire_gemm',
+                'total_boot', 'fire_boot', 'total_prec', 'fire_prec',
+            ])
 
             for field, count in mortality_nan_checks.items():
                 if count > 0:
@@ -1768,39 +1936,16 @@ class DataLoader:
             # PM2.5 Summary NaN/NA checks
             summary_nan_checks = {}
 
-            # Yearly PM2.5 Summary checks
-            yearly_fields = ['avg_total', 'avg_fire', 'avg_nonfire', 'max_total', 'max_fire', 'max_nonfire',
-                             'pop_weighted_total', 'pop_weighted_fire', 'pop_weighted_nonfire']
-            for field in yearly_fields:
-                summary_nan_checks[f'YearlyPM25Summary.{field}'] = self.db.query(YearlyPM25Summary).filter(
-                    getattr(YearlyPM25Summary, field) != getattr(
-                        YearlyPM25Summary, field)
-                ).count()
-
-            # Monthly PM2.5 Summary checks
-            monthly_fields = ['avg_total', 'avg_fire', 'avg_nonfire', 'max_total', 'max_fire', 'max_nonfire',
+            # Yearly, monthly and seasonal PM2.5 Summary checks
+            summary_fields = ['avg_total', 'avg_fire', 'avg_nonfire', 'max_total', 'max_fire', 'max_nonfire',
                               'pop_weighted_total', 'pop_weighted_fire', 'pop_weighted_nonfire']
-            for field in monthly_fields:
-                summary_nan_checks[f'MonthlyPM25Summary.{field}'] = self.db.query(MonthlyPM25Summary).filter(
-                    getattr(MonthlyPM25Summary, field) != getattr(
-                        MonthlyPM25Summary, field)
-                ).count()
-
-            # Seasonal PM2.5 Summary checks
-            seasonal_fields = ['avg_total', 'avg_fire', 'avg_nonfire', 'max_total', 'max_fire', 'max_nonfire',
-                               'pop_weighted_total', 'pop_weighted_fire', 'pop_weighted_nonfire']
-            for field in seasonal_fields:
-                summary_nan_checks[f'SeasonalPM25Summary.{field}'] = self.db.query(SeasonalPM25Summary).filter(
-                    getattr(SeasonalPM25Summary, field) != getattr(
-                        SeasonalPM25Summary, field)
-                ).count()
+            for model in (YearlyPM25Summary, MonthlyPM25Summary, SeasonalPM25Summary):
+                for field, count in self._count_nan(model, summary_fields).items():
+                    summary_nan_checks[f'{model.__name__}.{field}'] = count
 
             # Daily PM2.5 checks too
-            daily_fields = ['total', 'fire', 'nonfire']
-            for field in daily_fields:
-                summary_nan_checks[f'DailyPM25.{field}'] = self.db.query(DailyPM25).filter(
-                    getattr(DailyPM25, field) != getattr(DailyPM25, field)
-                ).count()
+            for field, count in self._count_nan(DailyPM25, ['total', 'fire', 'nonfire'], indexed=True).items():
+                summary_nan_checks[f'DailyPM25.{field}'] = count
 
             for field, count in summary_nan_checks.items():
                 if count > 0:
@@ -1844,6 +1989,7 @@ def main():
 
             # Step 2: Load counties
             # loader.load_counties()
+            # loader.prepare_state_boundaries()
 
             # Step 3: Load population data (from API for 2009-2023)
             loader.load_population_data()
@@ -1,67 +1,135 @@
 from datetime import date
-from sqlalchemy import Column, Integer, Float, String, Boolean, Date, ForeignKey, UniqueConstraint, extract, func, Index
+from sqlalchemy import CHAR, Column, Computed, Enum, Integer, SmallInteger, Float, REAL, String, Boolean, Date, ForeignKey, UniqueConstraint, func, Index, case, cast, select
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship, column_property
-from sqlalchemy.ext.hybrid import hybrid_property
+from geoalchemy2 import Geometry
+from sqlalchemy.orm import relationship, column_property, synonym, deferred
 from .database import Base
 
+# County FIPS code: always 5 digits, kept as text for the leading zero. The "C"
+# collation makes key comparisons (btree lookups, joins, sorts) a plain byte
+# compare and lets LIKE '06%' prefix filters use the fips indexes.
+FIPS = CHAR(5, collation="C")
+
+# Meteorological season: a 4-byte PostgreSQL enum instead of free text. Declared
+# in calendar order, so ORDER BY season runs winter -> fall.
+SEASON = Enum('winter', 'spring', 'summer', 'fall', name='season')
+
+# EPA PM2.5 AQI breakpoints (pm_low, pm_high, aqi_low, aqi_high), as in src/utils/aqi.js
+AQI_BREAKPOINTS = [
+    (0.0, 9.0, 0, 50),
+    (9.1, 35.4, 51, 100),
+    (35.5, 55.4, 101, 150),
+    (55.5, 125.4, 151, 200),
+    (125.5, 225.4, 201, 300),
+    (225.5, 500.4, 301, 500),
+]
+
+def _aqi_sql(pm_column):
+    """Generated-column expression for the AQI of a PM2.5 column: the concentration is
+    truncated to 0.1 ug/m3 and interpolated within its breakpoint; NaN gives NULL"""
+    pm = f"trunc(greatest({pm_column}, 0)::numeric, 1)"
+    branches = " ".join(
+        f"WHEN {pm} <= {pm_high} THEN round(({aqi_high} - {aqi_low}) / ({pm_high} - {pm_low}) "
+        f"* ({pm} - {pm_low}) + {aqi_low})"
+        for pm_low, pm_high, aqi_low, aqi_high in AQI_BREAKPOINTS)
+    return f"(CASE WHEN {pm_column} = 'NaN' THEN NULL {branches} ELSE 500 END)::smallint"
+
 class County(Base):
     __tablename__ = "counties"
 
-    fips = Column(String, primary_key=True, index=True)
+    fips = Column(FIPS, primary_key=True, index=True)
     name = Column(String)
     index = Column(Integer, unique=True)
-    geometry = Column(JSONB)  # Store GeoJSON as JSONB
-
-    pm25_data = relationship("DailyPM25", back_populates="county")
-    populations = relationship("Population", back_populates="county")
-    yearly_summaries = relationship("YearlyPM25Summary", back_populates="county")
-    monthly_summaries = relationship("MonthlyPM25Summary", back_populates="county")
-    seasonal_summaries = relationship("SeasonalPM25Summary", back_populates="county")
-    baseline_mortality_rates = relationship("BaselineMortalityRate", back_populates="county")
-    cdc_baseline_mortality_rates = relationship("CDCBaselineMortalityRate", back_populates="county")
-    exceedance_summaries = relationship("ExceedanceSummary", back_populates="county")
-    decomposition_summaries = relationship("DecompositionSummary", back_populates="county")
+    # PostGIS MultiPolygon (WGS84) with a GiST index; deferred so loading County rows
+    # doesn't pull the polygons
+    geom = deferred(Column(Geometry('MULTIPOLYGON', srid=4326, spatial_index=True)))
+    # GeoJSON rendered by PostGIS, only when a query asks for it
+    geometry = column_property(cast(func.ST_AsGeoJSON(geom.expression), JSONB), deferred=True)
+
+    # Collections raise on lazy access (one SELECT per county); load them with
+    # selectinload/joinedload in the query that needs them
+    # The summary collections are read-only (views or tables rebuilt by DataLoader):
+    # viewonly, so the ORM keeps no change tracking or backref bookkeeping for them
+    pm25_data = relationship("DailyPM25", back_populates="county", lazy="raise")
+    populations = relationship("Population", back_populates="county", lazy="raise")
+    yearly_summaries = relationship("YearlyPM25Summary", viewonly=True, lazy="raise")
+    monthly_summaries = relationship("MonthlyPM25Summary", viewonly=True, lazy="raise")
+    seasonal_summaries = relationship("SeasonalPM25Summary", viewonly=True, lazy="raise")
+    baseline_mortality_rates = relationship("BaselineMortalityRate", back_populates="county", lazy="raise")
+    cdc_baseline_mortality_rates = relationship("CDCBaselineMortalityRate", back_populates="county", lazy="raise")
+    exceedance_summaries = relationship("ExceedanceSummary", viewonly=True, lazy="raise")
+    decomposition_summaries = relationship("DecompositionSummary", viewonly=True, lazy="raise")
 
 class DailyPM25(Base):
     __tablename__ = "daily_pm25"
     
-    id = Column(Integer, primary_key=True, index=True)
-    fips = Column(String, ForeignKey("counties.fips"), index=True, nullable=False)
+    # The primary key includes date, the partition key (required for a partitioned table)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    fips = Column(FIPS, ForeignKey("counties.fips"), index=True, nullable=False)
     county_index = Column(Integer, index=True, nullable=False)  # For easier county matching
-    date = Column(Date, index=True, nullable=False)
-    total = Column(Float, nullable=False)  # Total PM2.5
-    fire = Column(Float, nullable=False)    # Fire-related PM2.5
-    nonfire = Column(Float, nullable=False)  # Non-fire PM2.5
-    aqi = Column(Integer, nullable=True)  # Calculated AQI
+    date = Column(Date, primary_key=True, nullable=False)
+    # 4-byte REAL: the source CSV is read as float32, so double would only pad it
+    total = Column(REAL, nullable=False)  # Total PM2.5
+    fire = Column(REAL, nullable=False)    # Fire-related PM2.5
+    nonfire = Column(REAL, nullable=False)  # Non-fire PM2.5
+    # AQI of total, generated by PostgreSQL so it can never drift from the PM2.5 value
+    aqi = Column(SmallInteger, Computed(_aqi_sql("total"), persisted=True))
+    # Date parts stored as generated columns, so year/month filters use plain indexes
+    year = Column(SmallInteger, Computed("EXTRACT(year FROM date)::smallint", persisted=True))
+    month = Column(SmallInteger, Computed("EXTRACT(month FROM date)::smallint", persisted=True))
     
-    __table_args__ = (UniqueConstraint("fips", "date", name="_fips_date_uc"),)
+    __table_args__ = (
+        UniqueConstraint("fips", "date", name="_fips_date_uc"),
+        # Rows arrive in date order, so a BRIN index serves date ranges at a tiny fraction
+        # of a btree's size; point lookups use the (fips, date) constraint
+        Index('brin_daily_pm25_date', 'date', postgresql_using='brin',
+              postgresql_with={'pages_per_range': 32}),
+        # AQI range queries over a date window
+        Index('idx_daily_aqi_date', 'date', 'aqi'),
+        # One partition per calendar year (daily_pm25_yYYYY, created by DataLoader)
+        {'postgresql_partition_by': 'RANGE (date)'},
+    )
 
     county = relationship("County", back_populates="pm25_data")
 
+class StageDailyPM25(Base):
+    """UNLOGGED landing table for the daily PM2.5 CSV: chunks are COPYed here without WAL,
+    then moved into daily_pm25 in one INSERT ... SELECT (see DataLoader.load_pm25_data)"""
+    __tablename__ = "stage_daily_pm25"
+
+    fips = Column(FIPS, nullable=False)
+    county_index = Column(Integer, nullable=False)
+    date = Column(Date, nullable=False)
+    total = Column(REAL, nullable=False)
+    fire = Column(REAL, nullable=False)
+    nonfire = Column(REAL, nullable=False)
+
+    # No constraints or indexes to maintain during COPY; daily_pm25's (fips, date)
+    # constraint checks the rows when they are moved
+    __mapper_args__ = {'primary_key': [fips, date]}
+    __table_args__ = {'prefixes': ['UNLOGGED']}
+
 class AQSData(Base):
     __tablename__ = "aqs_data"
 
     id = Column(Integer, primary_key=True, index=True)
-    fips = Column(String, ForeignKey("counties.fips"), index=True, nullable=False)
+    fips = Column(FIPS, ForeignKey("counties.fips"), index=True, nullable=False)
     county_index = Column(Integer, index=True, nullable=True)
     date = Column(Date, index=True, nullable=False)
     average_pm = Column(Float, nullable=False)
-    aqi = Column(Integer, nullable=True)
+    aqi = Column(SmallInteger, Computed(_aqi_sql("average_pm"), persisted=True))
+    # Date parts stored as generated columns (indexable, no extract() per row)
+    year = Column(SmallInteger, Computed("EXTRACT(year FROM date)::smallint", persisted=True))
+    month = Column(SmallInteger, Computed("EXTRACT(month FROM date)::smallint", persisted=True))
+    day = Column(SmallInteger, Computed("EXTRACT(day FROM date)::smallint", persisted=True))
 
-    __table_args__ = (UniqueConstraint("fips", "date", name="_fips_date_uc_aqs"),)
+    __table_args__ = (
+        UniqueConstraint("fips", "date", name="_fips_date_uc_aqs"),
+        Index('idx_aqs_year_month', 'fips', 'year', 'month'),
+    )
 
     county = relationship("County")
 
-    # Hybrid properties for backward compatibility
-    @hybrid_property
-    def year(self):
-        return self.date.year if self.date else None
-
-    @year.expression
-    def year(cls):
-        return extract('year', cls.date)
-        
     # Alias properties for backward compatibility
     @property
     def pm25_value(self):
@@ -75,46 +143,32 @@ class AQSData(Base):
     def non_fire_pm25(self):
         return self.nonfire
 
-    @hybrid_property
-    def month(self):
-        return self.date.month if self.date else None
-
-    @month.expression
-    def month(cls):
-        return extract('month', cls.date)
-
-    @hybrid_property
-    def day(self):
-        return self.date.day if self.date else None
-
-    @day.expression
-    def day(cls):
-        return extract('day', cls.date)
-
 class Population(Base):
     __tablename__ = "population"
 
-    id = Column(Integer, primary_key=True)
-    fips = Column(String, ForeignKey("counties.fips"))
-    year = Column(Integer, index=True)
-    age_group = Column(Integer)
+    # Natural primary key; its btree serves the main (fips, year, age_group) lookup
+    fips = Column(FIPS, ForeignKey("counties.fips"), primary_key=True)
+    year = Column(Integer, primary_key=True)
+    age_group = Column(Integer, primary_key=True)
     population = Column(Integer)
 
     county = relationship("County", back_populates="populations")
 
     __table_args__ = (
-        UniqueConstraint("fips", "year", "age_group", name="_fips_year_age_uc"),
-        # Compound index for the main query pattern
-        Index('idx_population_fips_year_age', 'fips', 'year', 'age_group'),
         # Filtered index for non-zero age groups
         Index('idx_population_nonzero_age', 'age_group', 
               postgresql_where="age_group != 0"),
+        # Population is loaded year by year, so year ranges are served by BRIN
+        Index('brin_population_year', 'year', postgresql_using='brin'),
+        # Census API re-runs upsert population in place: free space on each page lets
+        # those UPDATEs be HOT (no new index entries). Applied by DataLoader.create_tables.
+        {'info': {'fillfactor': 90}},
     )
 
 class YearlyPM25Summary(Base):
     __tablename__ = "yearly_pm25_summary"
     
-    fips = Column(String, ForeignKey("counties.fips"), primary_key=True)
+    fips = Column(FIPS, ForeignKey("counties.fips"), primary_key=True)
     year = Column(Integer, primary_key=True)
     
     # Aggregated values
@@ -129,21 +183,26 @@ class YearlyPM25Summary(Base):
     # Metadata
     days_count = Column(Integer, nullable=False)  # for data quality checks
     
-    pop_weighted_total = Column(Float, nullable=True)
-    pop_weighted_fire = Column(Float, nullable=True)
-    pop_weighted_nonfire = Column(Float, nullable=True)
+    pop_weighted_total = Column(REAL, nullable=True)
+    pop_weighted_fire = Column(REAL, nullable=True)
+    pop_weighted_nonfire = Column(REAL, nullable=True)
     
-    county = relationship("County", back_populates="yearly_summaries")
+    county = relationship("County", viewonly=True)
 
     __table_args__ = (
         # Index for the lookup pattern in excess mortality calculation
-        Index('idx_yearly_pm25_fips_year', 'fips', 'year'),
+        # INCLUDE makes it covering, so the lookup runs as an index-only scan
+        Index('idx_yearly_pm25_fips_year', 'fips', 'year',
+              postgresql_include=['avg_total', 'avg_fire', 'avg_nonfire',
+                                  'pop_weighted_total', 'pop_weighted_fire', 'pop_weighted_nonfire']),
+        # Materialized view over daily_pm25 (created/refreshed by DataLoader, not create_all)
+        {'info': {'is_mv': True}},
     )
 
 class MonthlyPM25Summary(Base):
     __tablename__ = "monthly_pm25_summary"
     
-    fips = Column(String, ForeignKey("counties.fips"), primary_key=True)
+    fips = Column(FIPS, ForeignKey("counties.fips"), primary_key=True)
     year = Column(Integer, primary_key=True)
     month = Column(Integer, primary_key=True)
     
@@ -157,18 +216,21 @@ class MonthlyPM25Summary(Base):
 
     days_count = Column(Integer, nullable=False)
     
-    pop_weighted_total = Column(Float, nullable=True)
-    pop_weighted_fire = Column(Float, nullable=True)
-    pop_weighted_nonfire = Column(Float, nullable=True)
+    pop_weighted_total = Column(REAL, nullable=True)
+    pop_weighted_fire = Column(REAL, nullable=True)
+    pop_weighted_nonfire = Column(REAL, nullable=True)
     
-    county = relationship("County", back_populates="monthly_summaries")
+    county = relationship("County", viewonly=True)
+
+    # Materialized view over daily_pm25 (created/refreshed by DataLoader, not create_all)
+    __table_args__ = {'info': {'is_mv': True}}
 
 class SeasonalPM25Summary(Base):
     __tablename__ = "seasonal_pm25_summary"
     
-    fips = Column(String, ForeignKey("counties.fips"), primary_key=True)
+    fips = Column(FIPS, ForeignKey("counties.fips"), primary_key=True)
     year = Column(Integer, primary_key=True)
-    season = Column(String, primary_key=True)  # 'spring', 'summer', 'fall', 'winter'
+    season = Column(SEASON, primary_key=True)
     
     avg_total = Column(Float, nullable=False)
     avg_fire = Column(Float, nullable=False)
@@ -180,31 +242,48 @@ class SeasonalPM25Summary(Base):
 
     days_count = Column(Integer, nullable=False)
     
-    pop_weighted_total = Column(Float, nullable=True)
-    pop_weighted_fire = Column(Float, nullable=True)
-    pop_weighted_nonfire = Column(Float, nullable=True)
+    pop_weighted_total = Column(REAL, nullable=True)
+    pop_weighted_fire = Column(REAL, nullable=True)
+    pop_weighted_nonfire = Column(REAL, nullable=True)
     
-    county = relationship("County", back_populates="seasonal_summaries")
+    county = relationship("County", viewonly=True)
+
+    # Materialized view over daily_pm25 (created/refreshed by DataLoader, not create_all)
+    __table_args__ = {'info': {'is_mv': True}}
+
+class ExcessMortalitySettings(Base):
+    """Single-row settings for excess_mortality_summary (which method backs the legacy columns)"""
+    __tablename__ = "excess_mortality_settings"
+
+    id = Column(Integer, primary_key=True)
+    default_method = Column(String, nullable=False, default="gemm")  # 'gemm', 'boot' or 'prec'
+
+# Remaining life expectancy (years) by age group, for years of life lost
+LIFE_EXPECTANCY = {
+    1: 75.8, 2: 71.0, 3: 66.0, 4: 61.1, 5: 56.4, 6: 51.7,
+    7: 47.1, 8: 42.5, 9: 38.0, 10: 33.6, 11: 29.2, 12: 25.1,
+    13: 21.2, 14: 17.5, 15: 14.0, 16: 10.7, 17: 7.9, 18: 3.9
+}
+
+def _yll(excess, age_group):
+    """Years of life lost: excess deaths x remaining life expectancy (0 outside age groups 1-18)"""
+    return excess * case(LIFE_EXPECTANCY, value=age_group, else_=0.0)
+
+def _by_default_method(gemm, boot, prec):
+    """Pick the column of the configured default method (GEMM when unset)"""
+    method = select(ExcessMortalitySettings.default_method).limit(1).scalar_subquery()
+    return case((method == "boot", boot), (method == "prec", prec), else_=gemm)
 
 class ExcessMortalitySummary(Base):
     __tablename__ = "excess_mortality_summary"
 
     id = Column(Integer, primary_key=True)
-    fips = Column(String, ForeignKey("counties.fips"))
+    fips = Column(FIPS, ForeignKey("counties.fips"))
 
     year = Column(Integer)
     age_group = Column(Integer)
-    
-    # Keep existing columns as "default" method (GEMM)
-    total_excess = Column(Float)
-    fire_excess = Column(Float)
-    nonfire_excess = Column(Float)
     population = Column(Integer)
 
-    yll_total = Column(Float)
-    yll_fire = Column(Float)
-    yll_nonfire = Column(Float)
-    
     # method-specific columns
     total_gemm = Column(Float)
     fire_gemm = Column(Float)
@@ -216,16 +295,25 @@ class ExcessMortalitySummary(Base):
     total_prec = Column(Float)
     fire_prec = Column(Float)
     
-    # YLL for each method
-    yll_total_gemm = Column(Float)
-    yll_fire_gemm = Column(Float)
-    yll_nonfire_gemm = Column(Float)
+    # YLL for each method, derived from the excess deaths rather than stored
+    yll_total_gemm = column_property(_yll(total_gemm, age_group), deferred=True)
+    yll_fire_gemm = column_property(_yll(fire_gemm, age_group), deferred=True)
+    yll_nonfire_gemm = column_property(_yll(nonfire_gemm, age_group), deferred=True)
     
-    yll_total_boot = Column(Float)
-    yll_fire_boot = Column(Float)
+    yll_total_boot = column_property(_yll(total_boot, age_group), deferred=True)
+    yll_fire_boot = column_property(_yll(fire_boot, age_group), deferred=True)
     
-    yll_total_prec = Column(Float)
-    yll_fire_prec = Column(Float)
+    yll_total_prec = column_property(_yll(total_prec, age_group), deferred=True)
+    yll_fire_prec = column_property(_yll(fire_prec, age_group), deferred=True)
+
+    # Legacy "default" method columns, resolved from excess_mortality_settings at query
+    # time so switching method is a one-row update (nonfire is GEMM for every method)
+    total_excess = column_property(_by_default_method(total_gemm, total_boot, total_prec))
+    fire_excess = column_property(_by_default_method(fire_gemm, fire_boot, fire_prec))
+    nonfire_excess = synonym("nonfire_gemm")
+    yll_total = column_property(_yll(_by_default_method(total_gemm, total_boot, total_prec), age_group), deferred=True)
+    yll_fire = column_property(_yll(_by_default_method(fire_gemm, fire_boot, fire_prec), age_group), deferred=True)
+    yll_nonfire = synonym("yll_nonfire_gemm")
 
     __table_args__ = (
         UniqueConstraint("fips", "year", "age_group", name="_fips_year_agegroup_uc"),
@@ -237,62 +325,56 @@ class ExcessMortalitySummary(Base):
 class BaselineMortalityRate(Base):
     __tablename__ = "baseline_mortality_rate"
 
-    id = Column(Integer, primary_key=True)
-    fips = Column(String, ForeignKey("counties.fips"), index=True)
+    # Natural primary key (fips, year, age_group, stat_type, source)
+    fips = Column(FIPS, ForeignKey("counties.fips"), primary_key=True)
     county_index = Column(Integer, index=True)
 
-    year = Column(Integer, index=True)
-    age_group = Column(Integer)
-    stat_type = Column(String)  # '1: mean', '2: upper', '3: lower'
+    year = Column(Integer, primary_key=True, index=True)
+    age_group = Column(Integer, primary_key=True)
+    stat_type = Column(SmallInteger, primary_key=True)  # 1: mean, 2: upper, 3: lower
     value = Column(Float)
-    source = Column(String)
+    source = Column(String, primary_key=True)
     allage_flag = Column(Boolean)
 
     county = relationship("County", back_populates="baseline_mortality_rates")
 
     __table_args__ = (
-        UniqueConstraint("fips", "year", "age_group", "stat_type", "source", name="_unique_mortality_entry"),
         # Compound index for the filtered query we use
         Index('idx_baseline_mortality_filtered_lookup', 'fips', 'year', 'age_group', 
-              postgresql_where="source = 'basemor_ALL' AND stat_type = '1' AND allage_flag = false"),
+              postgresql_include=['value'],
+              postgresql_where="source = 'basemor_ALL' AND stat_type = 1 AND allage_flag = false"),
         # Index for the preloading filter
         Index('idx_baseline_mortality_preload_filter', 'source', 'stat_type', 'allage_flag',
-              postgresql_where="source = 'basemor_ALL' AND stat_type = '1' AND allage_flag = false"),
+              postgresql_where="source = 'basemor_ALL' AND stat_type = 1 AND allage_flag = false"),
     )
 
 class CDCBaselineMortalityRate(Base):
     __tablename__ = "cdc_baseline_mortality_rate"
 
-    id = Column(Integer, primary_key=True)
-    fips = Column(String, ForeignKey("counties.fips"), index=True)
+    # Natural primary key (fips, year, age_group, source)
+    fips = Column(FIPS, ForeignKey("counties.fips"), primary_key=True)
     county_index = Column(Integer, index=True)
 
-    year = Column(Integer, index=True)
-    age_group = Column(Integer)
+    year = Column(Integer, primary_key=True, index=True)
+    age_group = Column(Integer, primary_key=True)
     value = Column(Float)
-    source = Column(String)
+    source = Column(String, primary_key=True)
 
     county = relationship("County", back_populates="cdc_baseline_mortality_rates")
 
-    __table_args__ = (
-        UniqueConstraint("fips", "year", "age_group", "source", name="cdc_unique_mortality_entry"),
-    )
-
 class ExceedanceSummary(Base):
     """Stores exceedance summary for a county."""
     __tablename__ = "exceedance_summary"
 
-    id = Column(Integer, primary_key=True)
-    fips = Column(String, ForeignKey("counties.fips"), index=True, nullable=False)
+    # One row per county: FIPS is the natural primary key
+    fips = Column(FIPS, ForeignKey("counties.fips"), primary_key=True)
     county_index = Column(Integer, index=True, nullable=False)
 
+    # Tier categories (0-4) from the regulatory analysis, not day counts, so they
+    # cannot be derived from daily_pm25
     threshold_9 = Column(Integer, nullable=True)  # Exceeding 9 ug/m3
     threshold_8 = Column(Integer, nullable=True)  # Exceeding 8 ug/m3
 
-    county = relationship("County", back_populates="exceedance_summaries")
-
-    __table_args__ = (UniqueConstraint("fips", name="uq_exceedance_fips"),)
-
     def __repr__(self):
         return (
             f"<ExceedanceSummary(fips={self.fips}, county_index={self.county_index}, "
@@ -303,7 +385,7 @@ class DecompositionSummary(Base):
     __tablename__ = "decomposition_summary"
 
     id = Column(Integer, primary_key=True)
-    fips = Column(String, ForeignKey("counties.fips"), index=True)
+    fips = Column(FIPS, ForeignKey("counties.fips"), index=True)
     start_year = Column(Integer, index=True)
     end_year = Column(Integer, index=True)
     age_group = Column(Integer, nullable=True)  # Optional: null means all ages
@@ -314,8 +396,6 @@ class DecompositionSummary(Base):
     exposure_change = Column(Float, nullable=False)
     total_change = Column(Float, nullable=False)
 
-    county = relationship("County", back_populates="decomposition_summaries")
-
     __table_args__ = (
         UniqueConstraint("fips", "start_year", "end_year", "age_group", name="_unique_decomp_entry"),
     )
@@ -336,11 +416,12 @@ class FireAttributionBin(Base):
     bootid = Column(Integer, nullable=True)  # Only for HR method (bootstrap replicate)
 
     __table_args__ = (
-        # Keep current index
-        Index('ix_fire_attribution_bin_method_age_bin_bootid', 'method', 'age_group', 'bin_lower', 'bin_upper', 'bootid'),
-        # Separate indexes for each method type
+        # One covering partial index per method type; together they replace the
+        # broad (method, age_group, bin_lower, bin_upper, bootid) index
         Index('idx_fire_bootstrap_lookup', 'age_group', 'bin_lower', 'bin_upper', 'bootid',
+              postgresql_include=['coef'],
               postgresql_where="method = 'bootstrapped_bin_hr'"),
         Index('idx_fire_precomputed_lookup', 'age_group', 'bin_lower', 'bin_upper',
+              postgresql_include=['af', 'ci_low', 'ci_up'],
               postgresql_where="method = 'precomputed_bin_af' AND cause = 'Nonaccidental'"),
-    )
\ No newline at end of file
+    )
@@ -0,0 +1,4 @@
+import os
+
+# db.database builds its engine at import time; no connection is opened by these tests
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/us_wildfires_test")
@@ -0,0 +1,39 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import app as app_module
+
+
+@pytest.fixture
+def client():
+    # Season validation happens before any query, so no database is needed
+    app_module.app.dependency_overrides[app_module.get_db] = lambda: None
+    yield TestClient(app_module.app)
+    app_module.app.dependency_overrides.clear()
+
+
+def test_statistics_rejects_unknown_season(client):
+    response = client.get("/api/counties/statistics",
+                          params={"time_scale": "seasonal", "year": 2020, "season": "autumn"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Season must be winter, spring, summer, or fall"
+
+
+def test_format_decimal_column_matches_fstring_output():
+    values = [1.005, 12.3456, None, float("nan"), 0.0]
+    assert list(app_module.format_decimal_column(values)) == ["1.00", "12.35", "", "nan", "0.00"]
+
+
+def test_stream_csv_always_quotes_county_names():
+    rows = [
+        ("06037", app_module.quote_csv_field("Los Angeles"), "2020"),
+        ("51600", app_module.quote_csv_field("Fairfax, city"), "2020"),
+        ("99999", app_module.quote_csv_field(None), ""),
+    ]
+    text = "".join(app_module.stream_csv(["County_FIPS", "County_Name", "Year"], rows, flush_every=2))
+    assert text == (
+        "County_FIPS,County_Name,Year\n"
+        '06037,"Los Angeles",2020\n'
+        '51600,"Fairfax, city",2020\n'
+        '99999,"",\n'
+    )
@@ -0,0 +1,20 @@
+from db.export_data import export_columns
+from db.models import ExcessMortalitySummary
+
+
+def test_excess_mortality_export_header_includes_derived_columns():
+    columns = export_columns(ExcessMortalitySummary)
+
+    # Stored columns first, in table order
+    stored = ExcessMortalitySummary.__table__.columns.keys()
+    assert columns[:len(stored)] == stored
+
+    # Legacy default-method columns and every YLL value are derived, not stored
+    derived = [
+        'yll_total_gemm', 'yll_fire_gemm', 'yll_nonfire_gemm',
+        'yll_total_boot', 'yll_fire_boot',
+        'yll_total_prec', 'yll_fire_prec',
+        'total_excess', 'fire_excess', 'nonfire_excess',
+        'yll_total', 'yll_fire', 'yll_nonfire',
+    ]
+    assert columns[len(stored):] == derived
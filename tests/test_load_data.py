@@ -0,0 +1,206 @@
+import math
+
+import numpy as np
+import pytest
+
+from db.load_data import (
+    GEMM_ALPHA, GEMM_MU, GEMM_NU,
+    bootstrap_af, decompose, find_bins, gemm_excess, gemm_log_shape, load_fire_bins,
+)
+
+# Scalar formulas of the per-row loaders these kernels replaced
+THETA = {age: theta for age, theta in zip(range(1, 19), [
+    0.1430, 0.1430, 0.1430, 0.1430, 0.1430, 0.1585, 0.1577, 0.1570, 0.1558,
+    0.1532, 0.1499, 0.1462, 0.1421, 0.1374, 0.1319, 0.1253, 0.1141, 0.1141])}
+
+
+def scalar_omega(z):
+    return 1 / (1 + np.exp(-(z - GEMM_MU) / GEMM_NU))
+
+
+def scalar_cached_omega(z):
+    # excess_mortality_summary looked omega up at round(z) within 0..200
+    z_rounded = round(z)
+    if 0 <= z_rounded <= 200:
+        return scalar_omega(float(z_rounded))
+    return scalar_omega(z)
+
+
+def scalar_af(z, age_group, omega=scalar_omega):
+    if age_group < 6:
+        return 0.0
+    hr = np.exp(THETA[age_group] * np.log(1 + z / GEMM_ALPHA) * omega(z))
+    if not np.isfinite(hr) or hr == 0:
+        return 0.0
+    return 1 - 1 / hr
+
+
+def scalar_decompose(pop_start, pop_end, y0_start, y0_end, AF_start, AF_end):
+    total_pop_start = pop_start.sum()
+    total_pop_end = pop_end.sum()
+    pop_A = pop_start / total_pop_start * total_pop_end
+    A = (pop_A * y0_start * AF_start).sum()
+    B = (pop_end * y0_start * AF_start).sum()
+    C = (pop_end * y0_end * AF_start).sum()
+    D = (pop_end * y0_end * AF_end).sum()
+    total_burden_start = (pop_start * y0_start * AF_start).sum()
+    total_change = D - total_burden_start
+    pop_growth = (A - total_burden_start) / total_change * 100 if total_change != 0 else 0
+    ageing = (B - A) / total_change * 100 if total_change != 0 else 0
+    mortality = (C - B) / total_change * 100 if total_change != 0 else 0
+    exposure = (D - C) / total_change * 100 if total_change != 0 else 0
+    total_change = total_change / total_burden_start * 100 if total_burden_start != 0 else 0
+    return pop_growth, ageing, mortality, exposure, total_change
+
+
+Z_GRID = np.array([0.0, 0.3, 1.0, 2.4, 7.65, 15.5, 35.2, 120.7, 199.5, 200.0, 250.0])
+AGES = np.arange(1, 19)
+
+
+def gemm_grid(base):
+    z = np.repeat(Z_GRID, len(AGES))
+    age = np.tile(AGES, len(Z_GRID))
+    theta = np.array([THETA[a] for a in age])
+    return z, age, gemm_excess(np.full(len(z), base), gemm_log_shape(z), theta, age >= 6)
+
+
+def test_gemm_excess_matches_scalar_formula():
+    z, age, excess = gemm_grid(base=1000.0)
+    expected = [1000.0 * scalar_af(zi, ai) for zi, ai in zip(z, age)]
+    # omega is interpolated between integer nodes; the error is far below 1e-4
+    np.testing.assert_allclose(excess, expected, rtol=1e-4, atol=1e-12)
+
+
+def test_gemm_excess_matches_cached_omega_at_integer_z():
+    z = np.repeat(np.arange(0.0, 201.0, 7.0), len(AGES))
+    age = np.tile(AGES, len(z) // len(AGES))
+    theta = np.array([THETA[a] for a in age])
+    excess = gemm_excess(np.ones(len(z)), gemm_log_shape(z), theta, age >= 6)
+    expected = [scalar_af(zi, ai, omega=scalar_cached_omega) for zi, ai in zip(z, age)]
+    np.testing.assert_allclose(excess, expected, rtol=1e-12, atol=1e-15)
+
+
+def test_gemm_excess_is_zero_at_zero_exposure_and_population():
+    z, _, excess = gemm_grid(base=1000.0)
+    assert np.all(excess[z == 0] == 0.0)
+    _, _, excess = gemm_grid(base=0.0)
+    assert np.all(excess == 0.0)
+
+
+def test_decompose_matches_scalar_formula():
+    rng = np.random.default_rng(2006)
+    n_counties, n_age = 5, 18
+    pop_start = rng.uniform(100, 5000, (n_counties, n_age))
+    pop_end = rng.uniform(100, 5000, (n_counties, n_age))
+    y0_start = rng.uniform(1e-4, 1e-1, (n_counties, n_age))
+    y0_end = rng.uniform(1e-4, 1e-1, (n_counties, n_age))
+    pm_start = rng.uniform(3, 15, n_counties)
+    pm_end = rng.uniform(3, 15, n_counties)
+    AF_start = np.array([[scalar_af(max(0, pm - 2.4), a) for a in AGES] for pm in pm_start])
+    AF_end = np.array([[scalar_af(max(0, pm - 2.4), a) for a in AGES] for pm in pm_end])
+
+    # County 1: age groups 3 and 10 absent (zeroed for the kernel, dropped by the scalar loop)
+    absent = np.zeros(n_age, dtype=bool)
+    absent[[2, 9]] = True
+    for arr in (pop_start, pop_end, y0_start, y0_end, AF_start, AF_end):
+        arr[1, absent] = 0.0
+    # County 2: one age group with zero population in both years
+    pop_start[2, 7] = pop_end[2, 7] = 0.0
+    # County 3: zero population in the start year
+    pop_start[3] = 0.0
+    # County 4: no exposure (z = 0 in both years), so no change at all
+    AF_start[4] = AF_end[4] = 0.0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        results = np.array(decompose(pop_start, pop_end, y0_start, y0_end, AF_start, AF_end))
+        for county in range(n_counties):
+            keep = ~absent if county == 1 else slice(None)
+            expected = scalar_decompose(*(arr[county, keep] for arr in (
+                pop_start, pop_end, y0_start, y0_end, AF_start, AF_end)))
+            np.testing.assert_allclose(results[:, county], expected, rtol=1e-9, equal_nan=True)
+
+    assert np.all(results[:, 4] == 0.0)
+
+
+def test_find_bins_matches_linear_scan():
+    # [10, 20) is missing, so values there have no bin
+    lowers = np.array([0.0, 1.0, 5.0, 20.0])
+    uppers = np.array([1.0, 5.0, 10.0, 50.0])
+    values = np.array([-1.0, 0.0, 0.5, 1.0, 4.999, 5.0, 9.99, 10.0, 15.0, 20.0, 49.9, 50.0, 100.0, np.nan])
+
+    expected = []
+    for value in values:
+        match = -1
+        for i, (bl, bu) in enumerate(zip(lowers, uppers)):
+            if bl <= value < bu:
+                match = i
+                break
+        expected.append(match)
+
+    np.testing.assert_array_equal(find_bins(values, lowers, uppers), expected)
+
+
+def test_bootstrap_af_matches_scalar_mean():
+    rng = np.random.default_rng(500)
+    coef = rng.normal(0.01, 0.005, (2, 3, 500)).astype(np.float32)
+    coef[0, 1, ::7] = np.nan  # some replicates missing
+    coef[1, 2] = np.nan       # bin with no replicates
+
+    boot_af, present = bootstrap_af(coef)
+
+    for age_idx in range(2):
+        for bin_idx in range(3):
+            values = []
+            for bootid in range(1, 501):
+                c = coef[age_idx, bin_idx, bootid - 1]
+                if np.isnan(c):
+                    values.append(0.0)
+                else:
+                    rr = math.exp(float(c))
+                    values.append((rr - 1) / rr)
+            assert boot_af[age_idx, bin_idx] == pytest.approx(sum(values) / len(values), rel=1e-9)
+    np.testing.assert_array_equal(present, [[True, True, True], [True, True, False]])
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeSession:
+    """Answers load_fire_bins' two queries in order: bootstrap rows, then precomputed rows."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+
+    def execute(self, statement):
+        return FakeResult(self.results.pop(0))
+
+
+def test_load_fire_bins_places_coefficients_by_age_bin_and_bootid():
+    boot_rows = [
+        ("under_65", 5.0, 10.0, 2, 0.02),
+        ("65_and_up", 0.0, 5.0, 1, 0.03),
+        ("under_65", 0.0, 5.0, 500, 0.01),
+    ]
+    prec_rows = [
+        ("0 to 64", 5.0, 10.0, 0.2),
+        ("0 to 64", 0.0, 5.0, 0.1),
+    ]
+    boot_ages, lowers, uppers, coef, prec_bins = load_fire_bins(FakeSession(boot_rows, prec_rows))
+
+    assert list(boot_ages) == ["65_and_up", "under_65"]
+    np.testing.assert_array_equal(lowers, [0.0, 5.0])
+    np.testing.assert_array_equal(uppers, [5.0, 10.0])
+    assert coef.shape == (2, 2, 500)
+    assert coef[1, 1, 1] == pytest.approx(0.02)
+    assert coef[0, 0, 0] == pytest.approx(0.03)
+    assert coef[1, 0, 499] == pytest.approx(0.01)
+    assert np.count_nonzero(~np.isnan(coef)) == 3
+
+    prec_lowers, prec_uppers, af = prec_bins["0 to 64"]
+    np.testing.assert_array_equal(prec_lowers, [0.0, 5.0])
+    np.testing.assert_array_equal(af, [0.1, 0.2])